@@ -1,15 +1,20 @@
-import json
+import logging
 
 from flask import Flask
 from flask_cors import CORS
-
 from flask_injector import FlaskInjector
+from injector import Injector
+from sqlalchemy.exc import SQLAlchemyError
 
 import backend.models
 from backend.extensions import db, api, jwt
-from backend.helpers import ErrorHandlerConfigurator, Logger, UUIDJSONEncoder, CloudinaryUploader
+from backend.helpers import ErrorHandlerConfigurator, Logger, UUIDJSONEncoder, CloudinaryUploader, JSONBackendFactory
 from backend.routes.api_router import APIRouter
+from backend.commands import CommandRegistrar
 from backend.di import DIConfig
+from backend.service import RecipeService
+
+logger = logging.getLogger('backend_logger')
 
 
 class AppFactory:
@@ -17,19 +22,21 @@ class AppFactory:
     Factory class for configuring and creating the Flask application.
 
     Responsibilities:
-        - Configure JSON encoding (UUID support)
+        - Configure JSON encoding (UUID/datetime support, orjson when available)
         - Setup logging
         - Register error handlers
         - Initialize extensions
         - Initialize services, DI, and API namespaces
+        - Build the in-memory ingredient index
         - Enable CORS
+        - Register CLI commands
     """
     @staticmethod
     def _configure_json_encoding(app: Flask) -> None:
         app.json_encoder = UUIDJSONEncoder
+        json_backend = JSONBackendFactory.create(app.config.get('JSON_BACKEND', 'auto'))
         api.representations['application/json'] = lambda data, code, headers=None: \
-            app.make_response((json.dumps(data, cls=UUIDJSONEncoder, ensure_ascii=False) + '\n',
-                               code, headers))
+            app.make_response((json_backend.dumps(data), code, headers))
 
     @staticmethod
     def _configure_logger(app: Flask) -> None:
@@ -45,11 +52,31 @@ class AppFactory:
             init(app)
 
     @staticmethod
-    def _configure_services(app: Flask) -> None:
+    def _configure_services(app: Flask) -> Injector:
         CloudinaryUploader.init_cloudinary(app)
         APIRouter.register_namespaces(api)
-        FlaskInjector(app=app, modules=[DIConfig.configure_repository, DIConfig.configure_services])
+        flask_injector = FlaskInjector(app=app, modules=[DIConfig.configure_repository, DIConfig.configure_indexes,
+                                                         DIConfig.configure_services])
         CORS(app, resources={r'/api/*': {'origins': app.config['CORS_ORIGINS']}})
+        return flask_injector.injector
+
+    @staticmethod
+    def _build_indexes(app: Flask, injector: Injector) -> None:
+        if not app.config.get('INGREDIENT_INDEX_BUILD_ON_STARTUP', True):
+            return
+
+        with app.app_context():
+            try:
+                injector.get(RecipeService).build_ingredient_index()
+            except SQLAlchemyError as error:
+                # e.g. CLI commands run before migrations; the first ingredient query builds it instead
+                logger.warning(f'Ingredient index not built at startup: {error}')
+            finally:
+                db.session.remove()
+
+    @staticmethod
+    def _configure_commands(app: Flask) -> None:
+        CommandRegistrar.register_commands(app)
 
     @staticmethod
     def create_app(app: Flask, extensions: list, config_class) -> Flask:
@@ -57,8 +84,10 @@ class AppFactory:
 
         AppFactory._configure_extensions(app, extensions)
         AppFactory._configure_json_encoding(app)
-        AppFactory._configure_services(app)
+        injector = AppFactory._configure_services(app)
         AppFactory._configure_error_handlers(api)
         AppFactory._configure_logger(app)
+        AppFactory._configure_commands(app)
+        AppFactory._build_indexes(app, injector)
 
         return app
\ No newline at end of file
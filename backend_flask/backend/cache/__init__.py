@@ -0,0 +1,2 @@
+from .recipe_list_cache import RecipeListCache
+from .trending_recipe_cache import TrendingRecipeCache
@@ -0,0 +1,161 @@
+import hashlib
+import json
+from typing import Iterable, Optional
+
+from redis import RedisError
+
+from backend.cache.redis_cache import RedisCache
+
+
+class RecipeListCache(RedisCache):
+    """
+    Redis cache of serialized recipe list pages keyed by the normalized filter.
+
+    Every entry is registered in a tag set, and writes invalidate only the tags of the
+    recipes they touch:
+        - author:<id> for lists filtered by author,
+        - category:<id> / ingredient:<id> for lists filtered by those ids,
+        - all for lists without any id filter.
+
+    A list gets the most selective tag that every recipe in it must carry, so a change
+    to a recipe always reaches the lists that could contain it. Invalidation runs after
+    the write is committed; entries also expire after RECIPE_LIST_CACHE_TTL seconds,
+    which bounds the window of a reader caching a page it loaded just before the commit.
+
+    The cache fails open: Redis errors are logged, the request falls through to the
+    database and Redis is not retried for a few seconds. TTL 0 disables the cache.
+    """
+    NAME = 'Recipe list cache'
+    TTL_CONFIG_KEY = 'RECIPE_LIST_CACHE_TTL'
+    PREFIX = 'recipes:list'
+
+    @staticmethod
+    def build_key(filters: dict) -> str:
+        normalized = {
+            'user_id': str(filters['user_id']) if filters.get('user_id') else None,
+            'category_ids': sorted({str(value) for value in filters.get('category_ids') or []}),
+            'ingredient_ids': sorted({str(value) for value in filters.get('ingredient_ids') or []}),
+            'mode': filters.get('mode', 'or') if filters.get('ingredient_ids') else None,
+            'q': filters.get('q'),
+            'sort': filters.get('sort'),
+            'facets': sorted(filters.get('facets') or []),
+            'page': None if filters.get('cursor') else int(filters.get('page', 1)),
+            'cursor': filters.get('cursor'),
+            'per_page': int(filters.get('per_page', 24)),
+            'with_total': filters.get('with_total', True),
+            'fieldset': sorted(filters['fieldset']) if filters.get('fieldset') else None,
+        }
+        digest = hashlib.sha1(json.dumps(normalized, sort_keys=True).encode('utf-8')).hexdigest()
+
+        return f'{RecipeListCache.PREFIX}:{digest}'
+
+    @staticmethod
+    def tags_for_filters(filters: dict) -> set:
+        if filters.get('user_id'):
+            return {f'author:{filters["user_id"]}'}
+        if filters.get('category_ids'):
+            return {f'category:{value}' for value in filters['category_ids']}
+        if filters.get('ingredient_ids'):
+            return {f'ingredient:{value}' for value in filters['ingredient_ids']}
+
+        return {'all'}
+
+    @staticmethod
+    def tags_for_recipe(recipe) -> set:
+        if recipe is None:
+            return set()
+
+        return RecipeListCache.tags_for_ids(
+            recipe.author_id,
+            [rc.category_id for rc in recipe.recipe_categories],
+            [ri.ingredient_id for ri in recipe.recipe_ingredients],
+        )
+
+    @staticmethod
+    def tags_for_ids(author_id, category_ids, ingredient_ids) -> set:
+        return RecipeListCache.tags_for_references([author_id], category_ids, ingredient_ids)
+
+    @staticmethod
+    def tags_for_references(author_ids, category_ids, ingredient_ids) -> set:
+        """Tags of every list that can show a recipe by one of the authors, categories or ingredients."""
+        return (
+            {'all'}
+            | {f'author:{author_id}' for author_id in author_ids}
+            | {f'category:{category_id}' for category_id in category_ids}
+            | {f'ingredient:{ingredient_id}' for ingredient_id in ingredient_ids}
+        )
+
+    def get(self, filters: dict) -> Optional[dict]:
+        client = self._redis()
+        if client is None:
+            return None
+
+        try:
+            cached, _ = client.pipeline(transaction=False).get(self.build_key(filters)) \
+                .incr(f'{self.PREFIX}:stats:lookups').execute()
+        except RedisError as error:
+            self._fail(error)
+            return None
+
+        return json.loads(cached) if cached is not None else None
+
+    def set(self, filters: dict, value: dict) -> None:
+        client = self._redis()
+        if client is None:
+            return
+
+        ttl = self._ttl()
+        key = self.build_key(filters)
+        try:
+            pipeline = client.pipeline(transaction=False)
+            pipeline.set(key, json.dumps(value, default=str), ex=ttl)
+            for tag in self.tags_for_filters(filters):
+                pipeline.sadd(f'{self.PREFIX}:tag:{tag}', key)
+                pipeline.expire(f'{self.PREFIX}:tag:{tag}', ttl)
+            pipeline.incr(f'{self.PREFIX}:stats:misses')
+            pipeline.execute()
+        except RedisError as error:
+            self._fail(error)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        client = self._redis()
+        tag_keys = [f'{self.PREFIX}:tag:{tag}' for tag in set(tags)]
+        if client is None or not tag_keys:
+            return
+
+        try:
+            pipeline = client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipeline.smembers(tag_key)
+            keys = set().union(*pipeline.execute())
+
+            pipeline = client.pipeline(transaction=False)
+            if keys:
+                pipeline.delete(*keys)
+            pipeline.delete(*tag_keys)
+            pipeline.execute()
+        except RedisError as error:
+            self._fail(error)
+
+    def stats(self) -> dict:
+        """Hit/miss counters shared by all workers. Misses are counted when a freshly loaded page is stored."""
+        client = self._redis()
+        if client is None:
+            return {'enabled': False, 'lookups': 0, 'hits': 0, 'misses': 0, 'hitRatio': None}
+
+        try:
+            lookups, misses = client.mget(f'{self.PREFIX}:stats:lookups', f'{self.PREFIX}:stats:misses')
+        except RedisError as error:
+            self._fail(error)
+            return {'enabled': False, 'lookups': 0, 'hits': 0, 'misses': 0, 'hitRatio': None}
+
+        lookups, misses = int(lookups or 0), int(misses or 0)
+        hits = max(lookups - misses, 0)
+
+        return {
+            'enabled': True,
+            'lookups': lookups,
+            'hits': hits,
+            'misses': misses,
+            'hitRatio': round(hits / lookups, 4) if lookups else None,
+        }
@@ -0,0 +1,46 @@
+import logging
+from time import monotonic
+from typing import Optional
+
+from flask import current_app
+from redis import Redis, RedisError
+
+logger = logging.getLogger('backend_logger')
+
+
+class RedisCache:
+    """
+    Lazily connected Redis client shared by the caches, failing open.
+
+    Subclasses name the config key holding their TTL; a TTL of 0 disables the cache.
+    After a Redis error the cache logs it and stays disabled for RETRY_AFTER_SECONDS,
+    so requests fall through to the database instead of waiting on timeouts.
+    """
+    NAME = 'Redis cache'
+    TTL_CONFIG_KEY: str
+    RETRY_AFTER_SECONDS = 5
+
+    def __init__(self):
+        self._client: Optional[Redis] = None
+        self._unavailable_until = 0.0
+
+    @classmethod
+    def _ttl(cls) -> int:
+        return current_app.config.get(cls.TTL_CONFIG_KEY, 0)
+
+    def _redis(self) -> Optional[Redis]:
+        if self._ttl() <= 0 or monotonic() < self._unavailable_until:
+            return None
+
+        if self._client is None:
+            self._client = Redis.from_url(
+                current_app.config['REDIS_URL'],
+                socket_timeout=0.2,
+                socket_connect_timeout=0.2,
+            )
+
+        return self._client
+
+    def _fail(self, error: RedisError) -> None:
+        logger.warning(f'{self.NAME} unavailable: {error}')
+        self._unavailable_until = monotonic() + self.RETRY_AFTER_SECONDS
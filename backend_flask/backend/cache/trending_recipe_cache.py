@@ -0,0 +1,107 @@
+from typing import Callable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from redis import RedisError
+
+from backend.cache.redis_cache import RedisCache
+
+
+class TrendingRecipeCache(RedisCache):
+    """
+    Redis sorted set of recipe trending amplitudes, serving the trending feed.
+
+    recipe_trending is the source of truth: review writes update it in their transaction
+    and copy the recipe's new amplitude here once committed. The set is only read while
+    its ready marker exists; the marker expires after TRENDING_CACHE_TTL seconds, and
+    the next read falls back to the table and reloads the whole set from it, which also
+    repairs any update lost to a Redis error. A short lock keeps workers from reloading
+    at the same time.
+
+    Pages are keyset paginated on (score, recipe id) descending, the order of the
+    ix_recipe_trending_score index the fallback reads.
+    """
+    NAME = 'Trending cache'
+    TTL_CONFIG_KEY = 'TRENDING_CACHE_TTL'
+    KEY = 'recipes:trending'
+    READY_KEY = 'recipes:trending:ready'
+    WARM_LOCK_KEY = 'recipes:trending:warming'
+    WARM_LOCK_SECONDS = 30
+    WARM_CHUNK_SIZE = 1000
+
+    def get_page(self, limit: int, after: Optional[Tuple[float, UUID]] = None) -> Optional[List[Tuple[UUID, float]]]:
+        """Like RecipeTrendingRepository.get_page; None when the set is unavailable or not loaded."""
+        client = self._redis()
+        if client is None:
+            return None
+
+        try:
+            pipeline = client.pipeline(transaction=False).exists(self.READY_KEY)
+            if after is not None:
+                pipeline.zcount(self.KEY, after[0], after[0])
+            ready, *ties = pipeline.execute()
+            if not ready:
+                return None
+
+            # Members tied with the cursor score that were already served are skipped below.
+            rows = client.zrevrangebyscore(
+                self.KEY, after[0] if after is not None else '+inf', '(0',
+                start=0, num=limit + (ties[0] if ties else 0), withscores=True,
+            )
+        except RedisError as error:
+            self._fail(error)
+            return None
+
+        page = [(UUID(member.decode('ascii')), score) for member, score in rows]
+        if after is not None:
+            page = [(recipe_id, score) for recipe_id, score in page if (score, recipe_id) < after]
+
+        return page[:limit]
+
+    def set_score(self, recipe_id: UUID, score: float) -> None:
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            if score > 0:
+                client.zadd(self.KEY, {str(recipe_id): score})
+            else:
+                client.zrem(self.KEY, str(recipe_id))
+        except RedisError as error:
+            self._fail(error)
+
+    def remove(self, recipe_id: UUID) -> None:
+        self.set_score(recipe_id, 0)
+
+    def warm(self, loader: Callable[[], Iterable[Tuple[UUID, float]]]) -> None:
+        """Reload the set from `loader` unless it is loaded or another worker is loading it."""
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            if client.exists(self.READY_KEY) or not client.set(self.WARM_LOCK_KEY, 1, nx=True,
+                                                               ex=self.WARM_LOCK_SECONDS):
+                return
+
+            rows = [(str(recipe_id), score) for recipe_id, score in loader()]
+            pipeline = client.pipeline(transaction=True)
+            pipeline.delete(self.KEY)
+            for start in range(0, len(rows), self.WARM_CHUNK_SIZE):
+                pipeline.zadd(self.KEY, dict(rows[start:start + self.WARM_CHUNK_SIZE]))
+            pipeline.set(self.READY_KEY, 1, ex=self._ttl())
+            pipeline.delete(self.WARM_LOCK_KEY)
+            pipeline.execute()
+        except RedisError as error:
+            self._fail(error)
+
+    def invalidate(self) -> None:
+        """Make the next read reload the set from recipe_trending."""
+        client = self._redis()
+        if client is None:
+            return
+
+        try:
+            client.delete(self.READY_KEY)
+        except RedisError as error:
+            self._fail(error)
@@ -0,0 +1,17 @@
+from flask import Flask
+
+from .recipe_stats_commands import recipe_stats_cli
+from .similar_recipes_commands import similar_recipes_cli
+from .trending_commands import trending_cli
+
+
+class CommandRegistrar:
+    """
+    Registering maintenance commands on the Flask CLI
+    """
+
+    @staticmethod
+    def register_commands(app: Flask) -> None:
+        app.cli.add_command(recipe_stats_cli)
+        app.cli.add_command(similar_recipes_cli)
+        app.cli.add_command(trending_cli)
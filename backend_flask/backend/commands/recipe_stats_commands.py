@@ -0,0 +1,13 @@
+import click
+from flask.cli import AppGroup
+
+from backend.repositories import RecipeStatsRepository
+
+recipe_stats_cli = AppGroup('recipe-stats', help='Maintain precomputed recipe rating aggregates.')
+
+
+@recipe_stats_cli.command('rebuild')
+def rebuild_recipe_stats():
+    """Recompute every recipe_stats row from approved reviews."""
+    rebuilt = RecipeStatsRepository().rebuild()
+    click.echo(f'Rebuilt rating stats for {rebuilt} recipes.')
@@ -0,0 +1,23 @@
+from itertools import groupby
+from operator import itemgetter
+
+import click
+from flask.cli import AppGroup
+
+from backend.indexes import MinHasher
+from backend.repositories import RecipeRepository, RecipeSignatureRepository
+
+similar_recipes_cli = AppGroup('similar-recipes', help='Maintain the similar-recipes MinHash index.')
+
+
+@similar_recipes_cli.command('build')
+def build_similar_recipes():
+    """Recompute the MinHash signature of every recipe's ingredient set."""
+    pairs = RecipeRepository().get_recipe_ingredient_pairs()
+    signatures = (
+        (recipe_id, MinHasher.pack(MinHasher.signature(ingredient_id for _, ingredient_id in group)))
+        for recipe_id, group in groupby(pairs, key=itemgetter(0))
+    )
+
+    stored = RecipeSignatureRepository().replace_all(signatures)
+    click.echo(f'Stored similarity signatures for {stored} recipes.')
@@ -0,0 +1,16 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from backend.cache import TrendingRecipeCache
+from backend.repositories import RecipeTrendingRepository
+
+trending_cli = AppGroup('trending', help='Maintain trending recipe scores.')
+
+
+@trending_cli.command('rebuild')
+def rebuild_trending():
+    """Recompute every trending score from approved reviews and reload the Redis set."""
+    rebuilt = RecipeTrendingRepository().rebuild(current_app.config['TRENDING_HALF_LIFE_HOURS'])
+    TrendingRecipeCache().invalidate()
+    click.echo(f'Rebuilt trending scores for {rebuilt} recipes.')
@@ -13,6 +13,13 @@ class Config:
         - JWT settings (secret key, expiration times, issuer/audience)
         - Debug mode
         - CORS allowed origins
+        - Pagination total caching
+        - Ingredient index rebuild interval
+        - Similar-recipes index reload interval
+        - Autocomplete index rebuild interval
+        - Recipe list response caching in Redis
+        - Trending recipes decay half-life and Redis set reload interval
+        - JSON encoder backend for API responses
     """
     SQLALCHEMY_DATABASE_URI = config('SQLALCHEMY_DATABASE_URI', default='sqlite:///database.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = config('SQLALCHEMY_TRACK_MODIFICATIONS', default=False, cast=bool)
@@ -35,4 +42,17 @@ class Config:
     DEBUG = config('DEBUG', default=True, cast=bool)
 
     CORS_ORIGINS = config('ALLOWED_ORIGIN', default='*')
-    REDIS_URL = config('REDIS_URL', default='redis://localhost:6379')
\ No newline at end of file
+    REDIS_URL = config('REDIS_URL', default='redis://localhost:6379')
+
+    PAGINATION_COUNT_CACHE_TTL = config('PAGINATION_COUNT_CACHE_TTL', cast=int, default=30)
+
+    INGREDIENT_INDEX_TTL = config('INGREDIENT_INDEX_TTL', cast=int, default=300)
+    INGREDIENT_INDEX_BUILD_ON_STARTUP = config('INGREDIENT_INDEX_BUILD_ON_STARTUP', cast=bool, default=True)
+    SIMILAR_RECIPE_INDEX_TTL = config('SIMILAR_RECIPE_INDEX_TTL', cast=int, default=300)
+    AUTOCOMPLETE_INDEX_TTL = config('AUTOCOMPLETE_INDEX_TTL', cast=int, default=300)
+    RECIPE_LIST_CACHE_TTL = config('RECIPE_LIST_CACHE_TTL', cast=int, default=60)
+
+    TRENDING_HALF_LIFE_HOURS = config('TRENDING_HALF_LIFE_HOURS', cast=float, default=84)
+    TRENDING_CACHE_TTL = config('TRENDING_CACHE_TTL', cast=int, default=3600)
+
+    JSON_BACKEND = config('JSON_BACKEND', default='auto')
@@ -0,0 +1,54 @@
+from functools import wraps
+from hashlib import sha1
+from typing import Callable, Iterable
+
+from flask import current_app, request
+from flask_jwt_extended import get_jwt_identity
+from flask_restx.utils import unpack
+
+from backend.repositories import RevisionRepository
+
+
+def conditional_get(scopes: Callable[..., Iterable[str]], per_viewer: bool = False):
+    """
+    Decorator adding strong ETags and If-None-Match handling to a GET handler.
+
+    The ETag is derived from the revision counters of `scopes` (called with the
+    route kwargs) and the query string, not from the response body, so a matching
+    If-None-Match is answered with 304 before the handler runs.
+
+    Args:
+        scopes (Callable): Returns the revision scopes the response is built from.
+        per_viewer (bool): If True, the response depends on the JWT identity, which
+            then becomes part of the ETag. Apply it under jwt_required_custom.
+
+    Returns:
+        function: Wrapped handler.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            revisions = RevisionRepository().get_revisions(scopes(**kwargs))
+
+            digest = sha1(request.path.encode('utf-8'))
+            digest.update(b'?' + request.query_string)
+            for scope, revision in sorted(revisions.items()):
+                digest.update(f'|{scope}={revision}'.encode('utf-8'))
+            if per_viewer:
+                digest.update(f'|viewer={get_jwt_identity()}'.encode('utf-8'))
+            etag = digest.hexdigest()
+
+            headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+            if per_viewer:
+                headers['Vary'] = 'Authorization'
+
+            if request.if_none_match.contains_weak(etag):
+                return current_app.response_class(status=304, headers=headers)
+
+            data, code, response_headers = unpack(fn(*args, **kwargs))
+            if code == 200:
+                response_headers = {**(response_headers or {}), **headers}
+            return data, code, response_headers
+
+        return wrapper
+    return decorator
@@ -1,13 +1,17 @@
 from injector import Binder, singleton
 
 from backend import CloudinaryUploader
+from backend.cache import RecipeListCache, TrendingRecipeCache
 from backend.extensions import db
+from backend.indexes import AutocompleteIndex, IngredientIndex, SimilarRecipeIndex
 from backend.repositories import (CategoryRepository, IngredientRepository,
                                   UserRepository, ReviewRepository,
-                                  RecipeRepository, RoleRepository, RefreshTokenRepository)
+                                  RecipeRepository, RoleRepository, RefreshTokenRepository,
+                                  RecipeStatsRepository, RevisionRepository, RecipeSignatureRepository,
+                                  RecipeTrendingRepository)
 from backend.service import (CategoryService, IngredientsService,
                              UserService, AuthService,
-                             ReviewService, RecipeService)
+                             ReviewService, RecipeService, AutocompleteService)
 
 
 class DIConfig:
@@ -24,6 +28,19 @@ class DIConfig:
         binder.bind(RecipeRepository, to=RecipeRepository, scope=singleton)
         binder.bind(RoleRepository, to=RoleRepository, scope=singleton)
         binder.bind(RefreshTokenRepository, to=RefreshTokenRepository, scope=singleton)
+        binder.bind(RecipeStatsRepository, to=RecipeStatsRepository, scope=singleton)
+        binder.bind(RevisionRepository, to=RevisionRepository, scope=singleton)
+        binder.bind(RecipeSignatureRepository, to=RecipeSignatureRepository, scope=singleton)
+        binder.bind(RecipeTrendingRepository, to=RecipeTrendingRepository, scope=singleton)
+
+
+    @staticmethod
+    def configure_indexes(binder: Binder):
+        binder.bind(IngredientIndex, to=IngredientIndex(), scope=singleton)
+        binder.bind(SimilarRecipeIndex, to=SimilarRecipeIndex(), scope=singleton)
+        binder.bind(AutocompleteIndex, to=AutocompleteIndex(), scope=singleton)
+        binder.bind(RecipeListCache, to=RecipeListCache(), scope=singleton)
+        binder.bind(TrendingRecipeCache, to=TrendingRecipeCache(), scope=singleton)
 
 
     @staticmethod
@@ -38,4 +55,5 @@ class DIConfig:
         binder.bind(UserService, to=UserService, scope=singleton)
         binder.bind(AuthService, to=AuthService, scope=singleton)
         binder.bind(ReviewService, to=ReviewService, scope=singleton)
-        binder.bind(RecipeService, to=RecipeService, scope=singleton)
\ No newline at end of file
+        binder.bind(RecipeService, to=RecipeService, scope=singleton)
+        binder.bind(AutocompleteService, to=AutocompleteService, scope=singleton)
\ No newline at end of file
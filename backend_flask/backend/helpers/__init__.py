@@ -1,4 +1,6 @@
 from .cloudinary_uploader import CloudinaryUploader
 from .error_handler import ErrorHandlerConfigurator
 from .logger import Logger
-from .json_encoder import UUIDJSONEncoder
\ No newline at end of file
+from .json_encoder import UUIDJSONEncoder
+from .json_backends import JSONBackendFactory
+from .trending_score import TrendingScore
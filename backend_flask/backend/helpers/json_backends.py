@@ -0,0 +1,72 @@
+import json
+import logging
+
+from backend.helpers.json_encoder import UUIDJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger('backend_logger')
+
+
+class StdlibJSONBackend:
+    """`json.dumps` with UUIDJSONEncoder; the reference output every backend must match."""
+    name = 'stdlib'
+    SEPARATORS = (',', ':')
+
+    @staticmethod
+    def dumps(data) -> bytes:
+        return (json.dumps(data, cls=UUIDJSONEncoder, ensure_ascii=False,
+                           separators=StdlibJSONBackend.SEPARATORS) + '\n').encode('utf-8')
+
+
+class OrjsonJSONBackend:
+    """
+    orjson with native UUID/datetime encoding, producing the same bytes as the stdlib
+    backend except for the float cases listed on JSONBackendFactory. Payloads orjson
+    rejects, such as integers beyond 64 bits, are encoded by the stdlib backend instead.
+    """
+    name = 'orjson'
+    OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson else 0
+
+    @staticmethod
+    def _default(obj):
+        return UUIDJSONEncoder().default(obj)
+
+    def dumps(self, data) -> bytes:
+        try:
+            return orjson.dumps(data, default=self._default, option=self.OPTIONS)
+        except orjson.JSONEncodeError:
+            return StdlibJSONBackend.dumps(data)
+
+
+class JSONBackendFactory:
+    """
+    Picks the encoder for API responses from the JSON_BACKEND setting:
+        - auto: orjson when installed, stdlib otherwise
+        - orjson: orjson, falling back to stdlib with a warning when it is not installed
+        - stdlib: json.dumps with UUIDJSONEncoder
+
+    Both backends write UTF-8 JSON with compact separators, UUIDs as strings, dates in
+    ISO 8601 and a trailing newline, so responses are byte-identical whichever is used,
+    with two exceptions for floats:
+        - exponents are spelled without padding by orjson (1e-7, stdlib 1e-07),
+        - NaN and infinities become null with orjson (stdlib writes NaN/Infinity).
+    """
+
+    @staticmethod
+    def create(name: str = 'auto'):
+        if name not in ('auto', 'orjson', 'stdlib'):
+            raise ValueError(f'Unknown JSON backend: {name}')
+
+        if name == 'stdlib':
+            return StdlibJSONBackend()
+
+        if orjson is None:
+            if name == 'orjson':
+                logger.warning('JSON_BACKEND=orjson but orjson is not installed, using stdlib json')
+            return StdlibJSONBackend()
+
+        return OrjsonJSONBackend()
@@ -1,11 +1,15 @@
 import uuid
+from datetime import date, datetime
 from json import JSONEncoder
 
 class UUIDJSONEncoder(JSONEncoder):
-    """Custom JSON encoder that converts UUID objects to strings."""
+    """Custom JSON encoder that converts UUID objects to strings and dates to ISO 8601."""
 
     def default(self, obj):
         if isinstance(obj, uuid.UUID):
             return str(obj)
 
-        return super().default(obj)
\ No newline at end of file
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+
+        return super().default(obj)
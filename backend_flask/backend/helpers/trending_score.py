@@ -0,0 +1,31 @@
+from datetime import datetime
+
+
+class TrendingScore:
+    """
+    Exponentially decayed trending score of a recipe's approved reviews.
+
+    Every approved review contributes rating / MAX_RATING, halving every `half_life_hours`
+    after the review was written. Instead of decaying every stored score as time passes,
+    scores are kept as amplitudes relative to EPOCH: a contribution is scaled up by
+    2 ** (hours since EPOCH / half_life), so adding a review is a plain increment and
+    older scores never need rewriting. Amplitudes rank exactly like the decayed scores;
+    `current` turns one back into today's decayed value.
+
+    Doubles hold about 1000 half-lives, i.e. years past EPOCH at the default half-life;
+    moving EPOCH forward (or changing the half-life) needs `flask trending rebuild`.
+    """
+    EPOCH = datetime(2026, 1, 1)
+    MAX_RATING = 5
+
+    @classmethod
+    def contribution(cls, rating: int, reviewed_at: datetime, half_life_hours: float) -> float:
+        return rating / cls.MAX_RATING * 2 ** (cls._hours_since_epoch(reviewed_at) / half_life_hours)
+
+    @classmethod
+    def current(cls, amplitude: float, half_life_hours: float, now: datetime = None) -> float:
+        return amplitude * 2 ** (-cls._hours_since_epoch(now or datetime.utcnow()) / half_life_hours)
+
+    @classmethod
+    def _hours_since_epoch(cls, moment: datetime) -> float:
+        return (moment - cls.EPOCH).total_seconds() / 3600
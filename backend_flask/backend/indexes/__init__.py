@@ -0,0 +1,3 @@
+from .autocomplete_index import AutocompleteIndex
+from .ingredient_index import IngredientIndex
+from .similar_recipe_index import MinHasher, SimilarRecipeIndex
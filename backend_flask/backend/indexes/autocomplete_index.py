@@ -0,0 +1,131 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from threading import RLock
+from time import monotonic
+from typing import Callable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+_WORD_SEPARATORS = re.compile(r'[\W_]+')
+
+
+def normalize_name(text: str) -> str:
+    """Case-folded, accent-free words separated by single spaces."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(_WORD_SEPARATORS.sub(' ', stripped.casefold()).split())
+
+
+class AutocompleteIndex:
+    """
+    In-process prefix index over recipe titles, ingredient names and category names.
+
+    Every name is normalized (see `normalize_name`) and stored once per word it contains,
+    as the suffix starting at that word, in one sorted array of (term, kind, id) tuples:
+    "Tomato soup" is found by "tom" and by "sou". A lookup bisects to the first term with
+    the prefix and walks the contiguous run of matches, then keeps the top `limit` by
+    popularity (approved reviews of a recipe, recipes using an ingredient or category).
+
+    Entries are (kind, id) pairs with kind one of RECIPE, INGREDIENT, CATEGORY. The index
+    is built lazily from `loader` and rebuilt once it is older than `ttl` seconds, which
+    also refreshes popularity; between rebuilds the recipe, ingredient and category
+    services keep names current on create/update/delete.
+    """
+    RECIPE = 'recipe'
+    INGREDIENT = 'ingredient'
+    CATEGORY = 'category'
+
+    def __init__(self):
+        self._lock = RLock()
+        self._built_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._terms: List[Tuple[str, str, UUID]] = []
+        self._names: dict[Tuple[str, UUID], Tuple[str, str]] = {}
+        self._popularity: dict[Tuple[str, UUID], int] = {}
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def ensure_fresh(self, loader: Callable[[], Iterable[Tuple[str, UUID, str, int]]], ttl: float) -> None:
+        if self._built_at is not None and monotonic() - self._built_at < ttl:
+            return
+
+        with self._lock:
+            if self._built_at is None or monotonic() - self._built_at >= ttl:
+                self.build(loader())
+
+    def build(self, entries: Iterable[Tuple[str, UUID, str, int]]) -> None:
+        """Rebuild from (kind, id, name, popularity) entries."""
+        terms, names, popularity = [], {}, {}
+        for kind, entry_id, name, entry_popularity in entries:
+            normalized = normalize_name(name)
+            names[(kind, entry_id)] = (name, normalized)
+            popularity[(kind, entry_id)] = entry_popularity or 0
+            terms.extend((term, kind, entry_id) for term in self._terms_of(normalized))
+        terms.sort()
+
+        with self._lock:
+            self._terms, self._names, self._popularity = terms, names, popularity
+            self._built_at = monotonic()
+
+    def set_entry(self, kind: str, entry_id: UUID, name: str) -> None:
+        """Add an entry or rename it; a new entry starts with popularity 0 until the next rebuild."""
+        if not self.is_built:
+            return
+
+        with self._lock:
+            self._discard(kind, entry_id)
+            normalized = normalize_name(name)
+            self._names[(kind, entry_id)] = (name, normalized)
+            self._popularity.setdefault((kind, entry_id), 0)
+            for term in self._terms_of(normalized):
+                insort(self._terms, (term, kind, entry_id))
+
+    def remove_entry(self, kind: str, entry_id: UUID) -> None:
+        if not self.is_built:
+            return
+
+        with self._lock:
+            self._discard(kind, entry_id)
+            self._popularity.pop((kind, entry_id), None)
+
+    def suggest(self, query: str, limit: int) -> List[Tuple[str, UUID, str]]:
+        """
+        Up to `limit` (kind, id, name) entries with a word starting with `query`, most popular
+        first, then shortest name.
+        """
+        prefix = normalize_name(query)
+        if not prefix:
+            return []
+
+        with self._lock:
+            matches = set()
+            position = bisect_left(self._terms, (prefix,))
+            while position < len(self._terms) and self._terms[position][0].startswith(prefix):
+                _, kind, entry_id = self._terms[position]
+                matches.add((kind, entry_id))
+                position += 1
+
+            top = nsmallest(limit, matches, key=lambda key: (
+                -self._popularity.get(key, 0), len(self._names[key][1]), self._names[key][1], key[0], key[1]
+            ))
+            return [(kind, entry_id, self._names[(kind, entry_id)][0]) for kind, entry_id in top]
+
+    @staticmethod
+    def _terms_of(normalized: str) -> List[str]:
+        words = normalized.split(' ') if normalized else []
+        return [' '.join(words[index:]) for index in range(len(words))]
+
+    def _discard(self, kind: str, entry_id: UUID) -> None:
+        stored = self._names.pop((kind, entry_id), None)
+        if stored is None:
+            return
+
+        for term in self._terms_of(stored[1]):
+            position = bisect_left(self._terms, (term, kind, entry_id))
+            if position < len(self._terms) and self._terms[position] == (term, kind, entry_id):
+                del self._terms[position]
@@ -0,0 +1,177 @@
+from threading import RLock
+from time import monotonic
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+
+def _iter_bits(bits: int):
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class IngredientIndex:
+    """
+    In-process inverted index from ingredient id to the set of recipes using it.
+
+    Each recipe gets an ordinal and every posting list is a bitset of ordinals stored in
+    a Python int, so and/or matching is a handful of big-integer AND/OR operations.
+    Ordinals follow (created_at, id) order of the initial build and grow for recipes added
+    later, so descending ordinals give the default newest-first order without touching
+    the database. Updating a recipe keeps its ordinal and only rewrites its postings.
+
+    The index is built at startup (or lazily from `loader`) and remembers the recipes
+    revision it reflects. RecipeService keeps it current on create/update/delete, passing
+    the revision each write bumped to; a write made by another process shows up as a
+    revision the index hasn't seen, which triggers a rebuild, as does reaching `ttl` seconds.
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._built_at: Optional[float] = None
+        self._revision: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ordinals: dict[UUID, int] = {}
+        self._recipe_ids: List[Optional[UUID]] = []
+        self._postings: dict[UUID, int] = {}
+        self._recipe_ingredients: dict[UUID, frozenset] = {}
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def ensure_fresh(self, loader: Callable[[], Iterable[Tuple[UUID, UUID]]], ttl: float,
+                     revision: Optional[int] = None) -> None:
+        """Rebuild from `loader` unless the index is younger than `ttl` and at `revision`."""
+        if not self._is_stale(ttl, revision):
+            return
+
+        with self._lock:
+            if self._is_stale(ttl, revision):
+                self.build(loader(), revision)
+
+    def _is_stale(self, ttl: float, revision: Optional[int]) -> bool:
+        return (
+            self._built_at is None
+            or monotonic() - self._built_at >= ttl
+            or (revision is not None and revision != self._revision)
+        )
+
+    def build(self, pairs: Iterable[Tuple[UUID, UUID]], revision: Optional[int] = None) -> None:
+        """
+        Rebuild from (recipe_id, ingredient_id) pairs ordered by recipe (created_at, id).
+        `revision` is the recipes revision read before the pairs were loaded.
+        """
+        grouped: dict[UUID, set] = {}
+        for recipe_id, ingredient_id in pairs:
+            grouped.setdefault(recipe_id, set()).add(ingredient_id)
+
+        with self._lock:
+            self._reset()
+            for recipe_id, ingredient_ids in grouped.items():
+                self._add(recipe_id, ingredient_ids)
+            self._built_at = monotonic()
+            self._revision = revision
+
+    def set_recipe(self, recipe_id: UUID, ingredient_ids: Iterable[UUID], revision: Optional[int] = None) -> None:
+        if not self.is_built:
+            return
+
+        with self._lock:
+            ordinal = self._ordinals.get(recipe_id)
+            self._discard(recipe_id)
+            self._add(recipe_id, set(ingredient_ids), ordinal)
+            self._advance(revision)
+
+    def remove_recipe(self, recipe_id: UUID, revision: Optional[int] = None) -> None:
+        if not self.is_built:
+            return
+
+        with self._lock:
+            self._discard(recipe_id)
+            self._advance(revision)
+
+    def _advance(self, revision: Optional[int]) -> None:
+        """Move to the revision of a write just applied, if no other write came in between."""
+        if revision is not None and self._revision is not None and self._revision == revision - 1:
+            self._revision = revision
+
+    def match_all(self, ingredient_ids: Iterable[UUID]) -> List[UUID]:
+        """Recipes containing every given ingredient, newest first."""
+        with self._lock:
+            bits = None
+            for ingredient_id in set(ingredient_ids):
+                posting = self._postings.get(ingredient_id, 0)
+                bits = posting if bits is None else bits & posting
+                if not bits:
+                    return []
+
+            return self._ids_newest_first(bits or 0)
+
+    def match_any(self, ingredient_ids: Iterable[UUID]) -> List[UUID]:
+        """Recipes containing at least one of the given ingredients, newest first."""
+        with self._lock:
+            bits = 0
+            for ingredient_id in set(ingredient_ids):
+                bits |= self._postings.get(ingredient_id, 0)
+
+            return self._ids_newest_first(bits)
+
+    def rank_by_coverage(self, ingredient_ids: Iterable[UUID]) -> List[Tuple[UUID, float]]:
+        """
+        Recipes sharing at least one ingredient with the given set, ordered by the fraction
+        of their own ingredients that the set covers, then by matched count and recency.
+        """
+        with self._lock:
+            matched: dict[int, int] = {}
+            for ingredient_id in set(ingredient_ids):
+                for ordinal in _iter_bits(self._postings.get(ingredient_id, 0)):
+                    matched[ordinal] = matched.get(ordinal, 0) + 1
+
+            ranked = []
+            for ordinal, count in matched.items():
+                recipe_id = self._recipe_ids[ordinal]
+                coverage = count / len(self._recipe_ingredients[recipe_id])
+                ranked.append((coverage, count, ordinal, recipe_id))
+
+        ranked.sort(reverse=True)
+        return [(recipe_id, coverage) for coverage, _, _, recipe_id in ranked]
+
+    def _ids_newest_first(self, bits: int) -> List[UUID]:
+        ordinals = sorted(_iter_bits(bits), reverse=True)
+        return [self._recipe_ids[ordinal] for ordinal in ordinals]
+
+    def _add(self, recipe_id: UUID, ingredient_ids: Set[UUID], ordinal: Optional[int] = None) -> None:
+        """Index a recipe under `ordinal`, or under a new, highest one when it has none yet."""
+        if not ingredient_ids and ordinal is None:
+            return
+
+        if ordinal is None:
+            ordinal = len(self._recipe_ids)
+            self._recipe_ids.append(recipe_id)
+        else:
+            self._recipe_ids[ordinal] = recipe_id
+        self._ordinals[recipe_id] = ordinal
+        self._recipe_ingredients[recipe_id] = frozenset(ingredient_ids)
+
+        bit = 1 << ordinal
+        for ingredient_id in ingredient_ids:
+            self._postings[ingredient_id] = self._postings.get(ingredient_id, 0) | bit
+
+    def _discard(self, recipe_id: UUID) -> None:
+        ordinal = self._ordinals.pop(recipe_id, None)
+        if ordinal is None:
+            return
+
+        mask = ~(1 << ordinal)
+        for ingredient_id in self._recipe_ingredients.pop(recipe_id):
+            posting = self._postings[ingredient_id] & mask
+            if posting:
+                self._postings[ingredient_id] = posting
+            else:
+                del self._postings[ingredient_id]
+
+        self._recipe_ids[ordinal] = None
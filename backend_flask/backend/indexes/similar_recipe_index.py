@@ -0,0 +1,157 @@
+import struct
+from random import Random
+from threading import RLock
+from time import monotonic
+from typing import Callable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _permutations(count: int, seed: int) -> Tuple[Tuple[int, int], ...]:
+    """(a, b) pairs of the universal hashes (a * x + b) mod p standing in for random permutations."""
+    rng = Random(seed)
+    return tuple((rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(count))
+
+
+class MinHasher:
+    """
+    MinHash signatures of ingredient id sets.
+
+    The permutations come from a fixed seed, so signatures written by the CLI build and
+    the ones computed by the app for new or edited recipes are comparable. The share of
+    equal positions in two signatures estimates the Jaccard similarity of the sets.
+    """
+    NUM_PERM = 64
+    SEED = 1
+
+    _PERMUTATIONS = _permutations(NUM_PERM, SEED)
+    _FORMAT = struct.Struct(f'<{NUM_PERM}I')
+
+    @classmethod
+    def signature(cls, ingredient_ids: Iterable[UUID]) -> Optional[Tuple[int, ...]]:
+        values = [ingredient_id.int % _MERSENNE_PRIME for ingredient_id in set(ingredient_ids)]
+        if not values:
+            return None
+
+        return tuple(
+            min((a * value + b) % _MERSENNE_PRIME for value in values) & 0xFFFFFFFF
+            for a, b in cls._PERMUTATIONS
+        )
+
+    @classmethod
+    def pack(cls, signature: Tuple[int, ...]) -> bytes:
+        return cls._FORMAT.pack(*signature)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Optional[Tuple[int, ...]]:
+        if len(data) != cls._FORMAT.size:
+            return None
+        return cls._FORMAT.unpack(data)
+
+
+class SimilarRecipeIndex:
+    """
+    In-process LSH index over MinHash signatures of recipe ingredient sets.
+
+    Signatures are split into BANDS bands of ROWS positions; recipes sharing any band
+    land in the same bucket and become candidates, which are then ranked by estimated
+    Jaccard similarity. With 16 bands of 4 rows, pairs above ~0.5 similarity are very
+    likely to collide while unrelated recipes rarely do, so a lookup touches a few
+    buckets instead of every recipe.
+
+    The index is loaded lazily from stored signatures (see `flask similar-recipes build`)
+    and reloaded once it is older than `ttl` seconds; between reloads RecipeService keeps
+    it current on create/update/delete.
+    """
+    BANDS = 16
+    ROWS = MinHasher.NUM_PERM // BANDS
+
+    def __init__(self):
+        self._lock = RLock()
+        self._built_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._signatures: dict[UUID, Tuple[int, ...]] = {}
+        self._buckets: dict[tuple, set] = {}
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def ensure_fresh(self, loader: Callable[[], Iterable[Tuple[UUID, bytes]]], ttl: float) -> None:
+        if self._built_at is not None and monotonic() - self._built_at < ttl:
+            return
+
+        with self._lock:
+            if self._built_at is None or monotonic() - self._built_at >= ttl:
+                self.build(loader())
+
+    def build(self, packed_signatures: Iterable[Tuple[UUID, bytes]]) -> None:
+        """Rebuild from (recipe_id, packed signature) pairs; signatures of another size are skipped."""
+        with self._lock:
+            self._reset()
+            for recipe_id, data in packed_signatures:
+                signature = MinHasher.unpack(data)
+                if signature is not None:
+                    self._add(recipe_id, signature)
+            self._built_at = monotonic()
+
+    def set_recipe(self, recipe_id: UUID, signature: Optional[Tuple[int, ...]]) -> None:
+        if not self.is_built:
+            return
+
+        with self._lock:
+            self._discard(recipe_id)
+            if signature is not None:
+                self._add(recipe_id, signature)
+
+    def remove_recipe(self, recipe_id: UUID) -> None:
+        if not self.is_built:
+            return
+
+        with self._lock:
+            self._discard(recipe_id)
+
+    def contains(self, recipe_id: UUID) -> bool:
+        return recipe_id in self._signatures
+
+    def most_similar(self, recipe_id: UUID, limit: int) -> List[Tuple[UUID, float]]:
+        """Up to `limit` recipes sharing an LSH bucket with `recipe_id`, by estimated similarity."""
+        with self._lock:
+            signature = self._signatures.get(recipe_id)
+            if signature is None:
+                return []
+
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates |= self._buckets[key]
+            candidates.discard(recipe_id)
+
+            ranked = [
+                (sum(a == b for a, b in zip(signature, self._signatures[candidate])), candidate)
+                for candidate in candidates
+            ]
+
+        ranked.sort(key=lambda item: (-item[0], str(item[1])))
+        return [(candidate, matches / MinHasher.NUM_PERM) for matches, candidate in ranked[:limit]]
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        return [(band, signature[band * self.ROWS:(band + 1) * self.ROWS]) for band in range(self.BANDS)]
+
+    def _add(self, recipe_id: UUID, signature: Tuple[int, ...]) -> None:
+        self._signatures[recipe_id] = signature
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, set()).add(recipe_id)
+
+    def _discard(self, recipe_id: UUID) -> None:
+        signature = self._signatures.pop(recipe_id, None)
+        if signature is None:
+            return
+
+        for key in self._band_keys(signature):
+            bucket = self._buckets[key]
+            bucket.discard(recipe_id)
+            if not bucket:
+                del self._buckets[key]
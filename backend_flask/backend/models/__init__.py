@@ -2,10 +2,14 @@ from .role import Role
 from .user import User
 from .category import Category
 from .ingredient import Ingredient
+from .recipe_stats import RecipeStats
 from .recipe import Recipe
 from .recipe_ingredients import RecipeIngredient
 from .review_status import ReviewStatus
 from .review import Reviews
 from .recipe_categories import RecipeCategory
 from .recipe_step import RecipeStep
-from .refresh_token import RefreshToken
\ No newline at end of file
+from .refresh_token import RefreshToken
+from .entity_revision import EntityRevision
+from .recipe_signature import RecipeSignature
+from .recipe_trending import RecipeTrending
\ No newline at end of file
@@ -0,0 +1,8 @@
+from backend.extensions import db
+
+
+class EntityRevision(db.Model):
+    __tablename__ = 'entity_revisions'
+
+    scope = db.Column(db.String(100), primary_key=True)
+    revision = db.Column(db.BigInteger, nullable=False, default=0)
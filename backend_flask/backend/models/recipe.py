@@ -1,8 +1,11 @@
 from uuid import uuid4
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy_utils import URLType
 
 from backend.extensions import db
+from backend.models.recipe_stats import RecipeStats
+
+SEARCH_CONFIG = 'simple'
 
 
 class Recipe(db.Model):
@@ -15,6 +18,8 @@ class Recipe(db.Model):
     image_url = db.Column(URLType, nullable=True)
     created_at = db.Column(db.DateTime, nullable=False, default=db.func.now())
     servings_count = db.Column(db.Integer, nullable=False, default=1)
+    # Weighted title/description/steps vector, kept current by triggers on Postgres
+    search_vector = db.deferred(db.Column(TSVECTOR().with_variant(db.Text(), 'sqlite'), nullable=True))
 
     author_id = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id'), nullable=False)
     author = db.relationship('User', backref='recipes')
@@ -37,6 +42,16 @@ class Recipe(db.Model):
         cascade='all, delete-orphan',
         passive_deletes=True
     )
+    # Read-only shortcuts over the association rows, used to eager load the detail view
+    ingredients = db.relationship('Ingredient', secondary='recipe_ingredients', viewonly=True)
+    categories = db.relationship('Category', secondary='recipe_categories', viewonly=True)
+    stats = db.relationship(
+        'RecipeStats',
+        back_populates='recipe',
+        uselist=False,
+        cascade='all, delete-orphan',
+        passive_deletes=True
+    )
 
     __table_args__ = (
         db.CheckConstraint('length(trim(title)) > 0', name='ck_recipes_title_required'),
@@ -44,4 +59,12 @@ class Recipe(db.Model):
         db.UniqueConstraint('author_id', 'title', name='uq_recipes_author_id_title'),
         db.CheckConstraint('duration > 0', name='ck_recipes_duration_valid'),
         db.CheckConstraint('servings_count > 0', name='ck_recipes_servings_count_valid'),
-    )
\ No newline at end of file
+        db.Index('ix_recipes_created_at_id', 'created_at', 'id'),
+        db.Index('ix_recipes_duration_id', 'duration', 'id'),
+        db.Index('ix_recipes_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.stats is None:
+            self.stats = RecipeStats()
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy.dialects.postgresql import UUID
+
+from backend.extensions import db
+
+
+class RecipeSignature(db.Model):
+    """MinHash signature of a recipe's ingredient set, packed by MinHasher.pack."""
+    __tablename__ = 'recipe_signatures'
+
+    recipe_id = db.Column(UUID(as_uuid=True), db.ForeignKey('recipes.id', ondelete='CASCADE'), primary_key=True)
+    signature = db.Column(db.LargeBinary, nullable=False)
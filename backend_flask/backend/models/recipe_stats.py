@@ -0,0 +1,20 @@
+from sqlalchemy.dialects.postgresql import UUID
+
+from backend.extensions import db
+
+
+class RecipeStats(db.Model):
+    __tablename__ = 'recipe_stats'
+
+    recipe_id = db.Column(UUID(as_uuid=True), db.ForeignKey('recipes.id', ondelete='CASCADE'), primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    average_rating = db.Column(db.Float, nullable=False, default=0)
+
+    recipe = db.relationship('Recipe', back_populates='stats', overlaps='stats')
+
+    __table_args__ = (
+        db.CheckConstraint('review_count >= 0', name='ck_recipe_stats_review_count_valid'),
+        db.Index('ix_recipe_stats_top_rated', 'average_rating', 'review_count', 'recipe_id'),
+        db.Index('ix_recipe_stats_most_reviewed', 'review_count', 'recipe_id'),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy.dialects.postgresql import UUID
+
+from backend.extensions import db
+
+
+class RecipeTrending(db.Model):
+    """Trending amplitude of a recipe's approved reviews, see TrendingScore."""
+    __tablename__ = 'recipe_trending'
+
+    recipe_id = db.Column(UUID(as_uuid=True), db.ForeignKey('recipes.id', ondelete='CASCADE'), primary_key=True)
+    score = db.Column(db.Float, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_recipe_trending_score', 'score', 'recipe_id'),
+    )
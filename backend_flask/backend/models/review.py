@@ -24,4 +24,7 @@ class Reviews(db.Model):
         db.UniqueConstraint('user_id', 'recipe_id', name='uq_reviews_user_id_recipe_id'),
         db.CheckConstraint('rating >= 1 AND rating <= 5', name='ck_ratings_rating_valid'),
         db.CheckConstraint('length(trim(comment)) > 0', name='ck_ratings_comment_required'),
+        # Review feeds filter on status and are keyset paginated on (created_at, id)
+        db.Index('ix_reviews_recipe_feed', 'recipe_id', 'status_id', created_at.desc(), id.desc()),
+        db.Index('ix_reviews_status_feed', 'status_id', created_at.desc(), id.desc()),
     )
\ No newline at end of file
@@ -0,0 +1,67 @@
+from threading import Lock
+from time import monotonic
+from typing import Hashable, Optional
+
+from flask import current_app
+
+
+class CountCache:
+    """
+    Short-lived, per-process cache of list totals keyed by a normalized filter.
+
+    Totals are only used for page counters, so a few seconds of staleness is an
+    acceptable price for skipping the COUNT query. Keys are tuples starting with the
+    list's namespace, which writes invalidate in this process. The lifetime comes from
+    the PAGINATION_COUNT_CACHE_TTL setting; 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._entries: dict[Hashable, tuple[float, int]] = {}
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    @staticmethod
+    def _ttl() -> float:
+        return current_app.config.get('PAGINATION_COUNT_CACHE_TTL', 0)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        if self._ttl() <= 0:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, total = entry
+        if expires_at < monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        return total
+
+    def set(self, key: Hashable, total: int) -> None:
+        ttl = self._ttl()
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                now = monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+                if len(self._entries) >= self._max_entries:
+                    self._entries.clear()
+
+            self._entries[key] = (monotonic() + ttl, total)
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop the cached totals whose key starts with `namespace`, e.g. after writes to that list."""
+        with self._lock:
+            self._entries = {key: entry for key, entry in self._entries.items()
+                             if not (isinstance(key, tuple) and key and key[0] == namespace)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
@@ -0,0 +1,41 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from backend.exceptions import ValidationError
+
+
+class CursorCodec:
+    """
+    Encodes keyset positions into opaque, URL-safe cursor strings and back.
+
+    A cursor holds the sort key values of the last item on a page, e.g.
+    (created_at, id), so the next page can continue right after it.
+    """
+
+    @staticmethod
+    def encode(*values) -> str:
+        payload = [
+            value.isoformat() if isinstance(value, datetime) else
+            str(value) if isinstance(value, UUID) else value
+            for value in values
+        ]
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(cursor: str, *types) -> tuple:
+        try:
+            raw = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw)
+
+            if not isinstance(payload, list) or len(payload) != len(types):
+                raise ValueError('Unexpected cursor payload')
+
+            return tuple(
+                datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+                for value, value_type in zip(payload, types)
+            )
+        except (ValueError, TypeError):
+            raise ValidationError('Invalid cursor!')
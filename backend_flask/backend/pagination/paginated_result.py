@@ -6,25 +6,37 @@ from typing import List, Any, Optional
 @dataclass
 class PaginatedResult:
     items: List[Any]
-    total: int
-    page: int
+    total: Optional[int]
+    page: Optional[int]
     per_page: int
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
 
     @property
-    def total_pages(self) -> int:
+    def is_cursor_mode(self) -> bool:
+        return self.page is None
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        if self.total is None:
+            return None
         return ceil(self.total / self.per_page) if self.per_page > 0 else 0
 
     @property
     def has_next(self) -> bool:
+        if self.is_cursor_mode:
+            return self.next_cursor is not None
+        if self.total is None:
+            return bool(self.has_more)
         return self.page < self.total_pages
 
     @property
     def has_prev(self) -> bool:
-        return self.page > 1
+        return not self.is_cursor_mode and self.page > 1
 
     @property
     def next_page(self) -> Optional[int]:
-        return self.page + 1 if self.has_next else None
+        return self.page + 1 if self.has_next and not self.is_cursor_mode else None
 
     @property
     def prev_page(self) -> Optional[int]:
@@ -40,5 +52,6 @@ class PaginatedResult:
             'hasNext': self.has_next,
             'hasPrev': self.has_prev,
             'nextPage': self.next_page,
-            'prevPage': self.prev_page
-        }
\ No newline at end of file
+            'prevPage': self.prev_page,
+            'nextCursor': self.next_cursor
+        }
@@ -4,6 +4,7 @@ from marshmallow import Schema, fields, validates, ValidationError
 class PaginationSchema(Schema):
     page = fields.Integer(load_default=1)
     per_page = fields.Integer(load_default=10, data_key='perPage')
+    with_total = fields.Boolean(load_default=True, data_key='withTotal')
 
     @validates('page')
     def validate_page(self, value:int, **kwargs):
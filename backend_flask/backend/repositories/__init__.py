@@ -1,7 +1,12 @@
 from .category_repository import CategoryRepository
 from .ingredient_repository import IngredientRepository
 from .recipe_repository import RecipeRepository
+from .recipe_stats_repository import RecipeStatsRepository
+from .review_status_registry import ReviewStatusRegistry, review_status_registry
 from .review_repository import ReviewRepository
 from .role_repository import RoleRepository
 from .user_repository import UserRepository
-from .refresh_token_repository import RefreshTokenRepository
\ No newline at end of file
+from .refresh_token_repository import RefreshTokenRepository
+from .revision_repository import RevisionRepository, RevisionScope
+from .recipe_signature_repository import RecipeSignatureRepository
+from .recipe_trending_repository import RecipeTrendingRepository
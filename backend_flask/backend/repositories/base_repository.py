@@ -1,7 +1,12 @@
 from abc import ABC
-from typing import TypeVar, Generic, List, Optional, Type
+from typing import TypeVar, Generic, List, Optional, Type, Hashable, Iterable
 
 from flask_sqlalchemy.session import Session
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import Query, load_only
+
+from backend.pagination.count_cache import count_cache
+from backend.pagination.paginated_result import PaginatedResult
 
 T = TypeVar('T')
 
@@ -38,4 +43,72 @@ class BaseRepository(ABC, Generic[T]):
 
     def delete(self, entity: T) -> None:
         self._session.delete(entity)
-        self._session.commit()
\ No newline at end of file
+        self._session.commit()
+
+    def commit(self) -> None:
+        self._session.commit()
+
+    def _load_only(self, fieldset: Optional[Iterable[str]], model: Optional[type] = None) -> list:
+        """
+        Loader options restricting `model` (the repository's by default) to the columns named in
+        `fieldset` plus its primary key; no options when `fieldset` is None.
+        """
+        if fieldset is None:
+            return []
+
+        mapper = inspect(model or self._model)
+        columns = [getattr(mapper.class_, key) for key in mapper.column_attrs.keys() if key in fieldset]
+        primary_key = [mapper.get_property_by_column(column).class_attribute for column in mapper.primary_key]
+
+        return [load_only(*primary_key, *columns)]
+
+    def _paginate(self, query: Query, page: int, per_page: int,
+                  with_total: bool = True, count_key: Optional[Hashable] = None) -> PaginatedResult:
+        """
+        Fetch one OFFSET page of an ordered query in a single round trip.
+
+        The total comes from the count cache when `count_key` is cached, otherwise from a
+        `count(*) OVER ()` column on the page query itself. With `with_total=False` the
+        total is skipped and one extra row is fetched to tell whether a next page exists.
+        """
+        offset = (page - 1) * per_page
+
+        if not with_total:
+            rows = query.offset(offset).limit(per_page + 1).all()
+            return PaginatedResult(items=rows[:per_page], total=None, page=page, per_page=per_page,
+                                   has_more=len(rows) > per_page)
+
+        total = count_cache.get(count_key) if count_key is not None else None
+
+        if total is not None:
+            items = query.offset(offset).limit(per_page).all()
+        else:
+            single_entity = len(query.column_descriptions) == 1
+            rows = (
+                query.add_columns(func.count().over().label('total_count'))
+                .offset(offset)
+                .limit(per_page)
+                .all()
+            )
+
+            if rows:
+                total = rows[0][-1]
+                items = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+            else:
+                total = query.order_by(None).count() if page > 1 else 0
+                items = []
+
+            if count_key is not None:
+                count_cache.set(count_key, total)
+
+        return PaginatedResult(items=items, total=total, page=page, per_page=per_page)
+
+    def _count(self, query: Query, count_key: Optional[Hashable] = None) -> int:
+        total = count_cache.get(count_key) if count_key is not None else None
+
+        if total is None:
+            total = query.order_by(None).count()
+            if count_key is not None:
+                count_cache.set(count_key, total)
+
+        return total
@@ -1,6 +1,10 @@
+from typing import List, Set, Tuple
 from uuid import UUID
+
+from sqlalchemy import func, literal, select, union_all
+
 from backend.extensions import db
-from backend.models import Category
+from backend.models import Category, Recipe, RecipeCategory, RecipeIngredient
 from backend.repositories.base_repository import BaseRepository
 
 
@@ -14,4 +18,29 @@ class CategoryRepository(BaseRepository[Category]):
         if exclude_id:
             query = query.filter(self._model.id != exclude_id)
 
-        return query.first() is not None
\ No newline at end of file
+        return query.first() is not None
+
+    def get_autocomplete_entries(self) -> List[tuple]:
+        """(id, name, recipe count) of every category, for the autocomplete index."""
+        return (
+            self._session.query(Category.id, Category.name, func.count(RecipeCategory.recipe_id))
+            .outerjoin(RecipeCategory, RecipeCategory.category_id == Category.id)
+            .group_by(Category.id, Category.name)
+            .all()
+        )
+
+    def get_recipe_references(self, category_id: UUID) -> Tuple[Set[UUID], Set[UUID], Set[UUID]]:
+        """Author, category and ingredient ids of the recipes using the category, in one query."""
+        recipe_ids = select(RecipeCategory.recipe_id).where(RecipeCategory.category_id == category_id)
+        rows = self._session.execute(union_all(
+            select(literal('author'), Recipe.author_id).where(Recipe.id.in_(recipe_ids)),
+            select(literal('category'), RecipeCategory.category_id).where(RecipeCategory.recipe_id.in_(recipe_ids)),
+            select(literal('ingredient'), RecipeIngredient.ingredient_id)
+            .where(RecipeIngredient.recipe_id.in_(recipe_ids)),
+        ))
+
+        references = {'author': set(), 'category': set(), 'ingredient': set()}
+        for kind, value in rows:
+            references[kind].add(value)
+
+        return references['author'], references['category'], references['ingredient']
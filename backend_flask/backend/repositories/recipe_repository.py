@@ -1,18 +1,115 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import AbstractSet, Dict, Iterable, Iterator, Optional, List
 from uuid import UUID
-from sqlalchemy import func
+from sqlalchemy import exists, false, func, insert, literal, null, or_, select, tuple_, union_all
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import joinedload
 
 from backend import db
-from backend.models import Recipe, Reviews, RecipeCategory, RecipeIngredient, RecipeStep
+from backend.models import (Recipe, RecipeStats, RecipeCategory, RecipeIngredient, RecipeStep, Ingredient, Category,
+                            Reviews)
+from backend.models.recipe import SEARCH_CONFIG
+from backend.pagination.count_cache import count_cache
+from backend.pagination.cursor import CursorCodec
 from backend.pagination.paginated_result import PaginatedResult
 from backend.repositories.base_repository import BaseRepository
+from backend.repositories.review_status_registry import review_status_registry
+from backend.schemas.recipes.recipe_card import RecipeCard
+from backend.schemas.recipes.recipe_export import RecipeExportRecord
+
+# Columns of a RecipeCard, in constructor order
+CARD_COLUMNS = (
+    Recipe.id,
+    Recipe.title,
+    Recipe.description,
+    Recipe.servings_count,
+    Recipe.duration,
+    Recipe.created_at,
+    RecipeStats.review_count,
+    RecipeStats.average_rating,
+)
+
+# Columns of a RecipeExportRecord, in constructor order
+EXPORT_COLUMNS = (
+    Recipe.id,
+    Recipe.title,
+    Recipe.description,
+    Recipe.servings_count,
+    Recipe.duration,
+    Recipe.image_url,
+    Recipe.author_id,
+    Recipe.created_at,
+    func.coalesce(RecipeStats.review_count, 0),
+    func.coalesce(RecipeStats.rating_sum, 0),
+    func.coalesce(RecipeStats.average_rating, 0.0),
+)
+
+# Card columns loaded whatever the fieldset: cards are matched and cursors built from them
+CARD_KEY_COLUMNS = ('id', 'created_at')
+# RecipeCard attributes filled from recipe_stats
+CARD_STATS_COLUMNS = frozenset({'review_count', 'average_rating'})
+# RecipeCard list attributes filled by `_attach_tags`
+TAG_KINDS = ('ingredients', 'categories')
 
 
 class RecipeRepository(BaseRepository[Recipe]):
     def __init__(self):
         super().__init__(db.session, Recipe)
 
+    def get_recipe_detail(self, recipe_id: UUID, viewer_id: Optional[UUID] = None,
+                          fieldset: Optional[AbstractSet[str]] = None) -> Optional[tuple[Recipe, bool, bool]]:
+        """
+        Load a recipe with everything the detail view dumps, in two SELECTs.
+
+        The first selects the recipe with its author and steps joined in, plus the viewer's
+        review flags (has any review, has an approved review) as EXISTS columns. The second
+        joins in ingredients and categories; keeping them apart from the steps avoids a
+        steps x ingredients x categories row product.
+
+        `fieldset` limits this to the RecipeDetailSchema attributes given: other recipe columns
+        are deferred, and the joins, EXISTS columns and second SELECT of unrequested
+        relationships and flags are left out.
+
+        Returns (recipe, is_reviewed, is_approved_review), or None if the recipe doesn't exist.
+        """
+        def requested(name: str) -> bool:
+            return fieldset is None or name in fieldset
+
+        is_reviewed = is_approved_review = false()
+        if viewer_id is not None:
+            viewer_reviews = (Reviews.recipe_id == Recipe.id, Reviews.user_id == viewer_id)
+            if requested('is_reviewed'):
+                is_reviewed = exists().where(*viewer_reviews)
+            if requested('is_approved_review'):
+                approved_status_id = review_status_registry.get_id(self._session, 'approved')
+                if approved_status_id is not None:
+                    is_approved_review = exists().where(*viewer_reviews, Reviews.status_id == approved_status_id)
+
+        options = self._load_only(fieldset)
+        if requested('author'):
+            options.append(joinedload(Recipe.author))
+        if requested('steps'):
+            options.append(joinedload(Recipe.steps))
+
+        row = self._session.execute(
+            select(Recipe, is_reviewed.label('is_reviewed'), is_approved_review.label('is_approved_review'))
+            .options(*options)
+            .where(Recipe.id == recipe_id)
+        ).unique().first()
+        if row is None:
+            return None
+
+        tag_options = [joinedload(getattr(Recipe, kind)) for kind in self._tag_kinds(fieldset)]
+        if tag_options:
+            self._session.execute(
+                select(Recipe)
+                .options(*self._load_only(fieldset), *tag_options)
+                .where(Recipe.id == recipe_id)
+            ).unique().all()
+
+        recipe, is_reviewed, is_approved_review = row
+        return recipe, bool(is_reviewed), bool(is_approved_review)
+
     def is_recipe_title_for_user_exists(self, title: str, user_id: UUID) -> bool:
         return (
                 self._session.query(self._model)
@@ -27,51 +124,431 @@ class RecipeRepository(BaseRepository[Recipe]):
             user_id: Optional[UUID] = None,
             category_ids: Optional[List[UUID]] = None,
             ingredient_ids: Optional[List[UUID]] = None,
-            mode: str = 'or'
+            mode: str = 'or',
+            cursor: Optional[str] = None,
+            with_total: bool = True,
+            q: Optional[str] = None,
+            recipe_ids: Optional[List[UUID]] = None,
+            sort: Optional[str] = None,
+            fieldset: Optional[AbstractSet[str]] = None
     ) -> PaginatedResult:
+        """
+        Load one page of recipes as RecipeCard projections.
+
+        The page itself is selected from recipes joined to recipe_stats only, so LIMIT and
+        the total count run over one row per recipe. Ingredient and category names of that
+        page are then loaded with one more SELECT (see `_attach_tags`).
+
+        `q` runs a full-text search ranked by ts_rank on Postgres and a LIKE match elsewhere.
+        Totals are cached per normalized filter (see `BaseRepository._paginate`);
+        `with_total=False` skips them.
+
+        `sort` is one of newest (default), top_rated, most_reviewed or quickest; each ordering
+        is served by an index on recipes or recipe_stats so LIMIT stops early, and its key
+        columns are what the cursor holds. Without `sort`, `q` orders by relevance.
+
+        `recipe_ids` are the recipes already matching `ingredient_ids` (as resolved by the
+        ingredient index); when given they replace the ingredient subquery.
+
+        `fieldset` limits the cards to those RecipeCard attributes (see `_card_columns`): the
+        recipe_stats join is skipped unless stats are requested or sorted on, and so are the
+        tag queries of unrequested ingredients and categories.
+        """
+        columns = self._card_columns(fieldset)
+        query = self._session.query(*columns)
+        if fieldset is None or fieldset & CARD_STATS_COLUMNS or sort in ('top_rated', 'most_reviewed'):
+            query = query.join(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        query = self._apply_filters(query, user_id, category_ids, ingredient_ids, mode, recipe_ids)
+
+        search_rank = None
+        if q:
+            query, search_rank = self._apply_search(query, q)
+
+        count_key = (
+            'recipes',
+            str(user_id) if user_id else None,
+            tuple(sorted(map(str, category_ids or []))),
+            tuple(sorted(map(str, ingredient_ids or []))),
+            mode if ingredient_ids else None,
+            q,
+        )
+
+        sort_keys, descending = self._sort_keys(search_rank, sort)
+        sort_columns = [expression for expression, _ in sort_keys]
         query = (
-            self._session.query(
-                Recipe,
-                func.count(Reviews.id).label('review_count'),
-                func.coalesce(func.avg(Reviews.rating), 0).label('average_rating')
+            query.add_columns(*(expression.label(f'sort_key_{index}') for index, expression in enumerate(sort_columns)))
+            .order_by(*(expression.desc() if descending else expression.asc() for expression in sort_columns))
+        )
+
+        if cursor:
+            cursor_values = CursorCodec.decode(cursor, *(value_type for _, value_type in sort_keys))
+            rows, total = self._cursor_page(query, sort_columns, descending, cursor_values, per_page,
+                                            with_total, count_key)
+            result = PaginatedResult(items=rows[:per_page], total=total, page=None, per_page=per_page)
+            has_next = len(rows) > per_page
+        else:
+            result = self._paginate(query, page, per_page, with_total=with_total, count_key=count_key)
+            has_next = result.has_next
+
+        if has_next and result.items:
+            result.next_cursor = CursorCodec.encode(*result.items[-1][len(columns):])
+
+        result.items = self._attach_tags([RecipeCard(*row[:len(columns)]) for row in result.items],
+                                         self._tag_kinds(fieldset))
+        return result
+
+    def _cursor_page(self, query, sort_columns: list, descending: bool, cursor_values: tuple, per_page: int,
+                     with_total: bool, count_key: tuple) -> tuple:
+        """
+        Up to `per_page + 1` rows of the ordered `query` after `cursor_values`, and the total.
+
+        The total of the whole filtered set comes from the count cache or, like in `_paginate`,
+        from a `count(*) OVER ()` column: the window runs in a subquery over the unfiltered rows
+        and the keyset filter is applied outside it, so page and total share one round trip.
+        """
+        def after_cursor(columns):
+            return tuple_(*columns) < cursor_values if descending else tuple_(*columns) > cursor_values
+
+        total = count_cache.get(count_key) if with_total else None
+        if not with_total or total is not None:
+            return query.filter(after_cursor(sort_columns)).limit(per_page + 1).all(), total
+
+        counted = query.add_columns(func.count().over().label('total_count')).order_by(None).subquery()
+        sort_keys = [counted.c[f'sort_key_{index}'] for index in range(len(sort_columns))]
+        rows = (
+            self._session.query(counted)
+            .filter(after_cursor(sort_keys))
+            .order_by(*(key.desc() if descending else key.asc() for key in sort_keys))
+            .limit(per_page + 1)
+            .all()
+        )
+
+        if rows:
+            total = rows[0][-1]
+            count_cache.set(count_key, total)
+        else:
+            total = self._count(query, count_key)
+
+        return [tuple(row[:-1]) for row in rows], total
+
+    def get_recipe_cards_by_ids(self, recipe_ids: List[UUID],
+                                fieldset: Optional[AbstractSet[str]] = None) -> List[RecipeCard]:
+        """Load RecipeCards in the order of `recipe_ids`, limited to `fieldset` like `get_recipes_paginated`."""
+        if not recipe_ids:
+            return []
+
+        query = self._session.query(*self._card_columns(fieldset))
+        if fieldset is None or fieldset & CARD_STATS_COLUMNS:
+            query = query.join(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        rows = query.filter(Recipe.id.in_(recipe_ids)).all()
+
+        cards = self._attach_tags([RecipeCard(*row) for row in rows], self._tag_kinds(fieldset))
+        cards_by_id = {card.id: card for card in cards}
+        return [cards_by_id[recipe_id] for recipe_id in recipe_ids if recipe_id in cards_by_id]
+
+    @staticmethod
+    def _card_columns(fieldset: Optional[AbstractSet[str]]) -> tuple:
+        """
+        CARD_COLUMNS with the columns outside `fieldset` replaced by NULL literals, so RecipeCard
+        keeps its shape while the database reads only what the response shows.
+        """
+        if fieldset is None:
+            return CARD_COLUMNS
+
+        return tuple(
+            column if column.key in fieldset or column.key in CARD_KEY_COLUMNS else null().label(column.key)
+            for column in CARD_COLUMNS
+        )
+
+    @staticmethod
+    def _tag_kinds(fieldset: Optional[AbstractSet[str]]) -> tuple:
+        return TAG_KINDS if fieldset is None else tuple(kind for kind in TAG_KINDS if kind in fieldset)
+
+    def iter_recipe_exports(self, batch_size: int = 500) -> Iterator[List[RecipeExportRecord]]:
+        """
+        Stream every recipe as batches of RecipeExportRecords, oldest first.
+
+        Recipes are read through a server-side cursor (`stream_results` with `yield_per`),
+        so only one batch of rows is held in memory. Rows are plain column tuples, which
+        keeps the session's identity map empty however many recipes are exported. Steps,
+        ingredients and categories of each batch take two more SELECTs.
+        """
+        result = self._session.execute(
+            select(*EXPORT_COLUMNS)
+            .outerjoin(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+            .order_by(Recipe.created_at, Recipe.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+
+        for rows in result.partitions():
+            yield self._attach_steps(self._attach_tags([RecipeExportRecord(*row) for row in rows]))
+
+    def _attach_steps(self, records: List[RecipeExportRecord]) -> List[RecipeExportRecord]:
+        records_by_id = {record.id: record for record in records}
+        if not records_by_id:
+            return records
+
+        steps = self._session.execute(
+            select(RecipeStep.recipe_id, RecipeStep.id, RecipeStep.step_number, RecipeStep.description)
+            .where(RecipeStep.recipe_id.in_(list(records_by_id)))
+            .order_by(RecipeStep.recipe_id, RecipeStep.step_number)
+        )
+        for recipe_id, step_id, step_number, description in steps:
+            records_by_id[recipe_id].steps.append(
+                {'id': step_id, 'stepNumber': step_number, 'description': description}
             )
-            .outerjoin(Reviews, Reviews.recipe_id == Recipe.id)
-            .options(
-                joinedload(Recipe.recipe_categories).joinedload(RecipeCategory.category),
-                joinedload(Recipe.recipe_ingredients).joinedload(RecipeIngredient.ingredient),
+
+        return records
+
+    def _attach_tags(self, cards: List[RecipeCard], kinds: tuple = TAG_KINDS) -> List[RecipeCard]:
+        """
+        Fill ingredient and category id/name pairs of `cards` (RecipeCards or RecipeExportRecords)
+        with a single UNION ALL query. Only the `kinds` given are loaded; none means no query.
+        """
+        cards_by_id = {card.id: card for card in cards}
+        if not cards_by_id or not kinds:
+            return cards
+
+        selects = []
+        if 'ingredients' in kinds:
+            selects.append(
+                select(RecipeIngredient.recipe_id, literal('ingredients').label('kind'), Ingredient.id, Ingredient.name)
+                .join(Ingredient, Ingredient.id == RecipeIngredient.ingredient_id)
+                .where(RecipeIngredient.recipe_id.in_(list(cards_by_id)))
             )
+        if 'categories' in kinds:
+            selects.append(
+                select(RecipeCategory.recipe_id, literal('categories').label('kind'), Category.id, Category.name)
+                .join(Category, Category.id == RecipeCategory.category_id)
+                .where(RecipeCategory.recipe_id.in_(list(cards_by_id)))
+            )
+
+        statement = union_all(*selects) if len(selects) > 1 else selects[0]
+        for recipe_id, kind, item_id, name in self._session.execute(statement):
+            getattr(cards_by_id[recipe_id], kind).append({'id': item_id, 'name': name})
+
+        return cards
+
+    def filter_recipe_ids(self, recipe_ids: List[UUID], user_id: Optional[UUID] = None,
+                          category_ids: Optional[List[UUID]] = None, q: Optional[str] = None) -> set:
+        """Return the subset of `recipe_ids` matching the author, category and search filters."""
+        if not recipe_ids:
+            return set()
+
+        query = self._session.query(Recipe.id).filter(Recipe.id.in_(recipe_ids))
+        query = self._apply_filters(query, user_id, category_ids, None, 'or')
+        if q:
+            query, _ = self._apply_search(query, q)
+
+        return {recipe_id for recipe_id, in query}
+
+    def get_recipe_facets(
+            self,
+            facets: List[str],
+            user_id: Optional[UUID] = None,
+            category_ids: Optional[List[UUID]] = None,
+            ingredient_ids: Optional[List[UUID]] = None,
+            mode: str = 'or',
+            q: Optional[str] = None,
+            recipe_ids: Optional[List[UUID]] = None
+    ) -> dict:
+        """
+        Count recipes per category and/or ingredient over the same filtered set the list uses.
+
+        The filtered ids are a CTE shared by one GROUP BY branch per facet, combined with
+        UNION ALL, so all facets cost a single round trip. Returns
+        {facet: [{'id': ..., 'count': ...}, ...]} ordered by count.
+        """
+        base = self._apply_filters(self._session.query(Recipe.id), user_id, category_ids, ingredient_ids, mode,
+                                   recipe_ids)
+        if q:
+            base, _ = self._apply_search(base, q)
+        filtered = base.cte('filtered_recipes')
+
+        facet_columns = {
+            'categories': (RecipeCategory, RecipeCategory.category_id),
+            'ingredients': (RecipeIngredient, RecipeIngredient.ingredient_id),
+        }
+        branches = [
+            select(literal(facet).label('facet'), value_column.label('value_id'), func.count().label('recipe_count'))
+            .select_from(model)
+            .join(filtered, filtered.c.id == model.recipe_id)
+            .group_by(value_column)
+            for facet, (model, value_column) in facet_columns.items()
+            if facet in facets
+        ]
+
+        result = {facet: [] for facet in facets}
+        if not branches:
+            return result
+
+        statement = union_all(*branches) if len(branches) > 1 else branches[0]
+        for facet, value_id, recipe_count in self._session.execute(statement):
+            result[facet].append({'id': value_id, 'count': recipe_count})
+
+        for counts in result.values():
+            counts.sort(key=lambda item: (-item['count'], str(item['id'])))
+
+        return result
+
+    def get_autocomplete_entries(self) -> List[tuple]:
+        """(id, title, approved review count) of every recipe, for the autocomplete index."""
+        return (
+            self._session.query(Recipe.id, Recipe.title, func.coalesce(RecipeStats.review_count, 0))
+            .outerjoin(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+            .all()
         )
 
+    def get_recipe_ingredient_pairs(self) -> List[tuple]:
+        """(recipe_id, ingredient_id) pairs ordered by recipe (created_at, id), for the ingredient index."""
+        return (
+            self._session.query(RecipeIngredient.recipe_id, RecipeIngredient.ingredient_id)
+            .join(Recipe, Recipe.id == RecipeIngredient.recipe_id)
+            .order_by(Recipe.created_at, Recipe.id)
+            .all()
+        )
+
+    @staticmethod
+    def _apply_filters(query, user_id: Optional[UUID], category_ids: Optional[List[UUID]],
+                       ingredient_ids: Optional[List[UUID]], mode: str, recipe_ids: Optional[List[UUID]] = None):
+        if recipe_ids is not None:
+            query = query.filter(Recipe.id.in_(recipe_ids))
+            ingredient_ids = None
+
         if user_id:
             query = query.filter(Recipe.author_id == user_id)
 
         if category_ids:
-            query = query.join(RecipeCategory).filter(
-                RecipeCategory.category_id.in_(category_ids)
-            )
+            query = query.filter(Recipe.id.in_(
+                select(RecipeCategory.recipe_id).where(RecipeCategory.category_id.in_(category_ids))
+            ))
 
         if ingredient_ids:
-            query = query.join(RecipeIngredient).filter(
-                RecipeIngredient.ingredient_id.in_(ingredient_ids)
+            matching_recipes = (
+                select(RecipeIngredient.recipe_id)
+                .where(RecipeIngredient.ingredient_id.in_(ingredient_ids))
             )
 
             if mode == 'and':
-                query = query.group_by(Recipe.id).having(
+                matching_recipes = matching_recipes.group_by(RecipeIngredient.recipe_id).having(
                     func.count(func.distinct(RecipeIngredient.ingredient_id)) == len(ingredient_ids)
                 )
 
-        query = query.group_by(Recipe.id).order_by(Recipe.created_at.desc())
+            query = query.filter(Recipe.id.in_(matching_recipes))
 
-        total = query.count()
+        return query
 
-        items = query.offset((page - 1) * per_page).limit(per_page).all()
+    def _apply_search(self, query, q: str):
+        """
+        Filter by a free-text query. Returns the filtered query and the rank expression,
+        which is None when the database has no full-text support and LIKE is used instead.
+        """
+        if self._session.get_bind().dialect.name == 'postgresql':
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+            rank = func.ts_rank(Recipe.search_vector, ts_query, type_=db.Float)
+            return query.filter(Recipe.search_vector.op('@@')(ts_query)), rank
 
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
+        needle = q.lower()
+        return query.filter(or_(
+            func.lower(Recipe.title).contains(needle, autoescape=True),
+            func.lower(Recipe.description).contains(needle, autoescape=True),
+            Recipe.id.in_(
+                select(RecipeStep.recipe_id)
+                .where(func.lower(RecipeStep.description).contains(needle, autoescape=True))
+            ),
+        )), None
+
+    @staticmethod
+    def _sort_keys(search_rank=None, sort: Optional[str] = None) -> tuple[list, bool]:
+        """
+        Sort expressions with the Python type of their cursor values, and whether they descend.
+        The expressions match the column order of the index backing each ordering.
+        """
+        if sort == 'top_rated':
+            return [
+                (RecipeStats.average_rating, float),
+                (RecipeStats.review_count, int),
+                (RecipeStats.recipe_id, UUID),
+            ], True
+
+        if sort == 'most_reviewed':
+            return [(RecipeStats.review_count, int), (RecipeStats.recipe_id, UUID)], True
+
+        if sort == 'quickest':
+            return [(Recipe.duration, int), (Recipe.id, UUID)], False
+
+        sort_keys = [(Recipe.created_at, datetime), (Recipe.id, UUID)]
+        if search_rank is not None and sort is None:
+            sort_keys.insert(0, (search_rank, float))
+
+        return sort_keys, True
+
+    def find_missing_references(self, ingredient_ids: Iterable[UUID],
+                                category_ids: Iterable[UUID]) -> tuple[set, set]:
+        """Return the ingredient and category ids that don't exist, with one query per table."""
+        ingredient_ids, category_ids = set(ingredient_ids), set(category_ids)
+
+        if ingredient_ids:
+            ingredient_ids -= set(self._session.scalars(
+                select(Ingredient.id).where(Ingredient.id.in_(list(ingredient_ids)))
+            ))
+        if category_ids:
+            category_ids -= set(self._session.scalars(
+                select(Category.id).where(Category.id.in_(list(category_ids)))
+            ))
+
+        return ingredient_ids, category_ids
+
+    def bulk_insert_recipes(self, records: List[dict]) -> Dict[int, str]:
+        """
+        Insert a chunk of recipes with multi-row INSERTs and commit it.
+
+        Each record holds `recipe` (column values including a generated `id`), `steps`
+        (step_number/description dicts), `ingredient_ids` and `category_ids`. The chunk is
+        first written as a whole inside a savepoint; if the database rejects it, each
+        record is retried in its own savepoint so one bad row doesn't sink the others.
+
+        Returns the database error of every rejected record, keyed by its index in `records`.
+        """
+        if not records:
+            return {}
+
+        errors = {}
+        try:
+            with self._session.begin_nested():
+                self._insert_records(records)
+        except DBAPIError:
+            for index, record in enumerate(records):
+                try:
+                    with self._session.begin_nested():
+                        self._insert_records([record])
+                except DBAPIError as error:
+                    errors[index] = str(error.orig).splitlines()[0]
+
+        self._session.commit()
+        return errors
+
+    def _insert_records(self, records: List[dict]) -> None:
+        steps = [
+            {'recipe_id': record['recipe']['id'], 'step_number': step['step_number'],
+             'description': step['description']}
+            for record in records for step in record['steps']
+        ]
+        recipe_ingredients = [
+            {'recipe_id': record['recipe']['id'], 'ingredient_id': ingredient_id}
+            for record in records for ingredient_id in dict.fromkeys(record['ingredient_ids'])
+        ]
+        recipe_categories = [
+            {'recipe_id': record['recipe']['id'], 'category_id': category_id}
+            for record in records for category_id in dict.fromkeys(record['category_ids'])
+        ]
+
+        self._session.execute(insert(Recipe), [record['recipe'] for record in records])
+        self._session.execute(insert(RecipeStats), [{'recipe_id': record['recipe']['id']} for record in records])
+        for model, rows in ((RecipeStep, steps), (RecipeIngredient, recipe_ingredients),
+                            (RecipeCategory, recipe_categories)):
+            if rows:
+                self._session.execute(insert(model), rows)
 
     def update_steps(self, recipe, new_steps_data: list[dict]) -> None:
         existing_steps = {step.id: step for step in recipe.steps}
@@ -0,0 +1,62 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.extensions import db
+from backend.models import RecipeSignature
+from backend.repositories.base_repository import BaseRepository
+
+
+class RecipeSignatureRepository(BaseRepository[RecipeSignature]):
+    """
+    Stored MinHash signatures behind the similar-recipes index, one row per recipe
+    with ingredients. Rows go away with their recipe through the foreign key cascade.
+    """
+    INSERT_CHUNK_SIZE = 1000
+
+    def __init__(self):
+        super().__init__(db.session, RecipeSignature)
+
+    def get_all_packed(self) -> List[Tuple[UUID, bytes]]:
+        return self._session.query(RecipeSignature.recipe_id, RecipeSignature.signature).all()
+
+    def save(self, signatures: Dict[UUID, Optional[bytes]]) -> None:
+        """
+        Store packed signatures by recipe id in one transaction. A None signature (a recipe
+        without ingredients) drops the stored row instead.
+        """
+        dropped = [recipe_id for recipe_id, signature in signatures.items() if signature is None]
+        rows = [{'recipe_id': recipe_id, 'signature': signature}
+                for recipe_id, signature in signatures.items() if signature is not None]
+
+        if dropped:
+            self._session.execute(delete(RecipeSignature).where(RecipeSignature.recipe_id.in_(dropped)))
+        if rows:
+            dialect = postgresql if self._session.get_bind().dialect.name == 'postgresql' else sqlite
+            stmt = dialect.insert(RecipeSignature).values(rows)
+            self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[RecipeSignature.recipe_id],
+                    set_={'signature': stmt.excluded.signature},
+                )
+            )
+        self._session.commit()
+
+    def replace_all(self, rows: Iterable[Tuple[UUID, bytes]]) -> int:
+        """Replace every stored signature with `rows` in one transaction; returns the number stored."""
+        self._session.execute(delete(RecipeSignature))
+
+        stored, chunk = 0, []
+        for recipe_id, signature in rows:
+            chunk.append({'recipe_id': recipe_id, 'signature': signature})
+            if len(chunk) >= self.INSERT_CHUNK_SIZE:
+                self._session.execute(insert(RecipeSignature), chunk)
+                stored, chunk = stored + len(chunk), []
+        if chunk:
+            self._session.execute(insert(RecipeSignature), chunk)
+            stored += len(chunk)
+
+        self._session.commit()
+        return stored
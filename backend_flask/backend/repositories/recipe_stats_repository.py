@@ -0,0 +1,89 @@
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import case, cast, delete, false, func, insert, select, update
+
+from backend.extensions import db
+from backend.models import Recipe, RecipeStats, Reviews
+from backend.repositories.base_repository import BaseRepository
+from backend.repositories.review_status_registry import review_status_registry
+
+
+class RecipeStatsRepository(BaseRepository[RecipeStats]):
+    """
+    Precomputed rating aggregates of approved reviews, one row per recipe.
+
+    Write methods don't commit: they run inside the caller's transaction, so the
+    counters change together with the review that caused them.
+    """
+    def __init__(self):
+        super().__init__(db.session, RecipeStats)
+
+    def apply_review_delta(self, recipe_id: UUID, count_delta: int, rating_delta: int) -> None:
+        new_count = RecipeStats.review_count + count_delta
+        new_sum = RecipeStats.rating_sum + rating_delta
+
+        result = self._session.execute(
+            update(RecipeStats)
+            .where(RecipeStats.recipe_id == recipe_id)
+            .values(
+                review_count=new_count,
+                rating_sum=new_sum,
+                average_rating=self._average(new_sum, new_count),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount == 0:
+            self.recompute([recipe_id])
+
+    def recompute(self, recipe_ids: Iterable[UUID]) -> None:
+        recipe_ids = list(recipe_ids)
+        if not recipe_ids:
+            return
+
+        self._session.execute(
+            delete(RecipeStats)
+            .where(RecipeStats.recipe_id.in_(recipe_ids))
+            .execution_options(synchronize_session=False)
+        )
+        self._insert_from_reviews(Recipe.id.in_(recipe_ids))
+
+    def rebuild(self) -> int:
+        self._session.execute(delete(RecipeStats).execution_options(synchronize_session=False))
+        self._insert_from_reviews()
+        self._session.commit()
+
+        return self._session.query(func.count(RecipeStats.recipe_id)).scalar()
+
+    def _insert_from_reviews(self, *criteria) -> None:
+        approved_status_id = review_status_registry.get_id(self._session, 'approved')
+        is_approved = Reviews.status_id == approved_status_id if approved_status_id is not None else false()
+        approved = (
+            select(
+                Reviews.recipe_id,
+                func.count(Reviews.id).label('review_count'),
+                func.sum(Reviews.rating).label('rating_sum'),
+            )
+            .where(is_approved)
+            .group_by(Reviews.recipe_id)
+            .subquery()
+        )
+        review_count = func.coalesce(approved.c.review_count, 0)
+        rating_sum = func.coalesce(approved.c.rating_sum, 0)
+
+        self._session.execute(
+            insert(RecipeStats).from_select(
+                ['recipe_id', 'review_count', 'rating_sum', 'average_rating'],
+                select(Recipe.id, review_count, rating_sum, self._average(rating_sum, review_count))
+                .outerjoin(approved, approved.c.recipe_id == Recipe.id)
+                .where(*criteria)
+            )
+        )
+
+    @staticmethod
+    def _average(rating_sum, review_count):
+        return case(
+            (review_count > 0, cast(rating_sum, db.Float) / review_count),
+            else_=0.0
+        )
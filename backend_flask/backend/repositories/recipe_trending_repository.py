@@ -0,0 +1,99 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, false, insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.extensions import db
+from backend.helpers import TrendingScore
+from backend.models import RecipeTrending, Reviews
+from backend.repositories.base_repository import BaseRepository
+from backend.repositories.review_status_registry import review_status_registry
+
+
+class RecipeTrendingRepository(BaseRepository[RecipeTrending]):
+    """
+    Trending amplitudes per recipe (see TrendingScore), the durable copy of the Redis
+    trending set and the fallback when Redis is unavailable.
+
+    `add` and `add_many` don't commit: they run inside the review write that caused them.
+    """
+    INSERT_CHUNK_SIZE = 1000
+
+    def __init__(self):
+        super().__init__(db.session, RecipeTrending)
+
+    def add(self, recipe_id: UUID, delta: float) -> None:
+        self.add_many({recipe_id: delta})
+
+    def add_many(self, deltas: Dict[UUID, float]) -> None:
+        """Add the score delta of every recipe in `deltas` with a single multi-row upsert."""
+        if not deltas:
+            return
+
+        dialect = postgresql if self._session.get_bind().dialect.name == 'postgresql' else sqlite
+        stmt = dialect.insert(RecipeTrending).values(
+            [{'recipe_id': recipe_id, 'score': delta} for recipe_id, delta in deltas.items()]
+        )
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RecipeTrending.recipe_id],
+                set_={'score': RecipeTrending.score + stmt.excluded.score},
+            )
+        )
+
+    def get_score(self, recipe_id: UUID) -> float:
+        score = self._session.execute(
+            select(RecipeTrending.score).where(RecipeTrending.recipe_id == recipe_id)
+        ).scalar()
+
+        return score or 0.0
+
+    def get_scores(self, recipe_ids: Iterable[UUID]) -> Dict[UUID, float]:
+        """Scores of `recipe_ids`; recipes without a trending row score 0."""
+        recipe_ids = list(recipe_ids)
+        scores = dict.fromkeys(recipe_ids, 0.0)
+        if recipe_ids:
+            scores.update(self._session.execute(
+                select(RecipeTrending.recipe_id, RecipeTrending.score).where(RecipeTrending.recipe_id.in_(recipe_ids))
+            ).all())
+
+        return scores
+
+    def get_all_scores(self) -> List[Tuple[UUID, float]]:
+        return self._session.execute(
+            select(RecipeTrending.recipe_id, RecipeTrending.score).where(RecipeTrending.score > 0)
+        ).all()
+
+    def get_page(self, limit: int, after: Optional[Tuple[float, UUID]] = None) -> List[Tuple[UUID, float]]:
+        """Up to `limit` (recipe_id, score) pairs by descending score, continuing after the (score, id) key."""
+        query = select(RecipeTrending.recipe_id, RecipeTrending.score).where(RecipeTrending.score > 0)
+        if after is not None:
+            query = query.where(tuple_(RecipeTrending.score, RecipeTrending.recipe_id) < after)
+
+        return self._session.execute(
+            query.order_by(RecipeTrending.score.desc(), RecipeTrending.recipe_id.desc()).limit(limit)
+        ).all()
+
+    def rebuild(self, half_life_hours: float) -> int:
+        """Recompute every amplitude from approved reviews; returns the number of trending recipes."""
+        approved_status_id = review_status_registry.get_id(self._session, 'approved')
+        is_approved = Reviews.status_id == approved_status_id if approved_status_id is not None else false()
+        approved = self._session.execute(
+            select(Reviews.recipe_id, Reviews.rating, Reviews.created_at)
+            .where(is_approved)
+            .execution_options(yield_per=self.INSERT_CHUNK_SIZE)
+        )
+
+        scores = defaultdict(float)
+        for recipe_id, rating, created_at in approved:
+            scores[recipe_id] += TrendingScore.contribution(rating, created_at, half_life_hours)
+
+        self._session.execute(delete(RecipeTrending).execution_options(synchronize_session=False))
+        rows = [{'recipe_id': recipe_id, 'score': score} for recipe_id, score in scores.items()]
+        for start in range(0, len(rows), self.INSERT_CHUNK_SIZE):
+            self._session.execute(insert(RecipeTrending), rows[start:start + self.INSERT_CHUNK_SIZE])
+        self._session.commit()
+
+        return len(rows)
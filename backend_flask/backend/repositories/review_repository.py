@@ -1,8 +1,16 @@
+from datetime import datetime
+from typing import AbstractSet, Dict, List, Optional
 from uuid import UUID
+
+from sqlalchemy import delete, tuple_, update
+from sqlalchemy.orm import Query, selectinload
+
 from backend import db
-from backend.models import Reviews, ReviewStatus
+from backend.models import Recipe, Reviews, User
+from backend.pagination.cursor import CursorCodec
 from backend.pagination.paginated_result import PaginatedResult
 from backend.repositories.base_repository import BaseRepository
+from backend.repositories.review_status_registry import review_status_registry
 
 
 class ReviewRepository(BaseRepository[Reviews]):
@@ -30,91 +38,156 @@ class ReviewRepository(BaseRepository[Reviews]):
         )
         return review is not None
 
+    def get_review_flags(self, user_id: UUID, recipe_ids: List[UUID]) -> Dict[UUID, bool]:
+        """
+        Map each recipe in `recipe_ids` the user has reviewed to whether that review is approved,
+        with one query over the (user_id, recipe_id) unique index. Unreviewed recipes are left out.
+        """
+        if not recipe_ids:
+            return {}
+
+        approved_status_id = self.get_approve_status_id()
+        rows = (
+            self._session.query(self._model.recipe_id, self._model.status_id)
+            .filter(self._model.user_id == user_id, self._model.recipe_id.in_(recipe_ids))
+            .all()
+        )
+        return {recipe_id: status_id == approved_status_id for recipe_id, status_id in rows}
+
     def has_approved_review(self, user_id: UUID, recipe_id: UUID) -> bool:
+        approved_status_id = self.get_approve_status_id()
+        if approved_status_id is None:
+            return False
+
         return (
                 self._session.query(self._model)
-                .join(ReviewStatus, ReviewStatus.id == self._model.status_id)
                 .filter(
                     self._model.user_id == user_id,
                     self._model.recipe_id == recipe_id,
-                    db.func.lower(ReviewStatus.name) == 'approved'
+                    self._model.status_id == approved_status_id
                 )
                 .first() is not None
         )
 
-    def get_reviews_by_recipe(self, recipe_id: UUID, page: int = 1, per_page: int = 10) -> PaginatedResult:
-        approved_status = (
-            self._session.query(ReviewStatus)
-            .filter(db.func.lower(ReviewStatus.name) == 'approved')
-            .first()
+    def get_reviews_by_recipe(self, recipe_id: UUID, page: int = 1, per_page: int = 10,
+                              with_total: bool = True, fieldset: Optional[AbstractSet[str]] = None,
+                              cursor: Optional[str] = None) -> PaginatedResult:
+        """
+        Approved reviews of a recipe, newest first; served by the ix_reviews_recipe_feed index.
+
+        The total is always counted: this feed is served with revision-based ETags, and a total
+        from the per-process count cache could be older than the revision it is tagged with.
+        """
+        approved_status_id = self.get_approve_status_id()
+        if approved_status_id is None:
+            return PaginatedResult(items=[], total=0 if with_total else None,
+                                   page=None if cursor else page, per_page=per_page)
+
+        query = self._session.query(self._model).filter(
+            self._model.recipe_id == recipe_id,
+            self._model.status_id == approved_status_id,
         )
 
-        if not approved_status:
-            return PaginatedResult(items=[], total=0, page=page, per_page=per_page)
+        return self._feed_page(query, page, per_page, with_total, fieldset, cursor, count_key=None)
+
+    def get_pending_reviews(self, page: int = 1, per_page: int = 10, with_total: bool = True,
+                            fieldset: Optional[AbstractSet[str]] = None,
+                            cursor: Optional[str] = None) -> PaginatedResult:
+        """The moderation queue, newest first; served by the ix_reviews_status_feed index."""
+        pending_status_id = self.get_pending_status_id()
+        if pending_status_id is None:
+            return PaginatedResult(items=[], total=0 if with_total else None,
+                                   page=None if cursor else page, per_page=per_page)
+
+        query = self._session.query(self._model).filter(self._model.status_id == pending_status_id)
+
+        return self._feed_page(query, page, per_page, with_total, fieldset, cursor, count_key=('pending_reviews',))
+
+    def _feed_page(self, query: Query, page: int, per_page: int, with_total: bool,
+                   fieldset: Optional[AbstractSet[str]], cursor: Optional[str],
+                   count_key: Optional[tuple]) -> PaginatedResult:
+        """
+        One page of a review feed ordered by (created_at, id), newest first.
+
+        With a `cursor` (the `nextCursor` of a previous page) the page continues right after
+        it with a keyset filter instead of an OFFSET, so deep pages cost as much as the first.
+        Page-number pages carry a `nextCursor` too, so clients can switch to keyset mode.
+        """
+        sort_columns = (self._model.created_at, self._model.id)
+        query = query.options(*self._sparse_options(fieldset)).order_by(*(column.desc() for column in sort_columns))
+
+        if cursor:
+            total = self._count(query, count_key) if with_total else None
+
+            query = query.filter(tuple_(*sort_columns) < CursorCodec.decode(cursor, datetime, UUID))
+            rows = query.limit(per_page + 1).all()
+            result = PaginatedResult(items=rows[:per_page], total=total, page=None, per_page=per_page)
+            has_next = len(rows) > per_page
+        else:
+            result = self._paginate(query, page, per_page, with_total=with_total, count_key=count_key)
+            has_next = result.has_next
+
+        if has_next and result.items:
+            result.next_cursor = CursorCodec.encode(result.items[-1].created_at, result.items[-1].id)
+
+        return result
+
+    def _sparse_options(self, fieldset: Optional[AbstractSet[str]]) -> list:
+        """
+        Loader options for review lists limited to the ReviewSchema attributes in `fieldset`:
+        the review columns given (and created_at, which cursors are built from), and the author
+        (just the columns the list shows) only if requested.
+        """
+        if fieldset is None:
+            return []
+        if 'user' not in fieldset:
+            return self._load_only(fieldset | {'created_at'})
+
+        return [
+            *self._load_only(fieldset | {'created_at', 'user_id'}),
+            selectinload(self._model.user).load_only(User.id, User.username, User.avatar_url),
+        ]
+
+    def get_for_moderation(self, review_ids: List[UUID]) -> List[Reviews]:
+        """
+        The reviews in `review_ids`, locked until the transaction ends, with their recipes'
+        category and ingredient links (for list cache tags) loaded in two more queries.
+        """
+        if not review_ids:
+            return []
 
-        query = (
+        return (
             self._session.query(self._model)
-            .filter(
-                self._model.recipe_id == recipe_id,
-                self._model.status_id == approved_status.id,
+            .filter(self._model.id.in_(review_ids))
+            .options(
+                selectinload(self._model.recipe).selectinload(Recipe.recipe_categories),
+                selectinload(self._model.recipe).selectinload(Recipe.recipe_ingredients),
             )
-            .order_by(self._model.created_at.desc())
-        )
-
-        total = query.count()
-        items = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
-
-    def get_pending_reviews(self, page: int = 1, per_page: int = 10) -> PaginatedResult:
-        pending_status = (
-            self._session.query(ReviewStatus)
-            .filter(db.func.lower(ReviewStatus.name) == 'pending')
-            .first()
+            .with_for_update(of=self._model)
+            .all()
         )
 
-        if not pending_status:
-            return PaginatedResult(items=[], total=0, page=page, per_page=per_page)
-
-        query = (
-            self._session.query(self._model)
-            .filter(self._model.status_id == pending_status.id)
-            .order_by(self._model.created_at.desc())
-        )
-
-        total = query.count()
-        items = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
+    def moderate(self, approve_ids: List[UUID], reject_ids: List[UUID], approved_status_id: UUID) -> None:
+        """
+        Approve and delete reviews with one UPDATE and one DELETE. Doesn't commit, so the
+        caller can update the rating aggregates in the same transaction.
+        """
+        if approve_ids:
+            self._session.execute(
+                update(self._model)
+                .where(self._model.id.in_(approve_ids))
+                .values(status_id=approved_status_id)
+                .execution_options(synchronize_session=False)
+            )
+        if reject_ids:
+            self._session.execute(
+                delete(self._model)
+                .where(self._model.id.in_(reject_ids))
+                .execution_options(synchronize_session=False)
+            )
 
     def get_pending_status_id(self) -> UUID | None:
-        pending_status = (
-            self._session.query(ReviewStatus)
-            .filter(db.func.lower(ReviewStatus.name) == 'pending')
-            .first()
-        )
-        if pending_status:
-            return pending_status.id
-
-        return None
+        return review_status_registry.get_id(self._session, 'pending')
 
     def get_approve_status_id(self) -> UUID | None:
-        pending_status = (
-            self._session.query(ReviewStatus)
-            .filter(db.func.lower(ReviewStatus.name) == 'approved')
-            .first()
-        )
-        if pending_status:
-            return pending_status.id
-
-        return None
\ No newline at end of file
+        return review_status_registry.get_id(self._session, 'approved')
@@ -0,0 +1,43 @@
+from threading import Lock
+from typing import Dict, Optional
+from uuid import UUID
+
+from flask_sqlalchemy.session import Session
+
+from backend.models import ReviewStatus
+
+
+class ReviewStatusRegistry:
+    """
+    Per-process map of review status names (lowercased) to their ids.
+
+    Statuses are a handful of rows that practically never change, so they are read
+    once instead of being looked up by `lower(name)` on every review query. Asking
+    for a name the registry doesn't know reloads it, which picks up statuses added
+    after the first load; `clear()` forces a reload on the next lookup.
+    """
+
+    def __init__(self):
+        self._ids: Optional[Dict[str, UUID]] = None
+        self._lock = Lock()
+
+    def get_id(self, session: Session, name: str) -> Optional[UUID]:
+        ids = self._ids
+        if ids is None or name.lower() not in ids:
+            ids = self.refresh(session)
+
+        return ids.get(name.lower())
+
+    def refresh(self, session: Session) -> Dict[str, UUID]:
+        with self._lock:
+            # Lowest id last, so it wins over duplicate names
+            rows = session.query(ReviewStatus.id, ReviewStatus.name).order_by(ReviewStatus.id.desc()).all()
+            self._ids = {name.lower(): status_id for status_id, name in rows}
+            return self._ids
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids = None
+
+
+review_status_registry = ReviewStatusRegistry()
@@ -0,0 +1,72 @@
+from typing import Dict, Iterable
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.extensions import db
+from backend.models import EntityRevision
+from backend.repositories.base_repository import BaseRepository
+
+
+class RevisionScope:
+    """
+    Names of the revision counters behind conditional GETs. A scope is bumped by
+    every write that changes a response built from it.
+    """
+    CATEGORIES = 'categories'
+    INGREDIENTS = 'ingredients'
+    USERS = 'users'
+    # Bumped by every recipe write; in-process recipe indexes compare it to spot writes of other workers
+    RECIPES = 'recipes'
+
+    @staticmethod
+    def recipe(recipe_id: UUID) -> str:
+        return f'recipe:{recipe_id}'
+
+    @staticmethod
+    def recipe_reviews(recipe_id: UUID) -> str:
+        return f'recipe-reviews:{recipe_id}'
+
+
+class RevisionRepository(BaseRepository[EntityRevision]):
+    """
+    Monotonic per-scope revision counters used as ETag version stamps.
+
+    `bump` doesn't commit: it runs inside the caller's transaction, so the revision
+    changes together with the data it stamps, and returns the new revision of every scope.
+    Scopes that were never bumped are at 0.
+    """
+    def __init__(self):
+        super().__init__(db.session, EntityRevision)
+
+    def get_revisions(self, scopes: Iterable[str]) -> Dict[str, int]:
+        scopes = list(scopes)
+        revisions = dict.fromkeys(scopes, 0)
+        if not scopes:
+            return revisions
+
+        rows = (
+            self._session.query(EntityRevision.scope, EntityRevision.revision)
+            .filter(EntityRevision.scope.in_(scopes))
+            .all()
+        )
+        revisions.update(rows)
+        return revisions
+
+    def get_revision(self, scope: str) -> int:
+        return self.get_revisions([scope])[scope]
+
+    def bump(self, *scopes: str) -> Dict[str, int]:
+        scopes = sorted(set(scopes))
+        if not scopes:
+            return {}
+
+        dialect = postgresql if self._session.get_bind().dialect.name == 'postgresql' else sqlite
+        stmt = dialect.insert(EntityRevision).values([{'scope': scope, 'revision': 1} for scope in scopes])
+        rows = self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[EntityRevision.scope],
+                set_={'revision': EntityRevision.revision + 1},
+            ).returning(EntityRevision.scope, EntityRevision.revision)
+        )
+        return dict(rows.all())
@@ -1,3 +1,4 @@
+from typing import AbstractSet, Optional
 from uuid import UUID
 
 from backend.extensions import db
@@ -9,6 +10,10 @@ class UserRepository(BaseRepository[User]):
     def __init__(self):
         super().__init__(db.session, User)
 
+    def get_sparse_by_id(self, user_id: UUID, fieldset: AbstractSet[str]) -> Optional[User]:
+        """The user with only the columns in `fieldset` (and the id) loaded."""
+        return self._session.get(self._model, user_id, options=self._load_only(fieldset))
+
     def is_username_exist(self, username: str, exclude_id: UUID = None) -> bool:
         query = self._session.query(self._model).filter(
             self._model.username == username
@@ -1,3 +1,4 @@
+from .autocomplete_routes import autocomplete_namespace
 from .auth_routes import auth_namespace
 from .category_routes import category_namespace
 from .ingredient_routes import ingredient_namespace
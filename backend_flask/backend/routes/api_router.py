@@ -2,7 +2,7 @@ from flask_restx import Api
 
 from backend.routes import (ingredient_namespace, category_namespace,
                             user_namespace, auth_namespace, review_namespace,
-                            recipe_namespace)
+                            recipe_namespace, autocomplete_namespace)
 
 
 class APIRouter:
@@ -13,4 +13,5 @@ class APIRouter:
         api.add_namespace(user_namespace, path='/api/users')
         api.add_namespace(auth_namespace, path='/api/auth')
         api.add_namespace(review_namespace, path='/api/reviews')
-        api.add_namespace(recipe_namespace, path='/api/recipes')
\ No newline at end of file
+        api.add_namespace(recipe_namespace, path='/api/recipes')
+        api.add_namespace(autocomplete_namespace, path='/api/autocomplete')
\ No newline at end of file
@@ -0,0 +1,20 @@
+from flask import request
+from flask_restx import Namespace, Resource
+from injector import inject
+
+from backend.schemas import autocomplete_schema
+from backend.service.autocomplete_service import AutocompleteService
+
+autocomplete_namespace = Namespace('Autocomplete', description='Search box suggestions')
+
+
+@autocomplete_namespace.route('/')
+class Autocomplete(Resource):
+    @inject
+    def __init__(self, autocomplete_service: AutocompleteService, **kwargs):
+        super().__init__(**kwargs)
+        self._autocomplete_service = autocomplete_service
+
+    def get(self):
+        data = autocomplete_schema.load(request.args.to_dict())
+        return self._autocomplete_service.suggest(data['q'], data['limit']), 200
@@ -2,9 +2,11 @@ from flask import request
 from flask_restx import Namespace, Resource
 from injector import inject
 
+from backend.decorators.conditional_get import conditional_get
 from backend.decorators.jwt_required_custom import jwt_required_custom
 from backend.decorators.role_required import role_required
 from backend.decorators.valid_image import validate_image_file
+from backend.repositories import RevisionScope
 from backend.schemas import category_schema
 from backend.service import CategoryService
 
@@ -18,6 +20,7 @@ class CategoryList(Resource):
         super().__init__(**kwargs)
         self._category_service = category_service
 
+    @conditional_get(lambda: [RevisionScope.CATEGORIES])
     def get(self):
         categories = self._category_service.get_all()
         return categories, 200
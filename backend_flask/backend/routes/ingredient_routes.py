@@ -3,9 +3,11 @@ from flask import request
 from flask_restx import Namespace, Resource
 from injector import inject
 
+from backend.decorators.conditional_get import conditional_get
 from backend.decorators.jwt_required_custom import jwt_required_custom
 from backend.decorators.role_required import role_required
 from backend.decorators.valid_image import validate_image_file
+from backend.repositories import RevisionScope
 from backend.schemas import ingredient_schema
 from backend.service.ingredient_service import IngredientsService
 
@@ -19,6 +21,7 @@ class IngredientList(Resource):
         super().__init__(**kwargs)
         self._ingredient_service = ingredient_service
 
+    @conditional_get(lambda: [RevisionScope.INGREDIENTS])
     def get(self):
         ingredients = self._ingredient_service.get_all()
         return ingredients, 200
@@ -1,13 +1,18 @@
 from json import loads
 from uuid import UUID
 
-from flask import request
+from flask import Response, request, stream_with_context
 from flask_restx import Resource, Namespace
 from injector import inject
 
+from backend.decorators.conditional_get import conditional_get
 from backend.decorators.jwt_required_custom import jwt_required_custom
+from backend.decorators.role_required import role_required
 from backend.decorators.valid_image import validate_image_file
-from backend.schemas import recipe_filter_schema, recipe_create_schema
+from backend.repositories import RevisionScope
+from backend.schemas import (recipe_filter_schema, recipe_create_schema, recipe_viewer_context_schema,
+                             recipe_similar_schema, recipe_trending_schema, recipe_batch_schema,
+                             recipe_detail_fields_schema)
 from backend.service.recipe_service import RecipeService
 
 recipe_namespace = Namespace('Recipe', description='Recipe related operations')
@@ -27,7 +32,7 @@ class RecipeList(Resource):
             if key in request.args:
                 args[key] = request.args.getlist(key)
 
-            filters = recipe_filter_schema.load(args)
+        filters = recipe_filter_schema.load(args)
 
         recipes = self._recipe_service.get_recipes(filters)
         return recipes, 200
@@ -55,6 +60,88 @@ class RecipeList(Resource):
         return recipe, 201
 
 
+@recipe_namespace.route('/cache-stats/')
+class RecipeListCacheStats(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    @jwt_required_custom()
+    @role_required(['Admin'])
+    def get(self):
+        return self._recipe_service.get_list_cache_stats(), 200
+
+
+@recipe_namespace.route('/export/')
+class RecipeExport(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    @jwt_required_custom()
+    @role_required(['Admin'])
+    def get(self):
+        return Response(
+            stream_with_context(self._recipe_service.export_recipes()),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': 'attachment; filename=recipes.ndjson'},
+        )
+
+
+@recipe_namespace.route('/import/')
+class RecipeImport(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    @jwt_required_custom()
+    @role_required(['Admin'])
+    def post(self):
+        report = self._recipe_service.import_recipes(request.stream)
+        return report, 200
+
+
+@recipe_namespace.route('/batch/')
+class RecipeBatch(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    def get(self):
+        ids = [value for raw in request.args.getlist('ids') for value in raw.split(',') if value]
+        data = recipe_batch_schema.load({'ids': ids, 'fields': request.args.get('fields', '')})
+        return self._recipe_service.get_recipes_batch(data['ids'], data['fieldset']), 200
+
+
+@recipe_namespace.route('/trending/')
+class TrendingRecipes(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    def get(self):
+        data = recipe_trending_schema.load(request.args.to_dict())
+        return self._recipe_service.get_trending_recipes(data['per_page'], data['cursor']), 200
+
+
+@recipe_namespace.route('/viewer-context/')
+class RecipeViewerContext(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    @jwt_required_custom()
+    def post(self):
+        data = recipe_viewer_context_schema.load(request.get_json())
+        return self._recipe_service.get_viewer_context(data['recipe_ids']), 200
+
+
 @recipe_namespace.route('/<uuid:recipe_id>/')
 class RecipeDetail(Resource):
     @inject
@@ -63,9 +150,12 @@ class RecipeDetail(Resource):
         self._recipe_service = recipe_service
 
     @jwt_required_custom(optional=True)
+    @conditional_get(lambda recipe_id: [RevisionScope.recipe(recipe_id), RevisionScope.recipe_reviews(recipe_id),
+                                        RevisionScope.USERS, RevisionScope.CATEGORIES, RevisionScope.INGREDIENTS],
+                     per_viewer=True)
     def get(self, recipe_id: UUID):
-
-        recipe = self._recipe_service.get_recipe_by_id(recipe_id)
+        data = recipe_detail_fields_schema.load(request.args.to_dict())
+        recipe = self._recipe_service.get_recipe_by_id(recipe_id, data['fieldset'])
 
         return recipe, 200,
 
@@ -91,4 +181,16 @@ class RecipeDetail(Resource):
     @jwt_required_custom()
     def delete(self, recipe_id: UUID):
         self._recipe_service.delete(recipe_id)
-        return 204
\ No newline at end of file
+        return 204
+
+
+@recipe_namespace.route('/<uuid:recipe_id>/similar/')
+class SimilarRecipes(Resource):
+    @inject
+    def __init__(self, recipe_service: RecipeService, **kwargs):
+        super().__init__(**kwargs)
+        self._recipe_service = recipe_service
+
+    def get(self, recipe_id: UUID):
+        data = recipe_similar_schema.load(request.args.to_dict())
+        return self._recipe_service.get_similar_recipes(recipe_id, data['limit']), 200
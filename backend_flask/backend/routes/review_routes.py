@@ -4,10 +4,11 @@ from flask import request
 from flask_restx import Resource, Namespace
 from injector import inject
 
+from backend.decorators.conditional_get import conditional_get
 from backend.decorators.jwt_required_custom import jwt_required_custom
 from backend.decorators.role_required import role_required
-from backend.pagination.pagination_schema import pagination_schema
-from backend.schemas import review_schema, review_update_schema
+from backend.repositories import RevisionScope
+from backend.schemas import review_schema, review_update_schema, review_list_query_schema, review_moderation_schema
 from backend.service.review_service import ReviewService
 
 review_namespace = Namespace('Review', description='Review related options')
@@ -53,11 +54,14 @@ class ReviewByRecipeResource(Resource):
         super().__init__(**kwargs)
         self._service = service
 
+    @conditional_get(lambda id: [RevisionScope.recipe_reviews(id), RevisionScope.USERS])
     def get(self, id: UUID):
-        data = pagination_schema.load(request.args.to_dict())
+        data = review_list_query_schema.load(request.args.to_dict())
         page = data.get('page', 1)
         per_page = data.get('per_page', 10)
-        reviews = self._service.get_reviews_by_recipe(id, page, per_page)
+        with_total = data.get('with_total', True)
+        reviews = self._service.get_reviews_by_recipe(id, page, per_page, with_total, data['fieldset'],
+                                                      data['cursor'])
         return reviews, 200
 
 
@@ -71,10 +75,11 @@ class PendingReviewsResource(Resource):
     @jwt_required_custom()
     @role_required(['Admin'])
     def get(self):
-        data = pagination_schema.load(request.args.to_dict())
+        data = review_list_query_schema.load(request.args.to_dict())
         page = data.get('page', 1)
         per_page = data.get('per_page', 10)
-        reviews = self._service.get_pending_reviews(page, per_page)
+        with_total = data.get('with_total', True)
+        reviews = self._service.get_pending_reviews(page, per_page, with_total, data['fieldset'], data['cursor'])
         return reviews, 200
 
 
@@ -89,4 +94,18 @@ class ApproveReviewResource(Resource):
     @role_required(['Admin'])
     def patch(self, id: UUID):
         self._service.approve_review(id)
-        return {'message': 'Review approved successfully'}, 200
\ No newline at end of file
+        return {'message': 'Review approved successfully'}, 200
+
+
+@review_namespace.route('/moderate/')
+class ModerateReviewsResource(Resource):
+    @inject
+    def __init__(self, service: ReviewService, **kwargs):
+        super().__init__(**kwargs)
+        self._service = service
+
+    @jwt_required_custom()
+    @role_required(['Admin'])
+    def post(self):
+        data = review_moderation_schema.load(request.get_json())
+        return self._service.moderate_reviews(data['decisions']), 200
@@ -6,7 +6,7 @@ from injector import inject
 from backend.decorators.jwt_required_custom import jwt_required_custom
 from backend.decorators.valid_image import validate_image_file
 from backend.extensions import limiter
-from backend.schemas import user_update_schema
+from backend.schemas import user_update_schema, user_detail_fields_schema
 from backend.service.user_service import UserService
 
 user_namespace = Namespace('User', description='User operations')
@@ -20,7 +20,8 @@ class UserDetail(Resource):
         self._user_service = user_service
 
     def get(self, user_id):
-        user = self._user_service.get_by_id(user_id)
+        data = user_detail_fields_schema.load(request.args.to_dict())
+        user = self._user_service.get_by_id(user_id, data['fieldset'])
         return user, 200
 
     @jwt_required_custom()
@@ -48,5 +49,6 @@ class UserMe(Resource):
     @jwt_required_custom()
     def get(self):
         user_id = get_jwt_identity()
-        user = self._user_service.get_by_id(user_id)
+        data = user_detail_fields_schema.load(request.args.to_dict())
+        user = self._user_service.get_by_id(user_id, data['fieldset'])
         return user, 200
\ No newline at end of file
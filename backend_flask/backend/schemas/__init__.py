@@ -1,13 +1,24 @@
 from .category_schema import categories_schema, category_schema
 from .ingredient_schema import ingredients_schema, ingredient_schema
+from .autocomplete_schema import autocomplete_schema
 from .users_schema.user_update_schema import user_update_schema
-from .users_schema.user_detail_schema import user_detail_schema
+from .users_schema.user_detail_schema import user_detail_schema, user_detail_fields_schema
 from .review_schemas.review_schema import review_list_schema, review_schema
 from .review_schemas.review_update_schema import review_update_schema
+from .review_schemas.review_list_query_schema import review_list_query_schema
+from .review_schemas.review_moderation_schema import review_moderation_schema
 from .recipes.recipe_filter_schema import recipe_filter_schema
 from .recipes.recipe_list_schema import recipe_list_schema
+from .recipes.recipe_detail_schema import recipe_detail_fields_schema
 from .recipes.recipe_create_schema import recipe_create_schema
+from .recipes.recipe_viewer_context_schema import recipe_viewer_context_schema
+from .recipes.recipe_batch_schema import recipe_batch_schema
+from .recipes.recipe_similar_schema import recipe_similar_schema
+from .recipes.recipe_trending_schema import recipe_trending_schema
 from .recipes.recipe_filter_schema import recipe_filter_schema
 from .auth.login_schema import login_schema
 from .auth.user_create_schema import user_create_schema
-from .auth.change_password import change_password_schema
\ No newline at end of file
+from .auth.change_password import change_password_schema
+from .serializers import (recipe_list_serializer, recipe_detail_serializer, recipe_export_serializer,
+                          review_serializer, review_list_serializer, category_serializer, categories_serializer,
+                          ingredient_serializer, ingredients_serializer)
@@ -0,0 +1,25 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+
+class AutocompleteSchema(Schema):
+    q = fields.String(required=True)
+    limit = fields.Integer(load_default=10)
+
+    @validates('q')
+    def validate_q(self, q: str, **kwargs) -> str:
+        if not q.strip():
+            raise ValidationError('Query must not be empty')
+        if len(q) > 100:
+            raise ValidationError('Query must be at most 100 characters')
+
+        return q
+
+    @validates('limit')
+    def validate_limit(self, limit: int, **kwargs) -> int:
+        if limit < 1 or limit > 20:
+            raise ValidationError('Limit must be between 1 and 20')
+
+        return limit
+
+
+autocomplete_schema = AutocompleteSchema()
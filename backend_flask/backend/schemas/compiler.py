@@ -0,0 +1,144 @@
+from typing import Any, Callable, Optional
+
+from marshmallow import Schema, fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+
+_ISO_FORMATS = (None, 'iso', 'iso8601')
+
+
+class CompiledSchema:
+    """
+    Drop-in `dump` for a marshmallow schema backed by a generated function.
+
+    The function is produced once by `compile_schema` and inlines attribute access and
+    the formatting of every supported field, so dumping skips marshmallow's per-field
+    dispatch. Fields the compiler does not know are still serialized by their own
+    marshmallow `serialize`, and schemas with dump hooks or a custom `get_attribute`
+    are not compiled at all (`compiled` is False and `dump` is the schema's own).
+    """
+
+    def __init__(self, schema: Schema, dump_one: Optional[Callable[[Any], dict]]):
+        self.schema = schema
+        self.compiled = dump_one is not None
+        self._dump_one = dump_one
+
+    def dump(self, obj: Any, *, many: Optional[bool] = None):
+        many = self.schema.many if many is None else bool(many)
+        if not self.compiled:
+            return self.schema.dump(obj, many=many)
+
+        if many:
+            return None if obj is None else [self._dump_one(item) for item in obj]
+        return self._dump_one(obj)
+
+
+class _Compiler:
+    def __init__(self):
+        self.namespace = {'missing': missing}
+        self.counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f'_{prefix}_{self.counter}'
+
+    def _bind(self, prefix: str, value: Any) -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def compile(self, schema: Schema) -> Optional[str]:
+        """Emit a dump function for one object of `schema` and return its name, or None."""
+        if not _is_compilable(schema):
+            return None
+
+        function_name = self._name('dump')
+        fallback = self._bind('fallback', lambda obj: schema.dump(obj, many=False))
+        lines = [
+            f'def {function_name}(obj):',
+            # Mapping-like objects go through marshmallow, which tries obj[key] before getattr
+            f"    if hasattr(obj, '__getitem__'):",
+            f'        return {fallback}(obj)',
+            f'    ret = {{}}',
+        ]
+
+        for attr_name, field in schema.dump_fields.items():
+            key = field.data_key if field.data_key is not None else attr_name
+            source = field.attribute if field.attribute is not None else attr_name
+            expression = self._expression(field, 'value', depth=0)
+
+            if expression is None or '.' in source or field.dump_default is not missing:
+                serialize = self._bind('serialize', field.serialize)
+                accessor = self._bind('accessor', schema.get_attribute)
+                lines += [
+                    f'    value = {serialize}({attr_name!r}, obj, accessor={accessor})',
+                    f'    if value is not missing:',
+                    f'        ret[{key!r}] = value',
+                ]
+                continue
+
+            lines += [
+                f'    value = getattr(obj, {source!r}, missing)',
+                f'    if value is not missing:',
+                f'        ret[{key!r}] = {expression}',
+            ]
+
+        lines.append('    return ret')
+        exec('\n'.join(lines), self.namespace)
+
+        return function_name
+
+    def _expression(self, field: fields.Field, var: str, depth: int) -> Optional[str]:
+        """Python expression serializing `var` the way `field._serialize` does, or None if unsupported."""
+        field_type = type(field)
+
+        if field_type in (fields.String, fields.Str):
+            return f'None if {var} is None else ({var}.decode("utf-8") if isinstance({var}, bytes) else str({var}))'
+        if field_type is fields.UUID:
+            return f'None if {var} is None else str({var})'
+        if field_type in (fields.Integer, fields.Int) and not field.as_string:
+            return f'None if {var} is None else int({var})'
+        if field_type is fields.Float and not field.as_string:
+            return f'None if {var} is None else float({var})'
+        if field_type in (fields.Boolean, fields.Bool, fields.Raw):
+            # marshmallow 4 dumps Boolean values as they are, without truthy/falsy conversion
+            return var
+        if field_type is fields.DateTime and field.format in _ISO_FORMATS:
+            return f'None if {var} is None else {var}.isoformat()'
+        if field_type is fields.Dict and field.key_field is None and field.value_field is None:
+            return f'None if {var} is None else dict({var})'
+
+        if field_type is fields.List:
+            item = f'item_{depth}'
+            inner = self._expression(field.inner, item, depth + 1)
+            if inner is None:
+                return None
+            return f'None if {var} is None else [{inner} for {item} in {var}]'
+
+        if field_type is fields.Nested:
+            nested_schema = field.schema
+            dump_nested = self.compile(nested_schema)
+            if dump_nested is None:
+                return None
+            if nested_schema.many or field.many:
+                item = f'item_{depth}'
+                return f'None if {var} is None else [{dump_nested}({item}) for {item} in {var}]'
+            return f'None if {var} is None else {dump_nested}({var})'
+
+        return None
+
+
+def _is_compilable(schema: Schema) -> bool:
+    return (
+        not schema._hooks[PRE_DUMP]
+        and not schema._hooks[POST_DUMP]
+        and type(schema).get_attribute is Schema.get_attribute
+        and schema.dict_class is dict
+    )
+
+
+def compile_schema(schema: Schema) -> CompiledSchema:
+    """Generate a specialized dump function for `schema`, falling back to marshmallow if it can't be compiled."""
+    compiler = _Compiler()
+    function_name = compiler.compile(schema)
+
+    return CompiledSchema(schema, compiler.namespace[function_name] if function_name else None)
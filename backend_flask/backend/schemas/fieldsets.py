@@ -0,0 +1,50 @@
+"""Sparse fieldsets: the `fields=` query parameter narrowing recipe, review and user responses."""
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+from marshmallow import Schema, fields, ValidationError
+
+from backend.schemas.compiler import CompiledSchema, compile_schema
+
+
+class FieldsetField(fields.Field):
+    """
+    Comma-separated response keys of `schema`, loaded as a frozenset of its attribute names.
+    Unknown keys are rejected; an empty value means every field.
+    """
+
+    def __init__(self, schema: Schema, **kwargs):
+        super().__init__(**kwargs)
+        self._attributes = {
+            field.data_key if field.data_key is not None else name: name
+            for name, field in schema.dump_fields.items()
+        }
+
+    def _deserialize(self, value, attr, data, **kwargs) -> Optional[FrozenSet[str]]:
+        if not isinstance(value, str):
+            raise ValidationError('Fields must be a comma-separated string')
+
+        requested = [key.strip() for key in value.split(',') if key.strip()]
+        unknown = [key for key in requested if key not in self._attributes]
+        if unknown:
+            raise ValidationError(f'Unknown fields: {", ".join(unknown)}')
+
+        return frozenset(self._attributes[key] for key in requested) or None
+
+
+def fieldset_schema(schema: Schema) -> Schema:
+    """Schema loading just the `fields` parameter for responses dumped by `schema`."""
+    return Schema.from_dict({'fieldset': FieldsetField(schema, load_default=None, data_key='fields')})()
+
+
+def sparse_serializer(serializer: CompiledSchema, fieldset: Optional[FrozenSet[str]]) -> CompiledSchema:
+    """`serializer` restricted to the attributes in `fieldset`; compiled once per distinct fieldset."""
+    if fieldset is None:
+        return serializer
+
+    return _compile_sparse(type(serializer.schema), serializer.schema.many, fieldset)
+
+
+@lru_cache(maxsize=128)
+def _compile_sparse(schema_class: type, many: bool, fieldset: FrozenSet[str]) -> CompiledSchema:
+    return compile_schema(schema_class(many=many, only=fieldset))
@@ -0,0 +1,21 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+from backend.schemas.fieldsets import FieldsetField
+from backend.schemas.recipes.recipe_list_schema import recipe_list_schema
+
+
+class RecipeBatchSchema(Schema):
+    ids = fields.List(fields.UUID(), required=True)
+    fieldset = FieldsetField(recipe_list_schema, load_default=None, data_key='fields')
+
+    @validates('ids')
+    def validate_ids(self, ids: list, **kwargs) -> list:
+        if not ids:
+            raise ValidationError('At least one recipe id is required')
+        if len(ids) > 100:
+            raise ValidationError('No more than 100 recipe ids per request')
+
+        return ids
+
+
+recipe_batch_schema = RecipeBatchSchema()
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class RecipeCard:
+    """
+    Read-only projection of a recipe for list responses.
+
+    Built from plain column tuples instead of ORM entities, so a list page never
+    hydrates Recipe, RecipeIngredient, Ingredient, RecipeCategory or Category objects.
+    `ingredients` and `categories` hold {'id', 'name'} pairs.
+    """
+    id: UUID
+    title: str
+    description: str
+    servings_count: int
+    duration: int
+    created_at: datetime
+    review_count: int
+    average_rating: float
+    ingredients: list = field(default_factory=list)
+    categories: list = field(default_factory=list)
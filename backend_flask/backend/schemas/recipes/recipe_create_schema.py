@@ -1,5 +1,5 @@
 from marshmallow import Schema, fields, validates, ValidationError
-from backend.schemas.recipes.recipe_step_schema import RecipeStepSchema
+from backend.schemas.recipes.recipe_step_schema import RecipeStepSchema, MAX_INTEGER
 
 
 class RecipeCreateSchema(Schema):
@@ -8,15 +8,15 @@ class RecipeCreateSchema(Schema):
     duration = fields.Integer(required=True)
     servings_count = fields.Integer(required=True, data_key='servingsCount')
     steps = fields.List(fields.Nested(RecipeStepSchema), required=True)
-    categoryIds = fields.List(fields.UUID(), required=True)
-    ingredientsIds = fields.List(fields.UUID(), required=True)
+    category_ids = fields.List(fields.UUID(), required=True, data_key='categoryIds')
+    ingredients_ids = fields.List(fields.UUID(), required=True, data_key='ingredientsIds')
 
     @validates('title')
     def validate_title(self, title: str, **kwargs) -> str:
         if title.strip() == '':
             raise ValidationError('Title cannot be empty')
-        if len(title.strip()) > 100 or len(title.strip()) < 1:
-            raise ValidationError('Title cannot be less than 100 characters')
+        if len(title) > 100 or len(title.strip()) < 1:
+            raise ValidationError('Title cannot be longer than 100 characters')
 
         return title
 
@@ -31,6 +31,8 @@ class RecipeCreateSchema(Schema):
     def validate_duration(self, duration: int, **kwargs) -> int:
         if duration <= 0:
             raise ValidationError('Duration cannot be negative or zero')
+        if duration > MAX_INTEGER:
+            raise ValidationError(f'Duration cannot be greater than {MAX_INTEGER}')
 
         return duration
 
@@ -38,6 +40,8 @@ class RecipeCreateSchema(Schema):
     def validate_servings_count(self, servings_count: int, **kwargs) -> int:
         if servings_count <= 0:
             raise ValidationError('Servings count cannot be negative or zero')
+        if servings_count > MAX_INTEGER:
+            raise ValidationError(f'Servings count cannot be greater than {MAX_INTEGER}')
 
         return servings_count
 
@@ -1,6 +1,7 @@
 from marshmallow import Schema, fields
 
 from backend.schemas.category_schema import CategorySchema
+from backend.schemas.fieldsets import fieldset_schema
 from backend.schemas.ingredient_schema import IngredientSchema
 from backend.schemas.recipes.recipe_step_schema import RecipeStepSchema
 from backend.schemas.users_schema.user_detail_schema import UserDetailSchema
@@ -26,3 +27,4 @@ class RecipeDetailSchema(Schema):
 
 recipe_detail_schema = RecipeDetailSchema()
 recipes_detail_schema = RecipeDetailSchema(many=True)
+recipe_detail_fields_schema = fieldset_schema(recipe_detail_schema)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class RecipeExportRecord:
+    """
+    One recipe of the NDJSON export, built from column tuples like RecipeCard.
+
+    `steps` holds {'id', 'stepNumber', 'description'} dicts in step order, the same
+    shape RecipeStepSchema dumps; `ingredients` and `categories` hold {'id', 'name'} pairs.
+    """
+    id: UUID
+    title: str
+    description: str
+    servings_count: int
+    duration: int
+    image_url: Optional[str]
+    author_id: UUID
+    created_at: datetime
+    review_count: int
+    rating_sum: int
+    average_rating: float
+    steps: list = field(default_factory=list)
+    ingredients: list = field(default_factory=list)
+    categories: list = field(default_factory=list)
@@ -0,0 +1,24 @@
+from marshmallow import Schema, fields
+
+
+class RecipeExportSchema(Schema):
+    """Dumps RecipeExportRecord rows, one NDJSON line per recipe."""
+    id = fields.UUID(dump_only=True)
+    title = fields.String(dump_only=True)
+    description = fields.String(dump_only=True)
+    servings_count = fields.Integer(dump_only=True, data_key='servingsCount')
+    duration = fields.Integer(dump_only=True)
+    image_url = fields.String(dump_only=True, data_key='imageUrl')
+    author_id = fields.UUID(dump_only=True, data_key='authorId')
+    created_at = fields.DateTime(dump_only=True, data_key='createdAt')
+
+    steps = fields.List(fields.Dict(), dump_only=True)
+    ingredients = fields.List(fields.Dict(), dump_only=True)
+    categories = fields.List(fields.Dict(), dump_only=True)
+
+    review_count = fields.Integer(dump_only=True, data_key='reviewCount')
+    rating_sum = fields.Integer(dump_only=True, data_key='ratingSum')
+    average_rating = fields.Float(dump_only=True, data_key='averageRating')
+
+
+recipe_export_schema = RecipeExportSchema(many=True)
@@ -1,4 +1,7 @@
-from marshmallow import Schema, fields, validates, ValidationError
+from marshmallow import Schema, fields, validates, validates_schema, ValidationError, post_load
+
+from backend.schemas.fieldsets import FieldsetField
+from backend.schemas.recipes.recipe_list_schema import recipe_list_schema
 
 
 class RecipeFilterSchema(Schema):
@@ -8,6 +11,12 @@ class RecipeFilterSchema(Schema):
     category_ids = fields.List(fields.UUID(), load_default=[], allow_none=True, data_key='categoryIds')
     ingredient_ids = fields.List(fields.UUID(), load_default=[], allow_none=True, data_key='ingredientIds')
     mode = fields.String(load_default='or')
+    cursor = fields.String(load_default=None, allow_none=True)
+    with_total = fields.Boolean(load_default=True, data_key='withTotal')
+    q = fields.String(load_default=None, allow_none=True)
+    sort = fields.String(load_default=None, allow_none=True)
+    facets = fields.String(load_default=None, allow_none=True)
+    fieldset = FieldsetField(recipe_list_schema, load_default=None, data_key='fields')
 
     @validates('page')
     def validate_page(self, page: int, **kwargs) -> int:
@@ -27,10 +36,57 @@ class RecipeFilterSchema(Schema):
 
     @validates('mode')
     def validate_mode(self, mode: str, **kwargs) -> str:
-        if mode not in ('and', 'or'):
-            raise ValidationError('Mode must be "and" or "or"')
+        if mode not in ('and', 'or', 'coverage'):
+            raise ValidationError('Mode must be "and", "or" or "coverage"')
 
         return mode
 
+    @validates_schema
+    def validate_coverage(self, data: dict, **kwargs) -> None:
+        if data.get('mode') != 'coverage':
+            return
+
+        if not data.get('ingredient_ids'):
+            raise ValidationError('Coverage mode requires at least one ingredient', 'ingredientIds')
+        if data.get('cursor'):
+            raise ValidationError('Coverage mode does not support cursor pagination', 'cursor')
+        if data.get('sort'):
+            raise ValidationError('Coverage mode is always ordered by coverage', 'sort')
+
+    @validates('sort')
+    def validate_sort(self, sort: str, **kwargs) -> str:
+        if sort is not None and sort not in ('newest', 'top_rated', 'most_reviewed', 'quickest'):
+            raise ValidationError('Sort must be "newest", "top_rated", "most_reviewed" or "quickest"')
+
+        return sort
+
+    @validates('facets')
+    def validate_facets(self, facets: str, **kwargs) -> str:
+        if facets is not None and not set(facets.split(',')) <= {'categories', 'ingredients'}:
+            raise ValidationError('Facets must be a comma-separated list of "categories" and "ingredients"')
+
+        return facets
+
+    @validates('q')
+    def validate_q(self, q: str, **kwargs) -> str:
+        if q is not None and len(q) > 200:
+            raise ValidationError('Search query cannot be longer than 200 characters')
+
+        return q
+
+    @post_load
+    def normalize_q(self, data: dict, **kwargs) -> dict:
+        if data.get('q') is not None:
+            data['q'] = data['q'].strip() or None
+
+        return data
+
+    @post_load
+    def split_facets(self, data: dict, **kwargs) -> dict:
+        if data.get('facets') is not None:
+            data['facets'] = sorted(set(data['facets'].split(',')))
+
+        return data
+
 
 recipe_filter_schema = RecipeFilterSchema()
\ No newline at end of file
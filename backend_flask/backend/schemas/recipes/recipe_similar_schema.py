@@ -0,0 +1,15 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+
+class RecipeSimilarSchema(Schema):
+    limit = fields.Integer(load_default=6)
+
+    @validates('limit')
+    def validate_limit(self, limit: int, **kwargs) -> int:
+        if limit < 1 or limit > 24:
+            raise ValidationError('Limit must be between 1 and 24')
+
+        return limit
+
+
+recipe_similar_schema = RecipeSimilarSchema()
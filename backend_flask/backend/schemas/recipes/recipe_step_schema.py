@@ -1,5 +1,8 @@
 from marshmallow import Schema, fields, validates, ValidationError
 
+# Largest value the INTEGER columns accept
+MAX_INTEGER = 2 ** 31 - 1
+
 
 class RecipeStepSchema(Schema):
     id = fields.UUID(dump_only=True)
@@ -10,6 +13,8 @@ class RecipeStepSchema(Schema):
     def validate_step_number(self, step_number: int, **kwargs) -> int:
         if step_number < 1:
             raise ValidationError('step_number must be greater than 0')
+        if step_number > MAX_INTEGER:
+            raise ValidationError(f'step_number cannot be greater than {MAX_INTEGER}')
 
         return step_number
 
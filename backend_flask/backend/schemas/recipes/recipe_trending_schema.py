@@ -0,0 +1,16 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+
+class RecipeTrendingSchema(Schema):
+    per_page = fields.Integer(load_default=24, data_key='perPage')
+    cursor = fields.String(load_default=None, allow_none=True)
+
+    @validates('per_page')
+    def validate_per_page(self, per_page: int, **kwargs) -> int:
+        if per_page < 1 or per_page > 100:
+            raise ValidationError('Per page must be between 1 and 100')
+
+        return per_page
+
+
+recipe_trending_schema = RecipeTrendingSchema()
@@ -0,0 +1,17 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+
+class RecipeViewerContextSchema(Schema):
+    recipe_ids = fields.List(fields.UUID(), required=True, data_key='recipeIds')
+
+    @validates('recipe_ids')
+    def validate_recipe_ids(self, recipe_ids: list, **kwargs) -> list:
+        if not recipe_ids:
+            raise ValidationError('At least one recipe id is required')
+        if len(recipe_ids) > 100:
+            raise ValidationError('No more than 100 recipe ids per request')
+
+        return recipe_ids
+
+
+recipe_viewer_context_schema = RecipeViewerContextSchema()
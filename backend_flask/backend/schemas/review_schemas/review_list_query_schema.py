@@ -0,0 +1,13 @@
+from marshmallow import fields
+
+from backend.pagination.pagination_schema import PaginationSchema
+from backend.schemas.fieldsets import FieldsetField
+from backend.schemas.review_schemas.review_schema import review_list_schema
+
+
+class ReviewListQuerySchema(PaginationSchema):
+    fieldset = FieldsetField(review_list_schema, load_default=None, data_key='fields')
+    cursor = fields.String(load_default=None, allow_none=True)
+
+
+review_list_query_schema = ReviewListQuerySchema()
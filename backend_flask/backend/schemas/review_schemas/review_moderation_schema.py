@@ -0,0 +1,31 @@
+from marshmallow import Schema, fields, validates, ValidationError
+
+
+class ReviewDecisionSchema(Schema):
+    id = fields.UUID(required=True)
+    action = fields.String(required=True)
+
+    @validates('action')
+    def validate_action(self, action: str, **kwargs) -> str:
+        if action not in ('approve', 'reject'):
+            raise ValidationError('Action must be "approve" or "reject"')
+
+        return action
+
+
+class ReviewModerationSchema(Schema):
+    decisions = fields.List(fields.Nested(ReviewDecisionSchema), required=True)
+
+    @validates('decisions')
+    def validate_decisions(self, decisions: list, **kwargs) -> list:
+        if not decisions:
+            raise ValidationError('At least one decision is required')
+        if len(decisions) > 100:
+            raise ValidationError('No more than 100 decisions per request')
+        if len({decision['id'] for decision in decisions}) != len(decisions):
+            raise ValidationError('Each review can only be decided once per request')
+
+        return decisions
+
+
+review_moderation_schema = ReviewModerationSchema()
@@ -0,0 +1,18 @@
+"""Compiled dump functions for the response schemas on hot paths; built once when the app imports them."""
+from backend.schemas.category_schema import category_schema, categories_schema
+from backend.schemas.compiler import compile_schema
+from backend.schemas.ingredient_schema import ingredient_schema, ingredients_schema
+from backend.schemas.recipes.recipe_detail_schema import recipe_detail_schema
+from backend.schemas.recipes.recipe_export_schema import recipe_export_schema
+from backend.schemas.recipes.recipe_list_schema import recipe_list_schema
+from backend.schemas.review_schemas.review_schema import review_schema, review_list_schema
+
+recipe_list_serializer = compile_schema(recipe_list_schema)
+recipe_detail_serializer = compile_schema(recipe_detail_schema)
+recipe_export_serializer = compile_schema(recipe_export_schema)
+review_serializer = compile_schema(review_schema)
+review_list_serializer = compile_schema(review_list_schema)
+category_serializer = compile_schema(category_schema)
+categories_serializer = compile_schema(categories_schema)
+ingredient_serializer = compile_schema(ingredient_schema)
+ingredients_serializer = compile_schema(ingredients_schema)
@@ -1,5 +1,7 @@
 from marshmallow import Schema, fields
 
+from backend.schemas.fieldsets import fieldset_schema
+
 
 class UserDetailSchema(Schema):
     id = fields.UUID(required=True)
@@ -10,4 +12,5 @@ class UserDetailSchema(Schema):
     created_at = fields.DateTime(required=True, data_key='createdAt')
     avatar_url= fields.String(required=True, data_key='avatarUrl')
 
-user_detail_schema = UserDetailSchema()
\ No newline at end of file
+user_detail_schema = UserDetailSchema()
+user_detail_fields_schema = fieldset_schema(user_detail_schema)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from .autocomplete_service import AutocompleteService
 from .auth_service import AuthService
 from .category_service import CategoryService
 from .ingredient_service import IngredientsService
@@ -0,0 +1,44 @@
+from itertools import chain
+
+from flask import current_app
+from injector import inject
+
+from backend.indexes import AutocompleteIndex
+from backend.repositories import CategoryRepository, IngredientRepository, RecipeRepository
+
+
+class AutocompleteService:
+    """
+    Service for search box suggestions over recipe titles, ingredient and category names,
+    served from the in-memory AutocompleteIndex. The index is rebuilt from the database
+    every AUTOCOMPLETE_INDEX_TTL seconds; the recipe, ingredient and category services
+    update it on every write in between.
+
+    Methods:
+        suggest(q: str, limit: int) -> dict:
+            Up to `limit` entries with a word starting with `q`, most popular first.
+    """
+    @inject
+    def __init__(self, index: AutocompleteIndex, recipe_repository: RecipeRepository,
+                 ingredient_repository: IngredientRepository, category_repository: CategoryRepository):
+        self.__index = index
+        self.__recipe_repository = recipe_repository
+        self.__ingredient_repository = ingredient_repository
+        self.__category_repository = category_repository
+
+    def suggest(self, q: str, limit: int = 10) -> dict:
+        self.__index.ensure_fresh(self.__load_entries, ttl=current_app.config.get('AUTOCOMPLETE_INDEX_TTL', 0))
+
+        return {
+            'items': [
+                {'type': kind, 'id': str(entry_id), 'name': name}
+                for kind, entry_id, name in self.__index.suggest(q, limit)
+            ]
+        }
+
+    def __load_entries(self):
+        return chain(
+            ((AutocompleteIndex.RECIPE, *row) for row in self.__recipe_repository.get_autocomplete_entries()),
+            ((AutocompleteIndex.INGREDIENT, *row) for row in self.__ingredient_repository.get_autocomplete_entries()),
+            ((AutocompleteIndex.CATEGORY, *row) for row in self.__category_repository.get_autocomplete_entries()),
+        )
@@ -5,16 +5,22 @@ from injector import inject
 from werkzeug.datastructures import FileStorage
 
 from backend import CloudinaryUploader
+from backend.cache import RecipeListCache
 from backend.exceptions import NotFound, AlreadyExists, ValidationError
+from backend.indexes import AutocompleteIndex
 from backend.models import Category
-from backend.repositories import CategoryRepository
-from backend.schemas import categories_schema, category_schema
+from backend.pagination.count_cache import count_cache
+from backend.repositories import CategoryRepository, RevisionRepository, RevisionScope
+from backend.schemas import categories_serializer, category_serializer
 
 
 class CategoryService:
     """
     Service for managing categories, including CRUD operations
-    and handling image uploads via Cloudinary.
+    and handling image uploads via Cloudinary. Writes bump the categories
+    revision that the list ETag is built from and update the category's
+    autocomplete entry. Renames and deletes also drop the cached recipe
+    lists that can show recipes using the category, since recipe cards embed its name.
 
     Methods:
         get_all(): Return a list of all categories.
@@ -25,20 +31,25 @@ class CategoryService:
     """
 
     @inject
-    def __init__(self, repository: CategoryRepository, cloud_uploader: CloudinaryUploader):
+    def __init__(self, repository: CategoryRepository, cloud_uploader: CloudinaryUploader,
+                 revisions: RevisionRepository, autocomplete: AutocompleteIndex,
+                 list_cache: RecipeListCache):
         self.__repository = repository
         self.__cloud_uploader = cloud_uploader
+        self.__revisions = revisions
+        self.__autocomplete = autocomplete
+        self.__list_cache = list_cache
 
     def get_all(self) -> List[dict]:
         categories = self.__repository.get_all()
-        return categories_schema.dump(categories)
+        return categories_serializer.dump(categories)
 
     def get_by_id(self, id: UUID) -> dict:
         category = self.__repository.get_by_id(id)
         if category is None:
             raise NotFound(f'Cannot find category with id: {id}!')
 
-        return category_schema.dump(category)
+        return category_serializer.dump(category)
 
     def create(self, data: dict, icon_file: Optional[FileStorage] = None) -> dict:
         if self.__repository.is_name_exists(data['name']):
@@ -50,8 +61,10 @@ class CategoryService:
         category = Category(**data)
         category.icon_url = self.__cloud_uploader.upload_file(icon_file, folder='category')
 
+        self.__revisions.bump(RevisionScope.CATEGORIES)
         created_category = self.__repository.create(category)
-        return category_schema.dump(created_category)
+        self.__autocomplete.set_entry(AutocompleteIndex.CATEGORY, created_category.id, created_category.name)
+        return category_serializer.dump(created_category)
 
     def update(self, id: UUID, data: dict, icon_file: Optional[FileStorage] = None) -> dict:
         category = self.__repository.get_by_id(id)
@@ -61,13 +74,18 @@ class CategoryService:
         if self.__repository.is_name_exists(data['name'], id):
             raise AlreadyExists('Category with this name already exists!')
 
+        renamed = category.name != data['name']
         category.name = data['name']
 
         if icon_file:
             category.icon_url = self.__cloud_uploader.upload_file(icon_file, folder='category')
 
+        self.__revisions.bump(RevisionScope.CATEGORIES)
         updated_category = self.__repository.update(category)
-        return category_schema.dump(updated_category)
+        self.__autocomplete.set_entry(AutocompleteIndex.CATEGORY, updated_category.id, updated_category.name)
+        if renamed:
+            self.__list_cache.invalidate(self.__recipe_list_tags(id))
+        return category_serializer.dump(updated_category)
 
     def delete(self, id: UUID) -> bool:
         category = self.__repository.get_by_id(id)
@@ -77,6 +95,15 @@ class CategoryService:
         if category.icon_url:
             self.__cloud_uploader.delete_file(category.icon_url)
 
+        stale_tags = self.__recipe_list_tags(id)
+        self.__revisions.bump(RevisionScope.CATEGORIES)
         self.__repository.delete(category)
+        self.__autocomplete.remove_entry(AutocompleteIndex.CATEGORY, id)
+        count_cache.invalidate('recipes')
+        self.__list_cache.invalidate(stale_tags)
 
-        return True
\ No newline at end of file
+        return True
+
+    def __recipe_list_tags(self, id: UUID) -> set:
+        """Cache tags of every recipe list that can show a recipe using the category."""
+        return RecipeListCache.tags_for_references(*self.__repository.get_recipe_references(id)) | {f'category:{id}'}
@@ -4,17 +4,23 @@ from uuid import UUID
 from injector import inject
 from werkzeug.datastructures import FileStorage
 
+from backend.cache import RecipeListCache
 from backend.exceptions import NotFound, AlreadyExists, ValidationError
 from backend.helpers.cloudinary_uploader import CloudinaryUploader
+from backend.indexes import AutocompleteIndex
 from backend.models import Ingredient
-from backend.repositories import IngredientRepository
-from backend.schemas import ingredients_schema, ingredient_schema
+from backend.pagination.count_cache import count_cache
+from backend.repositories import IngredientRepository, RevisionRepository, RevisionScope
+from backend.schemas import ingredients_serializer, ingredient_serializer
 
 
 class IngredientsService:
     """
     Service for managing ingredients, including CRUD operations
-    and handling image uploads via Cloudinary.
+    and handling image uploads via Cloudinary. Writes bump the ingredients
+    revision that the list ETag is built from and update the ingredient's
+    autocomplete entry. Renames and deletes also drop the cached recipe
+    lists that can show recipes using the ingredient, since recipe cards embed its name.
 
     Methods:
         get_all(): Return a list of all ingredients.
@@ -25,19 +31,24 @@ class IngredientsService:
     """
 
     @inject
-    def __init__(self, repository: IngredientRepository, cloud_uploader: CloudinaryUploader):
+    def __init__(self, repository: IngredientRepository, cloud_uploader: CloudinaryUploader,
+                 revisions: RevisionRepository, autocomplete: AutocompleteIndex,
+                 list_cache: RecipeListCache):
         self.__repository = repository
         self.__cloud_uploader = cloud_uploader
+        self.__revisions = revisions
+        self.__autocomplete = autocomplete
+        self.__list_cache = list_cache
 
     def get_all(self) -> List[dict]:
         ingredients = self.__repository.get_all()
-        return ingredients_schema.dump(ingredients)
+        return ingredients_serializer.dump(ingredients)
 
     def get_by_id(self, id: UUID) -> dict:
         ingredient = self.__repository.get_by_id(id)
         if ingredient is None:
             raise NotFound(f'Cannot find ingredient with id: {id}!')
-        return ingredient_schema.dump(ingredient)
+        return ingredient_serializer.dump(ingredient)
 
     def create(self, data: dict, icon_file: Optional[FileStorage] = None) -> dict:
         if self.__repository.is_name_exists(data['name']):
@@ -49,8 +60,10 @@ class IngredientsService:
         ingredient = Ingredient(**data)
         ingredient.icon_url = self.__cloud_uploader.upload_file(icon_file, folder='ingredients')
 
+        self.__revisions.bump(RevisionScope.INGREDIENTS)
         created_ingredient = self.__repository.create(ingredient)
-        return ingredient_schema.dump(created_ingredient)
+        self.__autocomplete.set_entry(AutocompleteIndex.INGREDIENT, created_ingredient.id, created_ingredient.name)
+        return ingredient_serializer.dump(created_ingredient)
 
     def update(self, id: UUID, data: dict, icon_file: Optional[FileStorage] = None) -> dict:
         ingredient = self.__repository.get_by_id(id)
@@ -60,13 +73,18 @@ class IngredientsService:
         if self.__repository.is_name_exists(data['name'], id):
             raise AlreadyExists('Ingredient with this name already exists!')
 
+        renamed = ingredient.name != data['name']
         ingredient.name = data['name']
 
         if icon_file:
             ingredient.icon_url = self.__cloud_uploader.upload_file(icon_file, folder='ingredients')
 
+        self.__revisions.bump(RevisionScope.INGREDIENTS)
         updated_ingredient = self.__repository.update(ingredient)
-        return ingredient_schema.dump(updated_ingredient)
+        self.__autocomplete.set_entry(AutocompleteIndex.INGREDIENT, updated_ingredient.id, updated_ingredient.name)
+        if renamed:
+            self.__list_cache.invalidate(self.__recipe_list_tags(id))
+        return ingredient_serializer.dump(updated_ingredient)
 
     def delete(self, id: UUID) -> bool:
         ingredient = self.__repository.get_by_id(id)
@@ -76,5 +94,14 @@ class IngredientsService:
         if ingredient.icon_url:
             self.__cloud_uploader.delete_file(ingredient.icon_url)
 
+        stale_tags = self.__recipe_list_tags(id)
+        self.__revisions.bump(RevisionScope.INGREDIENTS)
         self.__repository.delete(ingredient)
-        return True
\ No newline at end of file
+        self.__autocomplete.remove_entry(AutocompleteIndex.INGREDIENT, id)
+        count_cache.invalidate('recipes')
+        self.__list_cache.invalidate(stale_tags)
+        return True
+
+    def __recipe_list_tags(self, id: UUID) -> set:
+        """Cache tags of every recipe list that can show a recipe using the ingredient."""
+        return RecipeListCache.tags_for_references(*self.__repository.get_recipe_references(id)) | {f'ingredient:{id}'}
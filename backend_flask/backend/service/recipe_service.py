@@ -1,31 +1,81 @@
-from typing import Optional
-from uuid import UUID
+import json
+from typing import AbstractSet, Iterable, Iterator, Optional, List
+from uuid import UUID, uuid4
 
+from flask import current_app
 from flask_jwt_extended import get_jwt_identity, get_jwt
 from injector import inject
+from marshmallow import ValidationError as SchemaValidationError
 from werkzeug.datastructures import FileStorage
 
 from backend import CloudinaryUploader
+from backend.cache import RecipeListCache, TrendingRecipeCache
 from backend.exceptions import NotFound, PermissionDenied
+from backend.helpers import JSONBackendFactory, TrendingScore
+from backend.indexes import AutocompleteIndex, IngredientIndex, MinHasher, SimilarRecipeIndex
 from backend.models import Recipe, RecipeStep, RecipeIngredient, RecipeCategory
-from backend.repositories import RecipeRepository, ReviewRepository
-from backend.schemas import recipe_list_schema
-from backend.schemas.recipes.recipe_detail_schema import recipe_detail_schema
-from backend.schemas.recipes.recipes_stats import RecipeWithStats
+from backend.pagination.count_cache import count_cache
+from backend.pagination.cursor import CursorCodec
+from backend.pagination.paginated_result import PaginatedResult
+from backend.repositories import (RecipeRepository, ReviewRepository, RevisionRepository, RevisionScope,
+                                  RecipeSignatureRepository, RecipeTrendingRepository)
+from backend.schemas import (recipe_list_serializer, recipe_detail_serializer, recipe_export_serializer,
+                             recipe_create_schema)
+from backend.schemas.fieldsets import sparse_serializer
+
+# Above this many index matches the ingredient filter stays in SQL instead of an IN list.
+INDEX_MAX_SQL_CANDIDATES = 5000
+# Recipes fetched per server-side cursor round trip of the NDJSON export.
+EXPORT_BATCH_SIZE = 500
+# Valid recipes written per transaction by the NDJSON import.
+IMPORT_CHUNK_SIZE = 500
+# Most similar recipes returned when the client doesn't ask for a limit.
+SIMILAR_RECIPES_DEFAULT_LIMIT = 6
 
 
 class RecipeService:
     """
     Service for managing recipes, including CRUD operations, handling
     image uploads via Cloudinary, and providing user-specific flags
-    like isReviewed or isApprovedReview.
+    like isReviewed or isApprovedReview. Writes keep the in-memory ingredient,
+    similar-recipes and autocomplete indexes current.
 
     Methods:
         get_recipes(filters: dict) -> dict:
-            Get paginated recipes with optional filters (user, categories, ingredients).
-
-        get_recipe_by_id(recipe_id: UUID) -> dict:
-            Get detailed info for a single recipe, including review flags for the current user.
+            Get paginated recipes with optional filters (user, categories, ingredients)
+            and an optional full-text query `q` (results are then ordered by relevance unless `sort`
+            picks newest, top_rated, most_reviewed or quickest).
+            Pass `cursor` (the `nextCursor` of a previous page) to continue with keyset pagination
+            instead of page numbers. `with_total=False` skips the total count.
+            Ingredient filters are resolved by the in-memory IngredientIndex; mode "coverage"
+            ranks recipes by the share of their ingredients found in `ingredient_ids`.
+            `facets` (categories, ingredients) adds per-category/ingredient counts of the whole
+            filtered set. Results are cached in Redis and invalidated by recipe and review writes.
+            A `fieldset` (the `fields` parameter) narrows both the card query and the dumped keys.
+
+        get_recipe_by_id(recipe_id: UUID, fieldset: Optional[AbstractSet[str]]) -> dict:
+            Get detailed info for a single recipe, including review flags for the current user,
+            loaded by RecipeRepository.get_recipe_detail in two statements, or fewer when a
+            `fieldset` leaves relationships out.
+            Updates and deletes bump the recipe revision behind the detail ETag.
+
+        get_recipes_batch(recipe_ids: List[UUID], fieldset: Optional[AbstractSet[str]]) -> dict:
+            List cards of many recipes in request order, loaded with one query for the recipes
+            and one for their ingredients and categories. Unknown ids are reported in `missing`.
+
+        get_similar_recipes(recipe_id: UUID, limit: int) -> dict:
+            Recipes with the most similar ingredient sets, found through the MinHash/LSH
+            SimilarRecipeIndex. Create, update and import keep the stored signatures and
+            the index current.
+
+        get_trending_recipes(per_page: int, cursor: Optional[str]) -> dict:
+            Recipes by time-decayed score of their approved reviews (see TrendingScore), keyset
+            paginated on (score, id). Served from the Redis trending set, or from recipe_trending
+            while Redis is unavailable or the set is being reloaded.
+
+        get_viewer_context(recipe_ids: List[UUID]) -> dict:
+            isReviewed/isApprovedReview flags of the current user for many recipes at once,
+            so list pages can stay public and cacheable and overlay the flags per user.
 
         create(data: dict, image_file: Optional[FileStorage]):
             Create a new recipe with steps, ingredients, categories, and an optional image.
@@ -36,65 +86,346 @@ class RecipeService:
 
         delete(recipe_id: UUID) -> bool:
             Delete a recipe. Only the author or Admin can delete.
+            Recipe writes also bump the recipes revision, which tells the ingredient indexes of
+            other processes that they are stale.
+
+        build_ingredient_index() -> None:
+            Build the in-memory IngredientIndex from the database; called at startup.
+
+        get_list_cache_stats() -> dict:
+            Hit/miss counters of the recipe list cache.
+
+        export_recipes() -> Iterator[bytes]:
+            Stream every recipe with steps, ingredients, categories and stats as NDJSON,
+            one chunk per batch, so memory stays flat whatever the table size.
+
+        import_recipes(lines: Iterable[bytes]) -> dict:
+            Import NDJSON recipes authored by the current user. Lines are validated one by one
+            against RecipeCreateSchema and valid ones are inserted in chunks of multi-row INSERTs,
+            one transaction per chunk. Returns imported/failed counts and the errors per line.
     """
     @inject
-    def __init__(self, repository: RecipeRepository, review_repo: ReviewRepository, cloud_uploader: CloudinaryUploader):
+    def __init__(self, repository: RecipeRepository, review_repo: ReviewRepository, cloud_uploader: CloudinaryUploader,
+                 ingredient_index: IngredientIndex, list_cache: RecipeListCache, revisions: RevisionRepository,
+                 similar_index: SimilarRecipeIndex, signatures: RecipeSignatureRepository,
+                 trending: RecipeTrendingRepository, trending_cache: TrendingRecipeCache,
+                 autocomplete: AutocompleteIndex):
         self.__repository = repository
         self.__review_repo = review_repo
         self.__cloud_uploader = cloud_uploader
+        self.__ingredient_index = ingredient_index
+        self.__list_cache = list_cache
+        self.__revisions = revisions
+        self.__similar_index = similar_index
+        self.__signatures = signatures
+        self.__trending = trending
+        self.__trending_cache = trending_cache
+        self.__autocomplete = autocomplete
 
 
     def get_recipes(self, filters: dict) -> dict:
+        cached = self.__list_cache.get(filters)
+        if cached is not None:
+            return cached
+
+        recipes = self.__load_recipes(filters)
+        self.__list_cache.set(filters, recipes)
+
+        return recipes
+
+    def build_ingredient_index(self) -> None:
+        revision = self.__revisions.get_revision(RevisionScope.RECIPES)
+        self.__ingredient_index.build(self.__repository.get_recipe_ingredient_pairs(), revision)
+
+    def get_list_cache_stats(self) -> dict:
+        return self.__list_cache.stats()
+
+    def export_recipes(self) -> Iterator[bytes]:
+        json_backend = JSONBackendFactory.create(current_app.config.get('JSON_BACKEND', 'auto'))
+
+        for batch in self.__repository.iter_recipe_exports(EXPORT_BATCH_SIZE):
+            yield b''.join(json_backend.dumps(item) for item in recipe_export_serializer.dump(batch))
+
+    def import_recipes(self, lines: Iterable[bytes]) -> dict:
+        author_id = UUID(get_jwt_identity())
+        report = {'imported': 0, 'failed': 0, 'errors': []}
+        chunk = []
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                data = recipe_create_schema.load(json.loads(line))
+            except SchemaValidationError as error:
+                self.__report_import_error(report, line_number, error.messages)
+                continue
+            except ValueError:
+                self.__report_import_error(report, line_number, {'_schema': ['Invalid JSON']})
+                continue
+
+            chunk.append((line_number, data))
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                self.__import_chunk(chunk, author_id, report)
+                chunk = []
+
+        self.__import_chunk(chunk, author_id, report)
+        report['errors'].sort(key=lambda error: error['line'])
+        return report
+
+    def __import_chunk(self, chunk: list, author_id, report: dict) -> None:
+        if not chunk:
+            return
+
+        missing_ingredients, missing_categories = self.__repository.find_missing_references(
+            (ingredient_id for _, data in chunk for ingredient_id in data['ingredients_ids']),
+            (category_id for _, data in chunk for category_id in data['category_ids']),
+        )
+
+        lines, records = [], []
+        for line_number, data in chunk:
+            errors = {}
+            unknown_ingredients = [str(value) for value in data['ingredients_ids'] if value in missing_ingredients]
+            unknown_categories = [str(value) for value in data['category_ids'] if value in missing_categories]
+            if unknown_ingredients:
+                errors['ingredientsIds'] = [f'Unknown ingredient ids: {", ".join(unknown_ingredients)}']
+            if unknown_categories:
+                errors['categoryIds'] = [f'Unknown category ids: {", ".join(unknown_categories)}']
+            if errors:
+                self.__report_import_error(report, line_number, errors)
+                continue
+
+            lines.append(line_number)
+            records.append({
+                'recipe': {
+                    'id': uuid4(),
+                    'title': data['title'],
+                    'description': data['description'],
+                    'duration': data['duration'],
+                    'servings_count': data['servings_count'],
+                    'author_id': author_id,
+                },
+                'steps': data['steps'],
+                'ingredient_ids': data['ingredients_ids'],
+                'category_ids': data['category_ids'],
+            })
+
+        revision = self.__bump_recipes()
+        failures = self.__repository.bulk_insert_recipes(records)
+
+        stale_tags, imported_ingredients = set(), {}
+        for index, (line_number, record) in enumerate(zip(lines, records)):
+            if index in failures:
+                self.__report_import_error(report, line_number, {'_schema': [failures[index]]})
+                continue
+
+            report['imported'] += 1
+            self.__ingredient_index.set_recipe(record['recipe']['id'], record['ingredient_ids'], revision)
+            self.__autocomplete.set_entry(AutocompleteIndex.RECIPE, record['recipe']['id'], record['recipe']['title'])
+            imported_ingredients[record['recipe']['id']] = record['ingredient_ids']
+            stale_tags |= RecipeListCache.tags_for_ids(author_id, record['category_ids'], record['ingredient_ids'])
+
+        self.__update_similarity(imported_ingredients)
+        self.__list_cache.invalidate(stale_tags)
+        count_cache.invalidate('recipes')
+
+    def __bump_recipes(self, *scopes: str) -> Optional[int]:
+        """Bump `scopes` and the recipes revision in the current transaction; returns the new recipes revision."""
+        return self.__revisions.bump(RevisionScope.RECIPES, *scopes).get(RevisionScope.RECIPES)
+
+    def __update_similarity(self, ingredients_by_recipe: dict) -> None:
+        if not ingredients_by_recipe:
+            return
+
+        signatures = {
+            recipe_id: MinHasher.signature(ingredient_ids) for recipe_id, ingredient_ids in ingredients_by_recipe.items()
+        }
+        self.__signatures.save({
+            recipe_id: MinHasher.pack(signature) if signature else None for recipe_id, signature in signatures.items()
+        })
+        for recipe_id, signature in signatures.items():
+            self.__similar_index.set_recipe(recipe_id, signature)
+
+    @staticmethod
+    def __report_import_error(report: dict, line_number: int, errors: dict) -> None:
+        report['failed'] += 1
+        report['errors'].append({'line': line_number, 'errors': errors})
+
+    def __load_recipes(self, filters: dict) -> dict:
         page = int(filters.get('page', 1))
         per_page = int(filters.get('per_page', 24))
         user_id = filters.get('user_id')
         category_ids = filters.get('category_ids', [])
         ingredient_ids = filters.get('ingredient_ids', [])
         mode = filters.get('mode', 'or')
+        cursor = filters.get('cursor')
+        with_total = filters.get('with_total', True)
+        q = filters.get('q')
+        sort = filters.get('sort')
+        facets = filters.get('facets')
+        fieldset = filters.get('fieldset')
+
+        coverage = {}
+        recipe_ids = None
+        if ingredient_ids:
+            self.__ingredient_index.ensure_fresh(
+                self.__repository.get_recipe_ingredient_pairs,
+                ttl=current_app.config.get('INGREDIENT_INDEX_TTL', 0),
+                revision=self.__revisions.get_revision(RevisionScope.RECIPES)
+            )
 
-        paginated = self.__repository.get_recipes_paginated(
-            page=page,
-            per_page=per_page,
-            user_id=user_id,
-            category_ids=category_ids,
-            ingredient_ids=ingredient_ids,
-            mode = mode
-        )
+            if mode == 'coverage':
+                ranked = self.__ingredient_index.rank_by_coverage(ingredient_ids)
+                if user_id or category_ids or q:
+                    allowed = self.__repository.filter_recipe_ids(
+                        [recipe_id for recipe_id, _ in ranked], user_id, category_ids, q
+                    )
+                    ranked = [(recipe_id, share) for recipe_id, share in ranked if recipe_id in allowed]
+
+                coverage = dict(ranked)
+                recipe_ids = [recipe_id for recipe_id, _ in ranked]
+            elif mode == 'and':
+                recipe_ids = self.__ingredient_index.match_all(ingredient_ids)
+            else:
+                recipe_ids = self.__ingredient_index.match_any(ingredient_ids)
+
+        sql_recipe_ids = recipe_ids if recipe_ids is None or len(recipe_ids) <= INDEX_MAX_SQL_CANDIDATES else None
+        sql_mode = 'or' if mode == 'coverage' else mode
+
+        in_index_order = sort in (None, 'newest') and not (user_id or category_ids or q or cursor)
+        if mode == 'coverage' or (recipe_ids is not None and in_index_order):
+            paginated = self.__page_of_ids(recipe_ids, page, per_page, with_cursor=mode != 'coverage',
+                                           fieldset=fieldset)
+        else:
+            paginated = self.__repository.get_recipes_paginated(
+                page=page,
+                per_page=per_page,
+                user_id=user_id,
+                category_ids=category_ids,
+                ingredient_ids=ingredient_ids,
+                mode = mode,
+                cursor=cursor,
+                with_total=with_total,
+                q=q,
+                recipe_ids=sql_recipe_ids,
+                sort=sort,
+                fieldset=fieldset
+            )
+
+        serialized_recipes = sparse_serializer(recipe_list_serializer, fieldset).dump(paginated.items)
+
+        if coverage:
+            for item, card in zip(serialized_recipes, paginated.items):
+                item['coverage'] = round(coverage[card.id], 4)
+
+        result = paginated.to_dict() | {'items': serialized_recipes}
 
-        recipes_with_stats = [
-            RecipeWithStats(
-                recipe=recipe,
-                review_count=review_count,
-                average_rating=float(average_rating) if average_rating else 0.0
+        if facets:
+            result['facets'] = self.__repository.get_recipe_facets(
+                facets, user_id, category_ids, ingredient_ids, sql_mode, q, recipe_ids=sql_recipe_ids
             )
-            for recipe, review_count, average_rating in paginated.items
-        ]
 
-        serialized_recipes = recipe_list_schema.dump(recipes_with_stats)
+        return result
 
-        return paginated.to_dict() | {'items': serialized_recipes}
+    def __page_of_ids(self, recipe_ids: List[UUID], page: int, per_page: int, with_cursor: bool,
+                      fieldset: Optional[AbstractSet[str]] = None) -> PaginatedResult:
+        """Slice an already ordered id list and load only that page from the database."""
+        start = (page - 1) * per_page
+        cards = self.__repository.get_recipe_cards_by_ids(recipe_ids[start:start + per_page], fieldset)
+        paginated = PaginatedResult(items=cards, total=len(recipe_ids), page=page, per_page=per_page)
 
-    def get_recipe_by_id(self, recipe_id: UUID) -> Optional[dict]:
-        recipe = self.__repository.get_by_id(recipe_id)
-        if not recipe:
-            raise NotFound(f'Recipe not found with id: {recipe_id}')
+        if with_cursor and paginated.has_next and cards:
+            paginated.next_cursor = CursorCodec.encode(cards[-1].created_at, cards[-1].id)
 
-        serialized = recipe_detail_schema.dump(recipe)
+        return paginated
 
+    def get_recipe_by_id(self, recipe_id: UUID, fieldset: Optional[AbstractSet[str]] = None) -> Optional[dict]:
         try:
             user_id = UUID(get_jwt_identity())
         except Exception:
             user_id = None
 
-        if user_id:
-            serialized['isReviewed'] = self.__review_repo.has_any_review(user_id, recipe_id)
-            serialized['isApprovedReview'] = self.__review_repo.has_approved_review(user_id, recipe_id)
-        else:
-            serialized['isReviewed'] = False
-            serialized['isApprovedReview'] = False
+        detail = self.__repository.get_recipe_detail(recipe_id, user_id, fieldset)
+        if detail is None:
+            raise NotFound(f'Recipe not found with id: {recipe_id}')
+
+        recipe, is_reviewed, is_approved_review = detail
+        serialized = sparse_serializer(recipe_detail_serializer, fieldset).dump(recipe)
+        if fieldset is None or 'is_reviewed' in fieldset:
+            serialized['isReviewed'] = is_reviewed
+        if fieldset is None or 'is_approved_review' in fieldset:
+            serialized['isApprovedReview'] = is_approved_review
 
         return serialized
 
+    def get_recipes_batch(self, recipe_ids: List[UUID], fieldset: Optional[AbstractSet[str]] = None) -> dict:
+        recipe_ids = list(dict.fromkeys(recipe_ids))
+        cards = self.__repository.get_recipe_cards_by_ids(recipe_ids, fieldset)
+        found = {card.id for card in cards}
+
+        return {
+            'items': sparse_serializer(recipe_list_serializer, fieldset).dump(cards),
+            'missing': [str(recipe_id) for recipe_id in recipe_ids if recipe_id not in found],
+        }
+
+    def get_similar_recipes(self, recipe_id: UUID, limit: int = SIMILAR_RECIPES_DEFAULT_LIMIT) -> dict:
+        self.__similar_index.ensure_fresh(
+            self.__signatures.get_all_packed,
+            ttl=current_app.config.get('SIMILAR_RECIPE_INDEX_TTL', 0)
+        )
+
+        if not self.__similar_index.contains(recipe_id) and self.__repository.get_by_id(recipe_id) is None:
+            raise NotFound(f'Recipe not found with id: {recipe_id}')
+
+        ranked = self.__similar_index.most_similar(recipe_id, limit)
+        cards = self.__repository.get_recipe_cards_by_ids([candidate for candidate, _ in ranked])
+
+        similarity = dict(ranked)
+        items = recipe_list_serializer.dump(cards)
+        for card, item in zip(cards, items):
+            item['similarity'] = round(similarity[card.id], 3)
+
+        return {'items': items}
+
+    def get_trending_recipes(self, per_page: int = 24, cursor: Optional[str] = None) -> dict:
+        after = CursorCodec.decode(cursor, float, UUID) if cursor else None
+
+        rows = self.__trending_cache.get_page(per_page + 1, after)
+        if rows is None:
+            rows = self.__trending.get_page(per_page + 1, after)
+            self.__trending_cache.warm(self.__trending.get_all_scores)
+
+        page = rows[:per_page]
+        cards = self.__repository.get_recipe_cards_by_ids([recipe_id for recipe_id, _ in page])
+        paginated = PaginatedResult(items=cards, total=None, page=None, per_page=per_page)
+        if len(rows) > per_page:
+            last_id, last_score = page[-1]
+            paginated.next_cursor = CursorCodec.encode(last_score, last_id)
+
+        half_life = current_app.config['TRENDING_HALF_LIFE_HOURS']
+        scores = dict(page)
+        items = recipe_list_serializer.dump(cards)
+        for card, item in zip(cards, items):
+            item['trendingScore'] = round(TrendingScore.current(scores[card.id], half_life), 4)
+
+        return paginated.to_dict() | {'items': items}
+
+    def get_viewer_context(self, recipe_ids: List[UUID]) -> dict:
+        user_id = UUID(get_jwt_identity())
+        recipe_ids = list(dict.fromkeys(recipe_ids))
+        flags = self.__review_repo.get_review_flags(user_id, recipe_ids)
+
+        return {
+            'items': [
+                {
+                    'recipeId': str(recipe_id),
+                    'isReviewed': recipe_id in flags,
+                    'isApprovedReview': flags.get(recipe_id, False),
+                }
+                for recipe_id in recipe_ids
+            ]
+        }
+
     def create(self, data: dict, image_file: Optional[FileStorage]) -> dict:
         user_id = get_jwt_identity()
         image_url = self.__cloud_uploader.upload_file(image_file, folder='recipes')
@@ -126,8 +457,15 @@ class RecipeService:
                 RecipeCategory(category_id=category_id)
             )
 
+        revision = self.__bump_recipes()
         created_recipe = self.__repository.create(recipe)
-        return recipe_detail_schema.dump(created_recipe)
+        ingredient_ids = [ri.ingredient_id for ri in created_recipe.recipe_ingredients]
+        self.__ingredient_index.set_recipe(created_recipe.id, ingredient_ids, revision)
+        self.__update_similarity({created_recipe.id: ingredient_ids})
+        self.__autocomplete.set_entry(AutocompleteIndex.RECIPE, created_recipe.id, created_recipe.title)
+        self.__list_cache.invalidate(RecipeListCache.tags_for_recipe(created_recipe))
+        count_cache.invalidate('recipes')
+        return recipe_detail_serializer.dump(created_recipe)
 
     def update(self, recipe_id: UUID, data: dict, image_file: Optional[FileStorage] = None) -> dict:
         user_id = get_jwt_identity()
@@ -139,6 +477,8 @@ class RecipeService:
         if recipe.author_id != user_id:
             raise PermissionDenied(f'You don`\t have permission to edit this recipe')
 
+        stale_tags = RecipeListCache.tags_for_recipe(recipe)
+
         recipe.title = data.get('title', recipe.title)
         recipe.description = data.get('description', recipe.description)
         recipe.duration = data.get('duration', recipe.duration)
@@ -153,8 +493,15 @@ class RecipeService:
         self.__repository.update_ingredients(recipe, data.get('ingredients_ids', []))
         self.__repository.update_categories(recipe, data.get('category_ids', []))
 
+        revision = self.__bump_recipes(RevisionScope.recipe(recipe.id))
         updated_recipe = self.__repository.update(recipe)
-        return recipe_detail_schema.dump(updated_recipe)
+        ingredient_ids = [ri.ingredient_id for ri in updated_recipe.recipe_ingredients]
+        self.__ingredient_index.set_recipe(updated_recipe.id, ingredient_ids, revision)
+        self.__update_similarity({updated_recipe.id: ingredient_ids})
+        self.__autocomplete.set_entry(AutocompleteIndex.RECIPE, updated_recipe.id, updated_recipe.title)
+        self.__list_cache.invalidate(stale_tags | RecipeListCache.tags_for_recipe(updated_recipe))
+        count_cache.invalidate('recipes')
+        return recipe_detail_serializer.dump(updated_recipe)
 
 
     def delete(self, recipe_id: UUID) -> bool:
@@ -172,6 +519,14 @@ class RecipeService:
         if recipe.image_url:
             self.__cloud_uploader.delete_file(recipe.image_url)
 
+        stale_tags = RecipeListCache.tags_for_recipe(recipe)
+        revision = self.__bump_recipes(RevisionScope.recipe(recipe_id))
         self.__repository.delete(recipe)
+        self.__ingredient_index.remove_recipe(recipe_id, revision)
+        self.__similar_index.remove_recipe(recipe_id)
+        self.__trending_cache.remove(recipe_id)
+        self.__autocomplete.remove_entry(AutocompleteIndex.RECIPE, recipe_id)
+        self.__list_cache.invalidate(stale_tags)
+        count_cache.invalidate('recipes')
 
         return True
\ No newline at end of file
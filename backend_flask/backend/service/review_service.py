@@ -1,22 +1,37 @@
+from collections import defaultdict
+from typing import AbstractSet, List, Optional
 from uuid import UUID
 
+from flask import current_app
 from flask_jwt_extended import get_jwt_identity, get_jwt
 from injector import inject
 
+from backend.cache import RecipeListCache, TrendingRecipeCache
 from backend.exceptions import AlreadyExists, NotFound, PermissionDenied
+from backend.helpers import TrendingScore
 from backend.models import Reviews
-from backend.repositories import ReviewRepository, RoleRepository
-from backend.schemas import review_list_schema, review_schema
+from backend.pagination.count_cache import count_cache
+from backend.repositories import (ReviewRepository, RoleRepository, RecipeStatsRepository,
+                                  RevisionRepository, RevisionScope, RecipeTrendingRepository)
+from backend.schemas import review_list_serializer, review_serializer
+from backend.schemas.fieldsets import sparse_serializer
 
 
 class ReviewService:
     """
     Service for managing recipe reviews, including CRUD operations,
-    approving reviews, and pagination.
+    approving reviews, and pagination. Approved reviews are mirrored into the
+    recipe_stats aggregates in the same transaction as the review change, and
+    cached recipe lists showing the recipe are invalidated once it is committed.
+    Every write bumps the recipe's reviews revision behind the review list and
+    recipe detail ETags. Approved reviews also feed the recipe's decayed trending
+    score in recipe_trending, copied to the Redis trending set after the commit.
 
     Methods:
-        get_reviews_by_recipe(recipe_id: UUID, page: int, per_page: int) -> dict:
-            Get paginated reviews for a recipe.
+        get_reviews_by_recipe(recipe_id: UUID, page: int, per_page: int, with_total: bool, fieldset, cursor) -> dict:
+            Get paginated reviews for a recipe. `with_total=False` skips the total count; a
+            `fieldset` limits the loaded columns and dumped keys to those attributes. Pass
+            `cursor` (the `nextCursor` of a previous page) for keyset pagination on (created_at, id).
 
         create_review(data: dict) -> dict:
             Create a new review by the current user. Sets status to pending.
@@ -25,23 +40,40 @@ class ReviewService:
             Update an existing review. Only the author can update.
 
         approve_review(review_id: UUID) -> None:
-            Approve a review. Changes its status to approved.
+            Approve a review. Changes its status to approved and adds it to the recipe rating stats
+            and trending score.
 
-        get_pending_reviews(page: int, per_page: int) -> dict:
-            Get paginated list of pending reviews.
+        moderate_reviews(decisions: List[dict]) -> dict:
+            Approve or reject (delete) many reviews in one transaction with set-based statements,
+            recomputing the rating stats of the affected recipes in a single pass. Returns the
+            outcome per review id: approved, rejected, unchanged (already approved) or not_found.
+
+        get_pending_reviews(page: int, per_page: int, with_total: bool, fieldset, cursor) -> dict:
+            Get paginated list of pending reviews, optionally limited to a `fieldset` and
+            continued from a `cursor` like the recipe reviews.
 
         delete_review(review_id: UUID) -> bool:
             Delete a review. Only the author or Admin can delete.
     """
     @inject
-    def __init__(self, repository: ReviewRepository, role_repository: RoleRepository):
+    def __init__(self, repository: ReviewRepository, role_repository: RoleRepository,
+                 stats_repository: RecipeStatsRepository, list_cache: RecipeListCache,
+                 revisions: RevisionRepository, trending: RecipeTrendingRepository,
+                 trending_cache: TrendingRecipeCache):
         self.__repository = repository
         self.__role_repository = role_repository
+        self.__stats_repository = stats_repository
+        self.__list_cache = list_cache
+        self.__revisions = revisions
+        self.__trending = trending
+        self.__trending_cache = trending_cache
 
-    def get_reviews_by_recipe(self, recipe_id: UUID, page: int = 1, per_page: int = 10) -> dict:
-        paginated = self.__repository.get_reviews_by_recipe(recipe_id, page, per_page)
+    def get_reviews_by_recipe(self, recipe_id: UUID, page: int = 1, per_page: int = 10,
+                              with_total: bool = True, fieldset: Optional[AbstractSet[str]] = None,
+                              cursor: Optional[str] = None) -> dict:
+        paginated = self.__repository.get_reviews_by_recipe(recipe_id, page, per_page, with_total, fieldset, cursor)
 
-        serialized_items = review_list_schema.dump(paginated.items)
+        serialized_items = sparse_serializer(review_list_serializer, fieldset).dump(paginated.items)
 
         return paginated.to_dict() | {'items': serialized_items}
 
@@ -59,9 +91,11 @@ class ReviewService:
         review.user_id = user_id
         review.status_id = pending_status_id
 
+        self.__revisions.bump(RevisionScope.recipe_reviews(review.recipe_id))
         created_review = self.__repository.create(review)
+        count_cache.invalidate('pending_reviews')
 
-        return review_schema.dump(created_review)
+        return review_serializer.dump(created_review)
 
     def update_review(self, review_id: UUID, data: dict) -> dict:
         user_id = get_jwt_identity()
@@ -74,12 +108,26 @@ class ReviewService:
         if review is None:
             raise NotFound('Review does not exist!')
 
+        old_rating = review.rating
+
         for key, value in data.items():
             setattr(review, key, value)
 
+        stats_changed = review.rating != old_rating and self.__is_approved(review)
+        if stats_changed:
+            self.__stats_repository.apply_review_delta(review.recipe_id, 0, review.rating - old_rating)
+            self.__trending.add(review.recipe_id,
+                                self.__trending_contribution(review, review.rating)
+                                - self.__trending_contribution(review, old_rating))
+
+        self.__revisions.bump(RevisionScope.recipe_reviews(review.recipe_id))
         self.__repository.update(review)
 
-        return review_schema.dump(review)
+        if stats_changed:
+            self.__list_cache.invalidate(RecipeListCache.tags_for_recipe(review.recipe))
+            self.__sync_trending(review.recipe_id)
+
+        return review_serializer.dump(review)
 
 
     def approve_review(self, review_id: UUID) -> None:
@@ -92,14 +140,74 @@ class ReviewService:
         if not approve_status_id:
             raise NotFound('Approve status not found in DB!')
 
+        if review.status_id == approve_status_id:
+            return
+
         review.status_id = approve_status_id
+        self.__stats_repository.apply_review_delta(review.recipe_id, 1, review.rating)
+        self.__trending.add(review.recipe_id, self.__trending_contribution(review, review.rating))
+        self.__revisions.bump(RevisionScope.recipe_reviews(review.recipe_id))
         self.__repository.update(review)
+        count_cache.invalidate('pending_reviews')
+        self.__list_cache.invalidate(RecipeListCache.tags_for_recipe(review.recipe))
+        self.__sync_trending(review.recipe_id)
 
 
-    def get_pending_reviews(self, page: int = 1, per_page: int = 10) -> dict:
-        paginated = self.__repository.get_pending_reviews(page, per_page)
+    def moderate_reviews(self, decisions: List[dict]) -> dict:
+        approve_status_id = self.__repository.get_approve_status_id()
+        if not approve_status_id:
+            raise NotFound('Approve status not found in DB!')
 
-        serialized_items = review_list_schema.dump(paginated.items)
+        reviews = {review.id: review for review in
+                   self.__repository.get_for_moderation([decision['id'] for decision in decisions])}
+
+        outcomes, approve_ids, reject_ids = [], [], []
+        stats_recipe_ids, touched_recipe_ids, stale_tags = set(), set(), set()
+        trending_deltas = defaultdict(float)
+        for decision in decisions:
+            review = reviews.get(decision['id'])
+            if review is None:
+                outcome = 'not_found'
+            elif decision['action'] == 'approve' and review.status_id == approve_status_id:
+                outcome = 'unchanged'
+            else:
+                was_approved = review.status_id == approve_status_id
+                if decision['action'] == 'approve':
+                    outcome = 'approved'
+                    approve_ids.append(review.id)
+                    trending_deltas[review.recipe_id] += self.__trending_contribution(review, review.rating)
+                else:
+                    outcome = 'rejected'
+                    reject_ids.append(review.id)
+                    if was_approved:
+                        trending_deltas[review.recipe_id] -= self.__trending_contribution(review, review.rating)
+
+                touched_recipe_ids.add(review.recipe_id)
+                if decision['action'] == 'approve' or was_approved:
+                    stats_recipe_ids.add(review.recipe_id)
+                    stale_tags |= RecipeListCache.tags_for_recipe(review.recipe)
+
+            outcomes.append({'id': str(decision['id']), 'action': decision['action'], 'outcome': outcome})
+
+        if touched_recipe_ids:
+            self.__repository.moderate(approve_ids, reject_ids, approve_status_id)
+            self.__stats_repository.recompute(stats_recipe_ids)
+            self.__trending.add_many(trending_deltas)
+            self.__revisions.bump(*(RevisionScope.recipe_reviews(recipe_id) for recipe_id in touched_recipe_ids))
+        self.__repository.commit()
+
+        count_cache.invalidate('pending_reviews')
+        self.__list_cache.invalidate(stale_tags)
+        for recipe_id, score in self.__trending.get_scores(trending_deltas).items():
+            self.__trending_cache.set_score(recipe_id, score)
+
+        return {'items': outcomes}
+
+    def get_pending_reviews(self, page: int = 1, per_page: int = 10, with_total: bool = True,
+                            fieldset: Optional[AbstractSet[str]] = None, cursor: Optional[str] = None) -> dict:
+        paginated = self.__repository.get_pending_reviews(page, per_page, with_total, fieldset, cursor)
+
+        serialized_items = sparse_serializer(review_list_serializer, fieldset).dump(paginated.items)
 
         return paginated.to_dict() | {'items': serialized_items}
 
@@ -117,6 +225,28 @@ class ReviewService:
         if review is None:
             raise NotFound('Review does not exist!')
 
+        stale_tags = set()
+        was_approved = self.__is_approved(review)
+        if was_approved:
+            self.__stats_repository.apply_review_delta(review.recipe_id, -1, -review.rating)
+            self.__trending.add(review.recipe_id, -self.__trending_contribution(review, review.rating))
+            stale_tags = RecipeListCache.tags_for_recipe(review.recipe)
+
+        self.__revisions.bump(RevisionScope.recipe_reviews(review.recipe_id))
         self.__repository.delete(review)
+        count_cache.invalidate('pending_reviews')
+        self.__list_cache.invalidate(stale_tags)
+        if was_approved:
+            self.__sync_trending(review.recipe_id)
+
+        return True
+
+    @staticmethod
+    def __trending_contribution(review: Reviews, rating: int) -> float:
+        return TrendingScore.contribution(rating, review.created_at, current_app.config['TRENDING_HALF_LIFE_HOURS'])
+
+    def __sync_trending(self, recipe_id: UUID) -> None:
+        self.__trending_cache.set_score(recipe_id, self.__trending.get_score(recipe_id))
 
-        return True
\ No newline at end of file
+    def __is_approved(self, review: Reviews) -> bool:
+        return review.status_id is not None and review.status_id == self.__repository.get_approve_status_id()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AbstractSet, Optional
 from uuid import UUID
 
 from flask_jwt_extended import get_jwt_identity
@@ -8,8 +8,9 @@ from werkzeug.datastructures import FileStorage
 from backend import CloudinaryUploader
 from backend.exceptions import NotFound, PermissionDenied, AlreadyExists
 from backend.models import User
-from backend.repositories import UserRepository
+from backend.repositories import UserRepository, RevisionRepository, RevisionScope
 from backend.schemas import user_detail_schema
+from backend.schemas.users_schema.user_detail_schema import UserDetailSchema
 
 
 class UserService:
@@ -17,27 +18,34 @@ class UserService:
     Service for managing users, including retrieval, updating, and deletion.
 
     Methods:
-        get_by_id(user_id: UUID) -> dict:
-            Get user details by ID.
+        get_by_id(user_id: UUID, fieldset: Optional[AbstractSet[str]] = None) -> dict:
+            Get user details by ID, limited to the `fieldset` attributes if given.
 
         update_user(user_id: UUID, data: dict, avatar_file: Optional[FileStorage] = None) -> dict:
             Update user information and avatar.
-            Only the current user can update their data.
+            Only the current user can update their data. Bumps the users revision, since
+            usernames and avatars are embedded in recipe and review responses.
 
         delete_user(user_id: UUID) -> bool:
             Delete a user. Only the current user can delete themselves.
     """
     @inject
-    def __init__(self, repository: UserRepository, cloud_uploader: CloudinaryUploader):
+    def __init__(self, repository: UserRepository, cloud_uploader: CloudinaryUploader,
+                 revisions: RevisionRepository):
         self.__repository = repository
         self.__cloud_uploader = cloud_uploader
+        self.__revisions = revisions
 
-    def get_by_id(self, user_id: UUID) -> dict:
-        user = self.__repository.get_by_id(user_id)
+    def get_by_id(self, user_id: UUID, fieldset: Optional[AbstractSet[str]] = None) -> dict:
+        if fieldset is None:
+            user = self.__repository.get_by_id(user_id)
+        else:
+            user = self.__repository.get_sparse_by_id(user_id, fieldset)
         if user is None:
             raise NotFound(f'Cannot find user with id: {user_id}')
 
-        return user_detail_schema.dump(user)
+        schema = user_detail_schema if fieldset is None else UserDetailSchema(only=fieldset)
+        return schema.dump(user)
 
     def update_user(self, user_id: UUID, data: dict, avatar_file: Optional[FileStorage] = None) -> dict:
         current_user_id = get_jwt_identity()
@@ -59,6 +67,7 @@ class UserService:
         for key, value in data.items():
             setattr(user, key, value)
 
+        self.__revisions.bump(RevisionScope.USERS)
         self.__repository.update(user)
         return user_detail_schema.dump(user)
 
@@ -0,0 +1,207 @@
+import random
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from statistics import median
+from uuid import uuid4
+
+from flask import Flask
+from sqlalchemy import event, insert
+
+from backend import AppFactory
+from backend.config import Config
+from backend.extensions import db, migrate, api, jwt, limiter
+from backend.models import (Role, User, Category, Ingredient, Recipe, RecipeStats, RecipeCategory,
+                            RecipeIngredient, RecipeStep, Reviews, ReviewStatus)
+
+
+class BenchmarkConfig(Config):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    TESTING = True
+    DEBUG = False
+    PAGINATION_COUNT_CACHE_TTL = 0
+    RECIPE_LIST_CACHE_TTL = 0
+
+
+def create_benchmark_app(config_class=BenchmarkConfig) -> Flask:
+    return AppFactory.create_app(
+        Flask(__name__),
+        extensions=[
+            lambda factory: db.init_app(factory),
+            lambda factory: migrate.init_app(factory, db),
+            lambda factory: api.init_app(factory),
+            lambda factory: jwt.init_app(factory),
+            lambda factory: limiter.init_app(factory),
+        ],
+        config_class=config_class,
+    )
+
+
+def seed_dataset(recipes: int = 5000, users: int = 200, ingredients: int = 80, categories: int = 15,
+                 ingredients_per_recipe: int = 8, categories_per_recipe: int = 2,
+                 reviews_per_recipe: int = 5, seed: int = 42) -> dict:
+    """Bulk-insert a synthetic catalog into the current app's database and return the generated ids."""
+    rng = random.Random(seed)
+    session = db.session
+
+    role_id, pending_id, approved_id = uuid4(), uuid4(), uuid4()
+    session.execute(insert(Role), [{'id': role_id, 'name': 'User'}])
+    session.execute(insert(ReviewStatus), [{'id': pending_id, 'name': 'pending'},
+                                           {'id': approved_id, 'name': 'approved'}])
+
+    user_ids = [uuid4() for _ in range(users)]
+    session.execute(insert(User), [
+        {'id': user_id, 'username': f'user_{index}', 'password_hash': 'x',
+         'first_name': 'Bench', 'last_name': 'User', 'role_id': role_id}
+        for index, user_id in enumerate(user_ids)
+    ])
+
+    ingredient_ids = [uuid4() for _ in range(ingredients)]
+    session.execute(insert(Ingredient), [
+        {'id': ingredient_id, 'name': f'ingredient {index}', 'icon_url': 'https://example.com/i.png'}
+        for index, ingredient_id in enumerate(ingredient_ids)
+    ])
+
+    category_ids = [uuid4() for _ in range(categories)]
+    session.execute(insert(Category), [
+        {'id': category_id, 'name': f'category {index}', 'icon_url': 'https://example.com/c.png'}
+        for index, category_id in enumerate(category_ids)
+    ])
+
+    started = datetime(2025, 1, 1)
+    recipe_rows, stats_rows, step_rows, ingredient_rows, category_rows, review_rows = [], [], [], [], [], []
+    recipe_ids = []
+    for index in range(recipes):
+        recipe_id = uuid4()
+        recipe_ids.append(recipe_id)
+        recipe_rows.append({
+            'id': recipe_id, 'title': f'Recipe {index}', 'description': f'Tasty dish number {index}',
+            'duration': rng.randint(5, 240), 'servings_count': rng.randint(1, 8),
+            'author_id': rng.choice(user_ids), 'created_at': started + timedelta(minutes=index),
+        })
+        step_rows.extend(
+            {'id': uuid4(), 'recipe_id': recipe_id, 'step_number': number, 'description': f'Step {number}'}
+            for number in range(1, 4)
+        )
+        ingredient_rows.extend(
+            {'recipe_id': recipe_id, 'ingredient_id': ingredient_id}
+            for ingredient_id in rng.sample(ingredient_ids, ingredients_per_recipe)
+        )
+        category_rows.extend(
+            {'recipe_id': recipe_id, 'category_id': category_id}
+            for category_id in rng.sample(category_ids, categories_per_recipe)
+        )
+
+        ratings = []
+        for reviewer_id in rng.sample(user_ids, reviews_per_recipe):
+            rating = rng.randint(1, 5)
+            approved = rng.random() < 0.8
+            if approved:
+                ratings.append(rating)
+            review_rows.append({
+                'id': uuid4(), 'user_id': reviewer_id, 'recipe_id': recipe_id, 'rating': rating,
+                'comment': 'Nice', 'status_id': approved_id if approved else pending_id,
+                'created_at': started + timedelta(minutes=index, seconds=len(review_rows) % 60),
+            })
+        stats_rows.append({
+            'recipe_id': recipe_id, 'review_count': len(ratings), 'rating_sum': sum(ratings),
+            'average_rating': sum(ratings) / len(ratings) if ratings else 0.0,
+        })
+
+    for model, rows in ((Recipe, recipe_rows), (RecipeStats, stats_rows), (RecipeStep, step_rows),
+                        (RecipeIngredient, ingredient_rows), (RecipeCategory, category_rows),
+                        (Reviews, review_rows)):
+        session.execute(insert(model), rows)
+    session.commit()
+
+    return {
+        'user_ids': user_ids,
+        'recipe_ids': recipe_ids,
+        'ingredient_ids': ingredient_ids,
+        'category_ids': category_ids,
+        'approved_status_id': approved_id,
+        'pending_status_id': pending_id,
+    }
+
+
+class QueryRecorder:
+    """Captures every statement sent to the database while active."""
+
+    def __init__(self, engine):
+        self._engine = engine
+        self.statements = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        event.listen(self._engine, 'before_cursor_execute', self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self._engine, 'before_cursor_execute', self._before_cursor_execute)
+
+    def rows_transferred(self) -> int:
+        """Re-run the captured SELECTs on a raw DBAPI cursor and count the rows they return."""
+        connection = self._engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            total = 0
+            for statement, parameters in self.statements:
+                if statement.lstrip().upper().startswith('SELECT'):
+                    cursor.execute(statement, parameters)
+                    total += len(cursor.fetchall())
+            return total
+        finally:
+            connection.close()
+
+
+@contextmanager
+def fresh_session():
+    try:
+        yield db.session
+    finally:
+        db.session.rollback()
+        db.session.expunge_all()
+
+
+def measure(func, repeat: int = 20) -> dict:
+    """Run `func` `repeat` times on a clean session and report latency percentiles in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        with fresh_session():
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        'median_ms': round(median(timings), 3),
+        'p95_ms': round(timings[int(len(timings) * 0.95) - 1], 3),
+    }
+
+
+def measure_memory(func) -> dict:
+    """Run `func` once on a clean session under tracemalloc and report the peak allocation in KiB."""
+    with fresh_session():
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {'peak_kib': round(peak / 1024, 1)}
+
+
+def print_table(title: str, rows: list[dict]) -> None:
+    print(f'\n{title}')
+    if not rows:
+        return
+
+    headers = list(rows[0].keys())
+    widths = {header: max(len(header), *(len(str(row[header])) for row in rows)) for header in headers}
+    print('  '.join(header.ljust(widths[header]) for header in headers))
+    for row in rows:
+        print('  '.join(str(row[header]).ljust(widths[header]) for header in headers))
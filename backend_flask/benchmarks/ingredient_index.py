@@ -0,0 +1,79 @@
+"""
+Compare ingredient matching in SQL with the in-memory IngredientIndex.
+
+"sql" runs the ingredient subquery of RecipeRepository (HAVING count(distinct) for "and"),
+"index" answers the same question from IngredientIndex bitsets. Only the matching ids are
+produced in both cases; loading the page itself is the same for both.
+
+Run from backend_flask/:
+    python -m benchmarks.ingredient_index [--recipes 5000] [--repeat 50]
+"""
+import argparse
+from time import perf_counter
+
+from sqlalchemy import func, select
+
+from backend.extensions import db
+from backend.indexes import IngredientIndex
+from backend.models import RecipeIngredient
+from backend.repositories import RecipeRepository
+from benchmarks.common import create_benchmark_app, seed_dataset, measure, print_table
+
+
+def sql_matching_ids(ingredient_ids, mode):
+    query = select(RecipeIngredient.recipe_id).where(RecipeIngredient.ingredient_id.in_(ingredient_ids))
+    if mode == 'and':
+        query = query.group_by(RecipeIngredient.recipe_id).having(
+            func.count(func.distinct(RecipeIngredient.ingredient_id)) == len(ingredient_ids)
+        )
+    else:
+        query = query.distinct()
+
+    return db.session.execute(query).scalars().all()
+
+
+def index_matching_ids(index: IngredientIndex, ingredient_ids, mode):
+    if mode == 'and':
+        return index.match_all(ingredient_ids)
+    if mode == 'or':
+        return index.match_any(ingredient_ids)
+    return index.rank_by_coverage(ingredient_ids)
+
+
+def run(recipes: int, repeat: int) -> None:
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        dataset = seed_dataset(recipes=recipes)
+        ingredient_ids = dataset['ingredient_ids']
+
+        index = IngredientIndex()
+        started = perf_counter()
+        index.build(RecipeRepository().get_recipe_ingredient_pairs())
+        print(f'Index build: {(perf_counter() - started) * 1000:.1f} ms')
+
+        scenarios = {
+            'and, 2 ingredients': (ingredient_ids[:2], 'and'),
+            'and, 4 ingredients': (ingredient_ids[:4], 'and'),
+            'or, 3 ingredients': (ingredient_ids[:3], 'or'),
+            'coverage, 8 ingredients': (ingredient_ids[:8], 'coverage'),
+        }
+
+        rows = []
+        for name, (ids, mode) in scenarios.items():
+            if mode != 'coverage':
+                rows.append({'scenario': name, 'variant': 'sql', 'matches': len(sql_matching_ids(ids, mode)),
+                             **measure(lambda: sql_matching_ids(ids, mode), repeat=repeat)})
+            rows.append({'scenario': name, 'variant': 'index', 'matches': len(index_matching_ids(index, ids, mode)),
+                         **measure(lambda: index_matching_ids(index, ids, mode), repeat=repeat)})
+
+        print_table(f'Ingredient matching, {recipes} recipes', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipes', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=50)
+    arguments = parser.parse_args()
+
+    run(arguments.recipes, arguments.repeat)
@@ -0,0 +1,69 @@
+"""
+Compare the stdlib and orjson response encoders on real list and detail payloads.
+
+Payloads are built by RecipeService-equivalent dumps of a seeded catalog (UUIDs left as
+UUID objects where the schemas keep them, e.g. ingredient/category ids). Output of both
+backends is checked to decode to the same JSON value first.
+
+Run from backend_flask/:
+    python -m benchmarks.json_backends [--recipes 2000] [--per-page 100] [--repeat 500]
+"""
+import argparse
+import json
+from time import perf_counter
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from backend.extensions import db
+from backend.helpers.json_backends import OrjsonJSONBackend, StdlibJSONBackend, orjson
+from backend.models import Recipe
+from backend.repositories import RecipeRepository
+from backend.schemas import recipe_list_serializer, recipe_detail_serializer
+from benchmarks.common import create_benchmark_app, seed_dataset, print_table
+
+
+def _time(func, repeat: int) -> float:
+    started = perf_counter()
+    for _ in range(repeat):
+        func()
+    return (perf_counter() - started) / repeat * 1000
+
+
+def run(recipes: int, per_page: int, repeat: int) -> None:
+    if orjson is None:
+        raise SystemExit('orjson is not installed')
+
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        seed_dataset(recipes=recipes)
+
+        paginated = RecipeRepository().get_recipes_paginated(per_page=per_page)
+        list_payload = paginated.to_dict() | {'items': recipe_list_serializer.dump(paginated.items)}
+        recipe = db.session.query(Recipe).options(joinedload(Recipe.author), selectinload(Recipe.steps)).first()
+        detail_payload = recipe_detail_serializer.dump(recipe) | {'isReviewed': False, 'isApprovedReview': False}
+
+        backends = (('stdlib', StdlibJSONBackend()), ('orjson', OrjsonJSONBackend()))
+        rows = []
+        for name, payload in ((f'recipe list ({per_page})', list_payload), ('recipe detail', detail_payload)):
+            assert json.loads(backends[0][1].dumps(payload)) == json.loads(backends[1][1].dumps(payload))
+
+            for variant, backend in backends:
+                rows.append({
+                    'payload': name,
+                    'variant': variant,
+                    'bytes': len(backend.dumps(payload)),
+                    'ms_per_dump': round(_time(lambda: backend.dumps(payload), repeat), 4),
+                })
+
+        print_table(f'JSON encoding, {repeat} dumps each', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipes', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=500)
+    arguments = parser.parse_args()
+
+    run(arguments.recipes, arguments.per_page, arguments.repeat)
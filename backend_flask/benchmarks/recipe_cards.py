@@ -0,0 +1,111 @@
+"""
+Compare ORM hydration with RecipeCard projections for one recipe list page.
+
+"orm" replays the previous read path: Recipe entities with selectin-loaded
+RecipeIngredient/Ingredient and RecipeCategory/Category objects, wrapped per row and
+dumped through fields.Method callbacks. "projection" is the current
+RecipeRepository.get_recipes_paginated + recipe_list_schema. Both produce the same
+response items; the benchmark reports latency and tracemalloc peak per page.
+
+Run from backend_flask/:
+    python -m benchmarks.recipe_cards [--recipes 5000] [--per-page 100] [--repeat 20]
+"""
+import argparse
+
+from marshmallow import Schema, fields
+from sqlalchemy.orm import selectinload
+
+from backend.extensions import db
+from backend.models import Recipe, RecipeStats, RecipeCategory, RecipeIngredient
+from backend.repositories import RecipeRepository
+from backend.schemas import recipe_list_schema
+from benchmarks.common import create_benchmark_app, seed_dataset, measure, measure_memory, print_table
+
+
+class LegacyRecipeRow:
+    def __init__(self, recipe, review_count, average_rating):
+        self.recipe = recipe
+        self.review_count = review_count
+        self.average_rating = float(average_rating) if average_rating else 0.0
+
+    def __getattr__(self, name):
+        return getattr(self.recipe, name)
+
+
+class LegacyRecipeListSchema(Schema):
+    id = fields.UUID(dump_only=True)
+    title = fields.String(dump_only=True)
+    description = fields.String(dump_only=True)
+    servings_count = fields.Integer(dump_only=True, data_key='servingsCount')
+    duration = fields.Integer(dump_only=True)
+    ingredients = fields.Method('get_ingredients')
+    categories = fields.Method('get_categories')
+    review_count = fields.Integer(dump_only=True, data_key='reviewCount')
+    average_rating = fields.Float(dump_only=True, data_key='averageRating')
+
+    def get_ingredients(self, obj):
+        return [{'id': ri.ingredient.id, 'name': ri.ingredient.name} for ri in obj.recipe_ingredients]
+
+    def get_categories(self, obj):
+        return [{'id': rc.category.id, 'name': rc.category.name} for rc in obj.recipe_categories]
+
+
+legacy_schema = LegacyRecipeListSchema(many=True)
+
+
+def orm_page(per_page: int) -> list:
+    rows = (
+        db.session.query(Recipe, RecipeStats.review_count, RecipeStats.average_rating)
+        .join(RecipeStats, RecipeStats.recipe_id == Recipe.id)
+        .options(
+            selectinload(Recipe.recipe_categories).joinedload(RecipeCategory.category),
+            selectinload(Recipe.recipe_ingredients).joinedload(RecipeIngredient.ingredient),
+        )
+        .order_by(Recipe.created_at.desc(), Recipe.id.desc())
+        .limit(per_page)
+        .all()
+    )
+    return legacy_schema.dump([LegacyRecipeRow(*row) for row in rows])
+
+
+def projection_page(per_page: int) -> list:
+    paginated = RecipeRepository().get_recipes_paginated(per_page=per_page, with_total=False)
+    return recipe_list_schema.dump(paginated.items)
+
+
+def _normalized(items: list) -> list:
+    return [
+        item | {'ingredients': sorted(item['ingredients'], key=lambda pair: str(pair['id'])),
+                'categories': sorted(item['categories'], key=lambda pair: str(pair['id']))}
+        for item in items
+    ]
+
+
+def run(recipes: int, per_page: int, repeat: int) -> None:
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        seed_dataset(recipes=recipes)
+
+        assert _normalized(orm_page(per_page)) == _normalized(projection_page(per_page))
+        db.session.expunge_all()
+
+        rows = []
+        for variant, func_ in (('orm', orm_page), ('projection', projection_page)):
+            rows.append({
+                'variant': variant,
+                **measure(lambda: func_(per_page), repeat=repeat),
+                **measure_memory(lambda: func_(per_page)),
+            })
+
+        print_table(f'Recipe list page of {per_page}, {recipes} recipes', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipes', type=int, default=5000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments = parser.parse_args()
+
+    run(arguments.recipes, arguments.per_page, arguments.repeat)
@@ -0,0 +1,102 @@
+"""
+Compare the recipe list query before and after the two-phase rewrite.
+
+"before" replays the original single query: reviews outer join + GROUP BY for the rating
+aggregates and joinedload for categories and ingredients. "after" is the current
+RecipeRepository.get_recipes_paginated.
+
+Run from backend_flask/:
+    python -m benchmarks.recipe_list_query [--recipes 5000] [--per-page 24] [--repeat 20]
+"""
+import argparse
+
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
+
+from backend.extensions import db
+from backend.models import Recipe, Reviews, RecipeCategory, RecipeIngredient
+from backend.repositories import RecipeRepository
+from benchmarks.common import create_benchmark_app, seed_dataset, QueryRecorder, measure, print_table
+
+
+def legacy_recipes_page(page: int, per_page: int, category_ids=None, ingredient_ids=None, mode='or'):
+    query = (
+        db.session.query(
+            Recipe,
+            func.count(Reviews.id).label('review_count'),
+            func.coalesce(func.avg(Reviews.rating), 0).label('average_rating')
+        )
+        .outerjoin(Reviews, Reviews.recipe_id == Recipe.id)
+        .options(
+            joinedload(Recipe.recipe_categories).joinedload(RecipeCategory.category),
+            joinedload(Recipe.recipe_ingredients).joinedload(RecipeIngredient.ingredient),
+        )
+    )
+
+    if category_ids:
+        query = query.join(RecipeCategory).filter(RecipeCategory.category_id.in_(category_ids))
+
+    if ingredient_ids:
+        query = query.join(RecipeIngredient).filter(RecipeIngredient.ingredient_id.in_(ingredient_ids))
+        if mode == 'and':
+            query = query.group_by(Recipe.id).having(
+                func.count(func.distinct(RecipeIngredient.ingredient_id)) == len(ingredient_ids)
+            )
+
+    query = query.group_by(Recipe.id).order_by(Recipe.created_at.desc())
+    total = query.count()
+    items = query.offset((page - 1) * per_page).limit(per_page).all()
+    return total, items
+
+
+def current_recipes_page(page: int, per_page: int, category_ids=None, ingredient_ids=None, mode='or'):
+    paginated = RecipeRepository().get_recipes_paginated(
+        page=page, per_page=per_page, category_ids=category_ids, ingredient_ids=ingredient_ids, mode=mode
+    )
+    for card in paginated.items:
+        [category['name'] for category in card.categories]
+        [ingredient['name'] for ingredient in card.ingredients]
+    return paginated.total, paginated.items
+
+
+def run(recipes: int, per_page: int, repeat: int) -> None:
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        dataset = seed_dataset(recipes=recipes)
+
+        scenarios = {
+            'first page': dict(page=1, per_page=per_page),
+            'deep page': dict(page=max(1, recipes // per_page // 2), per_page=per_page),
+            'category filter': dict(page=1, per_page=per_page, category_ids=dataset['category_ids'][:3]),
+            'ingredients (and)': dict(page=1, per_page=per_page, ingredient_ids=dataset['ingredient_ids'][:2],
+                                      mode='and'),
+        }
+
+        rows = []
+        for name, kwargs in scenarios.items():
+            for variant, func_ in (('before', legacy_recipes_page), ('after', current_recipes_page)):
+                with QueryRecorder(db.engine) as recorder:
+                    func_(**kwargs)
+                    db.session.rollback()
+                    db.session.expunge_all()
+
+                rows.append({
+                    'scenario': name,
+                    'variant': variant,
+                    'statements': len(recorder.statements),
+                    'rows': recorder.rows_transferred(),
+                    **measure(lambda: func_(**kwargs), repeat=repeat),
+                })
+
+        print_table(f'Recipe list query, {recipes} recipes, perPage={per_page}', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipes', type=int, default=5000)
+    parser.add_argument('--per-page', type=int, default=24)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments = parser.parse_args()
+
+    run(arguments.recipes, arguments.per_page, arguments.repeat)
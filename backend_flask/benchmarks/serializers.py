@@ -0,0 +1,73 @@
+"""
+Compare marshmallow dumps with the compiled serializers from backend.schemas.compiler.
+
+Payloads are a recipe list page, a recipe detail with author and steps, and a page of
+reviews, all loaded from a seeded catalog. Both variants are checked for equal output
+first; the table reports latency and items serialized per second.
+
+Run from backend_flask/:
+    python -m benchmarks.serializers [--recipes 2000] [--per-page 100] [--repeat 200]
+"""
+import argparse
+from time import perf_counter
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from backend.extensions import db
+from backend.models import Recipe, Reviews
+from backend.repositories import RecipeRepository
+from backend.schemas import recipe_list_serializer, recipe_detail_serializer, review_list_serializer
+from benchmarks.common import create_benchmark_app, seed_dataset, print_table
+
+
+def _time(func, repeat: int) -> float:
+    started = perf_counter()
+    for _ in range(repeat):
+        func()
+    return (perf_counter() - started) / repeat * 1000
+
+
+def run(recipes: int, per_page: int, repeat: int) -> None:
+    app = create_benchmark_app()
+    with app.app_context():
+        db.create_all()
+        seed_dataset(recipes=recipes)
+
+        cards = RecipeRepository().get_recipes_paginated(per_page=per_page, with_total=False).items
+        detail = (
+            db.session.query(Recipe)
+            .options(joinedload(Recipe.author), selectinload(Recipe.steps))
+            .first()
+        )
+        reviews = db.session.query(Reviews).options(joinedload(Reviews.user)).limit(per_page).all()
+
+        payloads = {
+            f'recipe list ({len(cards)})': (recipe_list_serializer, cards, len(cards)),
+            'recipe detail (1)': (recipe_detail_serializer, detail, 1),
+            f'review list ({len(reviews)})': (review_list_serializer, reviews, len(reviews)),
+        }
+
+        rows = []
+        for name, (serializer, payload, items) in payloads.items():
+            assert serializer.dump(payload) == serializer.schema.dump(payload)
+
+            for variant, dump in (('marshmallow', serializer.schema.dump), ('compiled', serializer.dump)):
+                elapsed_ms = _time(lambda: dump(payload), repeat)
+                rows.append({
+                    'payload': name,
+                    'variant': variant,
+                    'ms_per_dump': round(elapsed_ms, 4),
+                    'items_per_s': int(items / elapsed_ms * 1000),
+                })
+
+        print_table(f'Serializer throughput, {repeat} dumps each', rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipes', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    arguments = parser.parse_args()
+
+    run(arguments.recipes, arguments.per_page, arguments.repeat)
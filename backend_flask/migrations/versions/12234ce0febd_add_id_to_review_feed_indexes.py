@@ -0,0 +1,37 @@
+"""Add id to review feed indexes
+
+Revision ID: 12234ce0febd
+Revises: f77e86cc8bb8
+Create Date: 2026-10-18 20:11:05.518920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '12234ce0febd'
+down_revision = 'f77e86cc8bb8'
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes(with_id):
+    # Review feeds are keyset paginated on (created_at, id); the id breaks created_at ties.
+    tiebreaker = [sa.text('id DESC')] if with_id else []
+
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_reviews_status_feed')
+        batch_op.drop_index('ix_reviews_recipe_feed')
+        batch_op.create_index('ix_reviews_recipe_feed',
+                              ['recipe_id', 'status_id', sa.text('created_at DESC'), *tiebreaker], unique=False)
+        batch_op.create_index('ix_reviews_status_feed', ['status_id', sa.text('created_at DESC'), *tiebreaker],
+                              unique=False)
+
+
+def upgrade():
+    _create_indexes(with_id=True)
+
+
+def downgrade():
+    _create_indexes(with_id=False)
@@ -0,0 +1,101 @@
+"""Add search vector to recipes
+
+Revision ID: afdd8627a508
+Revises: 8bd02fa54032
+Create Date: 2026-10-18 12:31:09.114872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'afdd8627a508'
+down_revision = '8bd02fa54032'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        with op.batch_alter_table('recipes', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('search_vector', sa.Text(), nullable=True))
+        return
+
+    op.add_column('recipes', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION recipes_build_search_vector(p_recipe_id uuid, p_title text, p_description text)
+        RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('simple', coalesce(p_title, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(p_description, '')), 'B')
+                || setweight(to_tsvector('simple', coalesce(
+                       (SELECT string_agg(description, ' ' ORDER BY step_number)
+                        FROM recipe_steps
+                        WHERE recipe_id = p_recipe_id), '')), 'C')
+        $$ LANGUAGE sql STABLE
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION recipes_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := recipes_build_search_vector(NEW.id, NEW.title, NEW.description);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recipes_search_vector
+        BEFORE INSERT OR UPDATE OF title, description ON recipes
+        FOR EACH ROW EXECUTE FUNCTION recipes_search_vector_refresh()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION recipe_steps_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE recipes
+                SET search_vector = recipes_build_search_vector(id, title, description)
+                WHERE id = OLD.recipe_id;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                UPDATE recipes
+                SET search_vector = recipes_build_search_vector(id, title, description)
+                WHERE id = NEW.recipe_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_recipe_steps_search_vector
+        AFTER INSERT OR UPDATE OR DELETE ON recipe_steps
+        FOR EACH ROW EXECUTE FUNCTION recipe_steps_search_vector_refresh()
+        """
+    )
+
+    op.execute('UPDATE recipes SET search_vector = recipes_build_search_vector(id, title, description)')
+    op.create_index('ix_recipes_search_vector', 'recipes', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        with op.batch_alter_table('recipes', schema=None) as batch_op:
+            batch_op.drop_column('search_vector')
+        return
+
+    op.drop_index('ix_recipes_search_vector', table_name='recipes', postgresql_using='gin')
+    op.execute('DROP TRIGGER IF EXISTS trg_recipe_steps_search_vector ON recipe_steps')
+    op.execute('DROP TRIGGER IF EXISTS trg_recipes_search_vector ON recipes')
+    op.execute('DROP FUNCTION IF EXISTS recipe_steps_search_vector_refresh()')
+    op.execute('DROP FUNCTION IF EXISTS recipes_search_vector_refresh()')
+    op.execute('DROP FUNCTION IF EXISTS recipes_build_search_vector(uuid, text, text)')
+    op.drop_column('recipes', 'search_vector')
@@ -0,0 +1,29 @@
+"""Add status indexes for review feeds
+
+Revision ID: f77e86cc8bb8
+Revises: 68545c135c27
+Create Date: 2026-10-18 19:52:41.306118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f77e86cc8bb8'
+down_revision = '68545c135c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.create_index('ix_reviews_recipe_feed', ['recipe_id', 'status_id', sa.text('created_at DESC')],
+                              unique=False)
+        batch_op.create_index('ix_reviews_status_feed', ['status_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_reviews_status_feed')
+        batch_op.drop_index('ix_reviews_recipe_feed')
@@ -0,0 +1,117 @@
+from uuid import uuid4
+
+from backend.cache import RecipeListCache
+from backend.models import Recipe, RecipeCategory, RecipeIngredient
+
+
+class FakeRedis:
+    """Just enough of the redis client for RecipeListCache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode('utf-8')
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def expire(self, key, ttl):
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+def _cache(app, ttl=60):
+    app.config['RECIPE_LIST_CACHE_TTL'] = ttl
+    cache = RecipeListCache()
+    cache._client = FakeRedis()
+    return cache
+
+
+def test_build_key_normalizes_filters():
+    first, second = uuid4(), uuid4()
+
+    assert RecipeListCache.build_key({'category_ids': [first, second], 'mode': 'and'}) == \
+        RecipeListCache.build_key({'category_ids': [second, first], 'page': 1})
+    assert RecipeListCache.build_key({'page': 1}) != RecipeListCache.build_key({'page': 2})
+    assert RecipeListCache.build_key({'ingredient_ids': [first], 'mode': 'and'}) != \
+        RecipeListCache.build_key({'ingredient_ids': [first], 'mode': 'or'})
+
+
+def test_invalidation_only_drops_affected_tags(app):
+    author_id, category_id, other_category_id = uuid4(), uuid4(), uuid4()
+    by_category = {'category_ids': [category_id]}
+    by_other_category = {'category_ids': [other_category_id]}
+
+    with app.app_context():
+        cache = _cache(app)
+        cache.set(by_category, {'items': ['a']})
+        cache.set(by_other_category, {'items': ['b']})
+        cache.set({}, {'items': ['c']})
+
+        assert cache.get(by_category) == {'items': ['a']}
+
+        recipe = Recipe(title='Soup', description='Desc', duration=10, servings_count=1, author_id=author_id)
+        recipe.recipe_categories.append(RecipeCategory(category_id=category_id))
+        recipe.recipe_ingredients.append(RecipeIngredient(ingredient_id=uuid4()))
+        cache.invalidate(RecipeListCache.tags_for_recipe(recipe))
+
+        assert cache.get(by_category) is None
+        assert cache.get({}) is None
+        assert cache.get(by_other_category) == {'items': ['b']}
+
+        stats = cache.stats()
+        app.config['RECIPE_LIST_CACHE_TTL'] = 0
+
+    assert stats == {'enabled': True, 'lookups': 4, 'hits': 1, 'misses': 3, 'hitRatio': 0.25}
+
+
+def test_fails_open_without_redis(app):
+    with app.app_context():
+        old_url = app.config['REDIS_URL']
+        app.config['REDIS_URL'] = 'redis://127.0.0.1:1'
+        app.config['RECIPE_LIST_CACHE_TTL'] = 60
+        cache = RecipeListCache()
+
+        try:
+            assert cache.get({}) is None
+            cache.set({}, {'items': []})
+            cache.invalidate({'all'})
+            assert cache.stats()['enabled'] is False
+        finally:
+            app.config['REDIS_URL'] = old_url
+            app.config['RECIPE_LIST_CACHE_TTL'] = 0
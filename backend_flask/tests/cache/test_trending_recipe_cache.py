@@ -0,0 +1,93 @@
+from uuid import UUID
+
+from backend.cache import TrendingRecipeCache
+from tests.cache.test_recipe_list_cache import FakePipeline
+
+
+class FakeSortedSetRedis:
+    """Just enough of the redis client for TrendingRecipeCache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.data.get(key, {}).pop(member, None)
+
+    def zcount(self, key, low, high):
+        return sum(low <= score <= high for score in self.data.get(key, {}).values())
+
+    def zrevrangebyscore(self, key, max_score, min_score, start, num, withscores):
+        max_score = float(max_score)
+        rows = sorted(
+            ((member, score) for member, score in self.data.get(key, {}).items() if 0 < score <= max_score),
+            key=lambda row: (row[1], row[0]), reverse=True,
+        )
+        return [(member.encode('ascii'), score) for member, score in rows[start:start + num]]
+
+
+def _id(number: int) -> UUID:
+    return UUID(int=number)
+
+
+def _cache(app, ttl=3600):
+    app.config['TRENDING_CACHE_TTL'] = ttl
+    cache = TrendingRecipeCache()
+    cache._client = FakeSortedSetRedis()
+    return cache
+
+
+def test_pages_only_after_warm_and_skips_served_ties(app):
+    rows = [(_id(1), 2.0), (_id(2), 2.0), (_id(3), 2.0), (_id(4), 1.0), (_id(5), 0.0)]
+
+    with app.app_context():
+        try:
+            cache = _cache(app)
+            assert cache.get_page(2) is None
+
+            cache.warm(lambda: rows)
+            first_page = cache.get_page(2)
+            second_page = cache.get_page(2, tuple(reversed(first_page[-1])))
+            third_page = cache.get_page(2, tuple(reversed(second_page[-1])))
+        finally:
+            app.config['TRENDING_CACHE_TTL'] = 0
+
+    assert first_page == [(_id(3), 2.0), (_id(2), 2.0)]
+    assert second_page == [(_id(1), 2.0), (_id(4), 1.0)]
+    assert third_page == []
+
+
+def test_set_score_and_invalidate(app):
+    with app.app_context():
+        try:
+            cache = _cache(app)
+            cache.warm(lambda: [(_id(1), 1.0)])
+            cache.set_score(_id(2), 3.0)
+            cache.remove(_id(1))
+            page = cache.get_page(10)
+
+            cache.invalidate()
+            invalidated_page = cache.get_page(10)
+        finally:
+            app.config['TRENDING_CACHE_TTL'] = 0
+
+    assert page == [(_id(2), 3.0)]
+    assert invalidated_page is None
@@ -6,7 +6,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 
 from backend import AppFactory
 from backend.extensions import db, migrate, api, jwt, limiter
-from backend.repositories import RoleRepository
+from backend.repositories import RoleRepository, review_status_registry
 from backend.service import CategoryService, IngredientsService, ReviewService, RecipeService, UserService, AuthService
 from tests.test_config import TestConfig
 
@@ -55,6 +55,7 @@ def db_session(app, db_instance):
         connection.close()
 
         db.session = old_session
+        review_status_registry.clear()
 
 
 @pytest.fixture
@@ -78,24 +79,74 @@ def mock_review_repo():
     return Mock()
 
 @pytest.fixture
-def category_service(mock_repo, mock_uploader):
-    return CategoryService(repository=mock_repo, cloud_uploader=mock_uploader)
+def mock_stats_repo():
+    return Mock()
+
+@pytest.fixture
+def mock_ingredient_index():
+    return Mock()
+
+@pytest.fixture
+def mock_list_cache():
+    cache = Mock()
+    cache.get.return_value = None
+    return cache
+
+@pytest.fixture
+def mock_revision_repo():
+    return Mock()
+
+@pytest.fixture
+def mock_similar_index():
+    return Mock()
+
+@pytest.fixture
+def mock_signature_repo():
+    return Mock()
+
+@pytest.fixture
+def mock_autocomplete_index():
+    return Mock()
+
+@pytest.fixture
+def mock_trending_repo():
+    trending = Mock()
+    trending.get_score.return_value = 0.0
+    return trending
+
+@pytest.fixture
+def mock_trending_cache():
+    return Mock()
+
+@pytest.fixture
+def category_service(mock_repo, mock_uploader, mock_revision_repo, mock_autocomplete_index, mock_list_cache):
+    return CategoryService(repository=mock_repo, cloud_uploader=mock_uploader, revisions=mock_revision_repo,
+                           autocomplete=mock_autocomplete_index, list_cache=mock_list_cache)
 
 @pytest.fixture
-def ingredients_service(mock_repo, mock_uploader):
-    return IngredientsService(repository=mock_repo, cloud_uploader=mock_uploader)
+def ingredients_service(mock_repo, mock_uploader, mock_revision_repo, mock_autocomplete_index, mock_list_cache):
+    return IngredientsService(repository=mock_repo, cloud_uploader=mock_uploader, revisions=mock_revision_repo,
+                              autocomplete=mock_autocomplete_index, list_cache=mock_list_cache)
 
 @pytest.fixture
-def review_service(mock_repo, mock_role_repo):
-    return ReviewService(mock_repo, mock_role_repo)
+def review_service(mock_repo, mock_role_repo, mock_stats_repo, mock_list_cache, mock_revision_repo,
+                   mock_trending_repo, mock_trending_cache):
+    return ReviewService(mock_repo, mock_role_repo, mock_stats_repo, mock_list_cache, mock_revision_repo,
+                         mock_trending_repo, mock_trending_cache)
 
 @pytest.fixture
-def recipe_service(mock_repo, mock_review_repo, mock_uploader):
-    return RecipeService(repository=mock_repo, review_repo=mock_review_repo, cloud_uploader=mock_uploader)
+def recipe_service(mock_repo, mock_review_repo, mock_uploader, mock_ingredient_index, mock_list_cache,
+                   mock_revision_repo, mock_similar_index, mock_signature_repo, mock_trending_repo,
+                   mock_trending_cache, mock_autocomplete_index):
+    return RecipeService(repository=mock_repo, review_repo=mock_review_repo, cloud_uploader=mock_uploader,
+                         ingredient_index=mock_ingredient_index, list_cache=mock_list_cache,
+                         revisions=mock_revision_repo, similar_index=mock_similar_index,
+                         signatures=mock_signature_repo, trending=mock_trending_repo,
+                         trending_cache=mock_trending_cache, autocomplete=mock_autocomplete_index)
 
 @pytest.fixture
-def user_service(mock_repo, mock_uploader):
-    return UserService(repository=mock_repo, cloud_uploader=mock_uploader)
+def user_service(mock_repo, mock_uploader, mock_revision_repo):
+    return UserService(repository=mock_repo, cloud_uploader=mock_uploader, revisions=mock_revision_repo)
 
 @pytest.fixture
 def auth_service(mock_user_repo, mock_role_repo, mock_uploader):
@@ -0,0 +1,122 @@
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from backend.decorators.conditional_get import conditional_get
+from backend.repositories import RevisionRepository, RevisionScope
+
+
+def _handler(recipe_id):
+    handler = Mock(return_value=({'id': str(recipe_id)}, 200))
+    return conditional_get(lambda recipe_id: [RevisionScope.recipe(recipe_id)])(handler)
+
+
+def test_first_request_gets_etag(app, db_session):
+    recipe_id = uuid4()
+    handler = _handler(recipe_id)
+
+    with app.test_request_context(f'/api/recipes/{recipe_id}/'):
+        data, code, headers = handler(recipe_id=recipe_id)
+
+    handler.__wrapped__.assert_called_once_with(recipe_id=recipe_id)
+    assert code == 200
+    assert headers['ETag'].startswith('"')
+    assert headers['Cache-Control'] == 'no-cache'
+
+
+def test_matching_if_none_match_skips_handler(app, db_session):
+    recipe_id = uuid4()
+    handler = _handler(recipe_id)
+
+    with app.test_request_context(f'/api/recipes/{recipe_id}/'):
+        _, _, headers = handler(recipe_id=recipe_id)
+
+    handler.__wrapped__.reset_mock()
+    with app.test_request_context(f'/api/recipes/{recipe_id}/', headers={'If-None-Match': headers['ETag']}):
+        response = handler(recipe_id=recipe_id)
+
+    handler.__wrapped__.assert_not_called()
+    assert response.status_code == 304
+    assert response.headers['ETag'] == headers['ETag']
+
+
+def test_bump_changes_etag(app, db_session):
+    recipe_id = uuid4()
+    handler = _handler(recipe_id)
+
+    with app.test_request_context(f'/api/recipes/{recipe_id}/'):
+        _, _, before = handler(recipe_id=recipe_id)
+
+    RevisionRepository().bump(RevisionScope.recipe(recipe_id))
+    db_session.commit()
+
+    with app.test_request_context(f'/api/recipes/{recipe_id}/', headers={'If-None-Match': before['ETag']}):
+        _, code, after = handler(recipe_id=recipe_id)
+
+    assert code == 200
+    assert after['ETag'] != before['ETag']
+
+
+def test_per_viewer_etag_differs_between_users(app, db_session):
+    recipe_id = uuid4()
+    handler = Mock(return_value=({}, 200))
+    wrapped = conditional_get(lambda recipe_id: [RevisionScope.recipe(recipe_id)], per_viewer=True)(handler)
+
+    etags = []
+    for viewer in (None, str(uuid4())):
+        with app.test_request_context(f'/api/recipes/{recipe_id}/'), \
+                patch('backend.decorators.conditional_get.get_jwt_identity', return_value=viewer):
+            _, _, headers = wrapped(recipe_id=recipe_id)
+        etags.append(headers['ETag'])
+
+    assert headers['Vary'] == 'Authorization'
+    assert etags[0] != etags[1]
+
+
+def test_review_feed_total_matches_etag_after_approval(app, db_session):
+    from backend.models import Recipe, Reviews, ReviewStatus, Role, User
+    from backend.pagination.count_cache import count_cache
+    from backend.repositories import ReviewRepository
+
+    role = Role(name='User')
+    db_session.add(role)
+    db_session.flush()
+    users = [User(username=f'etag_user_{index}', password_hash='pw', first_name='E', last_name='U',
+                  role_id=role.id) for index in range(2)]
+    pending, approved = ReviewStatus(name='pending'), ReviewStatus(name='approved')
+    db_session.add_all([*users, pending, approved])
+    db_session.flush()
+    recipe = Recipe(title='Tagged', description='Desc', duration=10, servings_count=1, author_id=users[0].id)
+    db_session.add(recipe)
+    db_session.flush()
+    first = Reviews(user_id=users[0].id, recipe_id=recipe.id, status_id=approved.id, rating=5, comment='Yes')
+    second = Reviews(user_id=users[1].id, recipe_id=recipe.id, status_id=pending.id, rating=4, comment='Ok')
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    def feed(recipe_id):
+        return ReviewRepository().get_reviews_by_recipe(recipe_id).to_dict(), 200
+
+    handler = conditional_get(lambda recipe_id: [RevisionScope.recipe_reviews(recipe_id)])(feed)
+    url = f'/api/reviews/recipe/{recipe.id}/'
+    app.config['PAGINATION_COUNT_CACHE_TTL'] = 60
+    count_cache.clear()
+    try:
+        with app.test_request_context(url):
+            before, _, before_headers = handler(recipe_id=recipe.id)
+
+        second.status_id = approved.id
+        RevisionRepository().bump(RevisionScope.recipe_reviews(recipe.id))
+        db_session.commit()
+
+        with app.test_request_context(url, headers={'If-None-Match': before_headers['ETag']}):
+            after, code, after_headers = handler(recipe_id=recipe.id)
+        with app.test_request_context(url, headers={'If-None-Match': after_headers['ETag']}):
+            revalidated = handler(recipe_id=recipe.id)
+    finally:
+        app.config['PAGINATION_COUNT_CACHE_TTL'] = 0
+        count_cache.clear()
+
+    assert before['total'] == len(before['items']) == 1
+    assert code == 200
+    assert after['total'] == len(after['items']) == 2
+    assert revalidated.status_code == 304
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from backend.helpers.json_backends import JSONBackendFactory, OrjsonJSONBackend, StdlibJSONBackend, orjson
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+
+
+def _payload():
+    return {
+        'items': [
+            {'id': uuid4(), 'title': 'Борщ 🍲', 'averageRating': 4.25, 'reviewCount': 0, 'coverage': None,
+             'ingredients': [{'id': uuid4(), 'name': 'Beet'}], 'isReviewed': False},
+        ],
+        'createdAt': datetime(2025, 1, 2, 3, 4, 5, 6789),
+        'updatedAt': datetime(2025, 1, 2, tzinfo=timezone.utc),
+        'total': 1,
+        'facets': {'categories': []},
+        'big': 10 ** 3,
+        'unicode': 'line\nbreak "quoted" \\ slash',
+    }
+
+
+@requires_orjson
+def test_orjson_matches_stdlib_bytes():
+    payload = _payload()
+
+    encoded = OrjsonJSONBackend().dumps(payload)
+
+    assert encoded == StdlibJSONBackend.dumps(payload)
+    assert encoded.endswith(b'}\n')
+    assert 'Борщ 🍲'.encode('utf-8') in encoded
+
+
+@requires_orjson
+def test_orjson_documented_float_differences():
+    assert StdlibJSONBackend.dumps({'value': 1e-7}) == b'{"value":1e-07}\n'
+    assert OrjsonJSONBackend().dumps({'value': 1e-7}) == b'{"value":1e-7}\n'
+    assert StdlibJSONBackend.dumps({'value': float('nan')}) == b'{"value":NaN}\n'
+    assert OrjsonJSONBackend().dumps({'value': float('nan')}) == b'{"value":null}\n'
+
+
+@requires_orjson
+def test_orjson_falls_back_for_unsupported_values():
+    payload = {'huge': 2 ** 70, 'id': uuid4()}
+
+    assert OrjsonJSONBackend().dumps(payload) == StdlibJSONBackend.dumps(payload)
+
+    with pytest.raises(TypeError):
+        OrjsonJSONBackend().dumps({'unknown': object()})
+
+
+def test_backend_selection():
+    assert isinstance(JSONBackendFactory.create('stdlib'), StdlibJSONBackend)
+    expected = OrjsonJSONBackend if orjson is not None else StdlibJSONBackend
+    assert isinstance(JSONBackendFactory.create('auto'), expected)
+
+    with pytest.raises(ValueError):
+        JSONBackendFactory.create('ujson')
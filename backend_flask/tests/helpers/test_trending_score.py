@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.helpers import TrendingScore
+
+
+def test_contribution_halves_every_half_life():
+    now = datetime(2026, 6, 1)
+    fresh = TrendingScore.contribution(5, now, half_life_hours=24)
+    day_old = TrendingScore.contribution(5, now - timedelta(hours=24), half_life_hours=24)
+
+    assert day_old == pytest.approx(fresh / 2)
+    assert TrendingScore.current(fresh, half_life_hours=24, now=now) == pytest.approx(1.0)
+    assert TrendingScore.current(fresh + day_old, half_life_hours=24, now=now + timedelta(hours=48)) == \
+        pytest.approx(0.375)
+
+
+def test_rating_weights_contribution():
+    now = datetime(2026, 6, 1)
+
+    assert TrendingScore.contribution(1, now, 24) == pytest.approx(TrendingScore.contribution(5, now, 24) / 5)
@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+from backend.indexes import AutocompleteIndex
+from backend.indexes.autocomplete_index import normalize_name
+
+
+def _build_index():
+    soup, salad, tomato, dessert = uuid4(), uuid4(), uuid4(), uuid4()
+
+    index = AutocompleteIndex()
+    index.build([
+        (AutocompleteIndex.RECIPE, soup, 'Tomato Soup', 3),
+        (AutocompleteIndex.RECIPE, salad, 'Crème brûlée salad', 1),
+        (AutocompleteIndex.INGREDIENT, tomato, 'Tomato', 12),
+        (AutocompleteIndex.CATEGORY, dessert, 'Desserts', 5),
+    ])
+
+    return index, (soup, salad, tomato, dessert)
+
+
+def test_normalize_name():
+    assert normalize_name('  Crème   Brûlée, au-chocolat ') == 'creme brulee au chocolat'
+
+
+def test_suggest_matches_any_word_prefix_by_popularity():
+    index, (soup, salad, tomato, dessert) = _build_index()
+
+    assert index.suggest('tom', 10) == [
+        (AutocompleteIndex.INGREDIENT, tomato, 'Tomato'),
+        (AutocompleteIndex.RECIPE, soup, 'Tomato Soup'),
+    ]
+    assert index.suggest('SOU', 10) == [(AutocompleteIndex.RECIPE, soup, 'Tomato Soup')]
+    assert index.suggest('brulee', 10) == [(AutocompleteIndex.RECIPE, salad, 'Crème brûlée salad')]
+    assert index.suggest('tomato s', 10) == [(AutocompleteIndex.RECIPE, soup, 'Tomato Soup')]
+    assert index.suggest('t', 1) == [(AutocompleteIndex.INGREDIENT, tomato, 'Tomato')]
+    assert index.suggest(' ', 10) == []
+
+
+def test_set_and_remove_entry_update_terms():
+    index, (soup, salad, tomato, dessert) = _build_index()
+
+    index.set_entry(AutocompleteIndex.RECIPE, soup, 'Pumpkin soup')
+    index.remove_entry(AutocompleteIndex.CATEGORY, dessert)
+    cake = uuid4()
+    index.set_entry(AutocompleteIndex.RECIPE, cake, 'Tomato cake')
+
+    assert index.suggest('pump', 10) == [(AutocompleteIndex.RECIPE, soup, 'Pumpkin soup')]
+    assert index.suggest('tomato', 10) == [
+        (AutocompleteIndex.INGREDIENT, tomato, 'Tomato'),
+        (AutocompleteIndex.RECIPE, cake, 'Tomato cake'),
+    ]
+    assert index.suggest('des', 10) == []
+
+
+def test_updates_before_build_are_ignored():
+    index = AutocompleteIndex()
+    index.set_entry(AutocompleteIndex.RECIPE, uuid4(), 'Soup')
+
+    assert not index.is_built
+    assert index.suggest('soup', 10) == []
@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+from backend.indexes import IngredientIndex
+
+
+def _build_index():
+    flour, egg, milk, sugar = uuid4(), uuid4(), uuid4(), uuid4()
+    pancakes, omelette, meringue = uuid4(), uuid4(), uuid4()
+
+    index = IngredientIndex()
+    index.build([
+        (pancakes, flour), (pancakes, egg), (pancakes, milk),
+        (omelette, egg), (omelette, milk),
+        (meringue, egg), (meringue, sugar),
+    ])
+
+    return index, (flour, egg, milk, sugar), (pancakes, omelette, meringue)
+
+
+def test_match_all_and_any_newest_first():
+    index, (flour, egg, milk, sugar), (pancakes, omelette, meringue) = _build_index()
+
+    assert index.match_all([egg, milk]) == [omelette, pancakes]
+    assert index.match_all([flour, sugar]) == []
+    assert index.match_all([uuid4()]) == []
+    assert index.match_any([flour, sugar]) == [meringue, pancakes]
+
+
+def test_rank_by_coverage():
+    index, (flour, egg, milk, sugar), (pancakes, omelette, meringue) = _build_index()
+
+    ranked = index.rank_by_coverage([egg, milk])
+
+    assert [recipe_id for recipe_id, _ in ranked] == [omelette, pancakes, meringue]
+    assert [round(share, 2) for _, share in ranked] == [1.0, 0.67, 0.5]
+
+
+def test_incremental_updates():
+    index, (flour, egg, milk, sugar), (pancakes, omelette, meringue) = _build_index()
+    waffles = uuid4()
+
+    index.set_recipe(waffles, [flour, egg])
+    assert index.match_all([flour, egg]) == [waffles, pancakes]
+
+    index.set_recipe(pancakes, [flour, sugar])
+    assert index.match_all([egg, milk]) == [omelette]
+    assert index.match_any([sugar]) == [meringue, pancakes]
+
+    index.remove_recipe(meringue)
+    assert index.match_any([sugar]) == [pancakes]
+    assert index.rank_by_coverage([sugar]) == [(pancakes, 0.5)]
+
+
+def test_updates_are_ignored_until_built():
+    index = IngredientIndex()
+    index.set_recipe(uuid4(), [uuid4()])
+
+    assert index.is_built is False
+
+    pairs = [(uuid4(), uuid4())]
+    index.ensure_fresh(lambda: pairs, ttl=60)
+    index.ensure_fresh(lambda: [], ttl=60)
+
+    assert index.match_any([pairs[0][1]]) == [pairs[0][0]]
+
+
+def test_rebuilds_when_another_process_wrote():
+    recipe, salt, egg = uuid4(), uuid4(), uuid4()
+    index = IngredientIndex()
+    index.ensure_fresh(lambda: [(recipe, salt)], ttl=60, revision=4)
+
+    # This process's own write, the next revision: applied in place, no rebuild
+    index.set_recipe(recipe, [egg], revision=5)
+    index.ensure_fresh(lambda: [], ttl=60, revision=5)
+    assert index.match_any([egg]) == [recipe]
+
+    # Another process wrote revision 6 in between, so this write can't vouch for the index
+    index.remove_recipe(recipe, revision=7)
+    index.ensure_fresh(lambda: [(recipe, salt)], ttl=60, revision=7)
+    assert index.match_any([salt]) == [recipe]
+    assert index.match_any([egg]) == []
+
+
+def test_updated_recipe_keeps_its_place_across_pages(db_session):
+    from datetime import datetime, timedelta
+
+    from backend.models import Ingredient, Recipe, RecipeIngredient, Role, User
+    from backend.pagination.cursor import CursorCodec
+    from backend.repositories import IngredientRepository, RecipeRepository, RoleRepository, UserRepository
+
+    role = RoleRepository().create(Role(name='User'))
+    author = UserRepository().create(User(username='index_user', password_hash='pw', first_name='I',
+                                          last_name='U', role_id=role.id))
+    egg, milk = (IngredientRepository().create(Ingredient(name=name, icon_url=f'https://{name}.jpg'))
+                 for name in ('Egg', 'Milk'))
+
+    recipe_repo = RecipeRepository()
+    recipes = []
+    for index in range(5):
+        recipe = Recipe(title=f'Indexed {index}', description='Desc', duration=10, servings_count=1,
+                        author_id=author.id, created_at=datetime(2026, 1, 1) + timedelta(days=index))
+        recipe.recipe_ingredients.append(RecipeIngredient(ingredient_id=egg.id))
+        recipes.append(recipe_repo.create(recipe))
+
+    index = IngredientIndex()
+    index.build(recipe_repo.get_recipe_ingredient_pairs())
+
+    oldest = recipes[0]
+    recipe_repo.update_ingredients(oldest, [egg.id, milk.id])
+    recipe_repo.update(oldest)
+    index.set_recipe(oldest.id, [egg.id, milk.id])
+
+    matched = index.match_any([egg.id])
+    first_page = recipe_repo.get_recipe_cards_by_ids(matched[:2])
+    seen = [card.id for card in first_page]
+    cursor = CursorCodec.encode(first_page[-1].created_at, first_page[-1].id)
+    while cursor:
+        page = recipe_repo.get_recipes_paginated(per_page=2, ingredient_ids=[egg.id], cursor=cursor,
+                                                 with_total=False, recipe_ids=matched)
+        seen.extend(card.id for card in page.items)
+        cursor = page.next_cursor
+
+    assert seen == [recipe.id for recipe in reversed(recipes)]
@@ -0,0 +1,72 @@
+from itertools import count
+from time import perf_counter
+from uuid import UUID
+
+
+from backend.indexes import MinHasher, SimilarRecipeIndex
+
+# Fixed ids keep the hashed sets, and so every LSH collision, the same from run to run
+_ids = count(1)
+
+
+def _id():
+    return UUID(int=next(_ids) * 0x9E3779B97F4A7C15)
+
+
+def test_signature_estimates_jaccard():
+    shared = [_id() for _ in range(8)]
+    first = shared + [_id() for _ in range(2)]
+    second = shared + [_id() for _ in range(2)]
+    unrelated = [_id() for _ in range(10)]
+
+    signature = MinHasher.signature(first)
+    assert MinHasher.signature(reversed(first)) == signature
+    assert MinHasher.unpack(MinHasher.pack(signature)) == signature
+    assert MinHasher.signature([]) is None
+
+    def estimate(other):
+        return sum(a == b for a, b in zip(signature, MinHasher.signature(other))) / MinHasher.NUM_PERM
+
+    assert estimate(second) > 0.4
+    assert estimate(unrelated) < 0.2
+
+
+def test_most_similar_ranks_bucket_candidates():
+    base = [_id() for _ in range(10)]
+    close, near, unrelated, recipe = _id(), _id(), _id(), _id()
+
+    index = SimilarRecipeIndex()
+    index.build([
+        (recipe, MinHasher.pack(MinHasher.signature(base))),
+        (close, MinHasher.pack(MinHasher.signature(base[:9] + [_id()]))),
+        (near, MinHasher.pack(MinHasher.signature(base[:8] + [_id(), _id()]))),
+        (unrelated, MinHasher.pack(MinHasher.signature([_id() for _ in range(10)]))),
+        (_id(), b'too short'),
+    ])
+
+    ranked = index.most_similar(recipe, limit=5)
+    assert [candidate for candidate, _ in ranked] == [close, near]
+    assert ranked[0][1] > ranked[1][1]
+    assert index.most_similar(recipe, limit=1) == ranked[:1]
+    assert index.most_similar(_id(), limit=5) == []
+
+    index.set_recipe(close, MinHasher.signature([_id()]))
+    assert [candidate for candidate, _ in index.most_similar(recipe, limit=5)] == [near]
+    index.remove_recipe(near)
+    assert index.most_similar(recipe, limit=5) == []
+    assert not index.contains(near)
+
+
+def test_lookup_is_sub_millisecond():
+    pantry = [_id() for _ in range(300)]
+    index = SimilarRecipeIndex()
+    index.build(
+        (_id(), MinHasher.pack(MinHasher.signature(pantry[offset % 290:offset % 290 + 10])))
+        for offset in range(0, 3000, 3)
+    )
+    recipe = next(iter(index._signatures))
+
+    started = perf_counter()
+    for _ in range(100):
+        index.most_similar(recipe, limit=6)
+    assert (perf_counter() - started) / 100 < 0.001
@@ -1,5 +1,7 @@
-from backend.models import Ingredient
-from backend.repositories import IngredientRepository
+from uuid import uuid4
+
+from backend.models import Ingredient, Recipe, RecipeIngredient, Role, User
+from backend.repositories import IngredientRepository, RecipeRepository, RoleRepository, UserRepository
 
 
 def test_create_ingredient(db_session):
@@ -70,4 +72,50 @@ def test_is_name_exists(db_session):
     assert repo.is_name_exists('unique_ingredient') is True
     assert repo.is_name_exists('non_existent') is False
 
-    assert repo.is_name_exists('unique_ingredient', exclude_id=ingredient.id) is False
\ No newline at end of file
+    assert repo.is_name_exists('unique_ingredient', exclude_id=ingredient.id) is False
+
+
+def test_get_autocomplete_entries_counts_recipes(db_session):
+    repo = IngredientRepository()
+    egg = repo.create(Ingredient(name='Egg', icon_url='https://egg.jpg'))
+    salt = repo.create(Ingredient(name='Salt', icon_url='https://salt.jpg'))
+
+    role = RoleRepository().create(Role(name='User'))
+    author = UserRepository().create(
+        User(username='author', password_hash='pw', first_name='A', last_name='A', role_id=role.id)
+    )
+    recipe = Recipe(title='Omelette', description='Desc', duration=5, servings_count=1, author_id=author.id)
+    recipe.recipe_ingredients.append(RecipeIngredient(ingredient_id=egg.id))
+    RecipeRepository().create(recipe)
+
+    assert sorted(repo.get_autocomplete_entries(), key=lambda row: row[1]) == [
+        (egg.id, 'Egg', 1),
+        (salt.id, 'Salt', 0),
+    ]
+
+
+def test_get_recipe_references(db_session):
+    from backend.models import Category, RecipeCategory
+    from backend.repositories import CategoryRepository
+
+    repo = IngredientRepository()
+    egg = repo.create(Ingredient(name='Egg', icon_url='https://egg.jpg'))
+    salt = repo.create(Ingredient(name='Salt', icon_url='https://salt.jpg'))
+    milk = repo.create(Ingredient(name='Milk', icon_url='https://milk.jpg'))
+    breakfast = CategoryRepository().create(Category(name='Breakfast', icon_url='https://breakfast.jpg'))
+
+    role = RoleRepository().create(Role(name='User'))
+    author = UserRepository().create(
+        User(username='author', password_hash='pw', first_name='A', last_name='A', role_id=role.id)
+    )
+    omelette = Recipe(title='Omelette', description='Desc', duration=5, servings_count=1, author_id=author.id)
+    omelette.recipe_ingredients.extend([RecipeIngredient(ingredient_id=egg.id), RecipeIngredient(ingredient_id=salt.id)])
+    omelette.recipe_categories.append(RecipeCategory(category_id=breakfast.id))
+    shake = Recipe(title='Shake', description='Desc', duration=5, servings_count=1, author_id=author.id)
+    shake.recipe_ingredients.append(RecipeIngredient(ingredient_id=milk.id))
+    RecipeRepository().create(omelette)
+    RecipeRepository().create(shake)
+
+    assert repo.get_recipe_references(egg.id) == ({author.id}, {breakfast.id}, {egg.id, salt.id})
+    assert CategoryRepository().get_recipe_references(breakfast.id) == ({author.id}, {breakfast.id}, {egg.id, salt.id})
+    assert repo.get_recipe_references(uuid4()) == (set(), set(), set())
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from random import Random
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert
+
+from backend.extensions import db
+from backend.models import Role, User, Recipe, RecipeStats
+from backend.repositories import RecipeRepository
+
+SORTS = ('newest', 'top_rated', 'most_reviewed', 'quickest')
+
+
+def _seed_recipes(session, count: int = 2000) -> None:
+    rng = Random(7)
+    role_id, user_id = uuid4(), uuid4()
+    session.execute(insert(Role), [{'id': role_id, 'name': 'User'}])
+    session.execute(insert(User), [{'id': user_id, 'username': 'plan_user', 'password_hash': 'x',
+                                    'first_name': 'Plan', 'last_name': 'User', 'role_id': role_id}])
+
+    recipe_rows, stats_rows = [], []
+    for index in range(count):
+        recipe_id = uuid4()
+        review_count = rng.randint(0, 40)
+        rating_sum = sum(rng.randint(1, 5) for _ in range(review_count))
+        recipe_rows.append({'id': recipe_id, 'title': f'Recipe {index}', 'description': 'Desc',
+                            'duration': rng.randint(5, 240), 'servings_count': 1, 'author_id': user_id,
+                            'created_at': datetime(2025, 1, 1) + timedelta(minutes=index)})
+        stats_rows.append({'recipe_id': recipe_id, 'review_count': review_count, 'rating_sum': rating_sum,
+                           'average_rating': rating_sum / review_count if review_count else 0.0})
+
+    session.execute(insert(Recipe), recipe_rows)
+    session.execute(insert(RecipeStats), stats_rows)
+    session.flush()
+
+
+def _query_plan(session, call) -> list[str]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    connection = session.connection()
+    event.listen(connection, 'before_cursor_execute', record)
+    try:
+        call()
+    finally:
+        event.remove(connection, 'before_cursor_execute', record)
+
+    statement, parameters = statements[0]
+    return [row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+
+
+def _assert_index_driven(plan: list[str]) -> None:
+    assert not any(step.startswith('SCAN') and 'USING' not in step for step in plan), plan
+    assert not any('TEMP B-TREE' in step for step in plan), plan
+
+
+@pytest.mark.parametrize('sort', SORTS)
+def test_sorted_listing_uses_index(db_session, sort):
+    if db.engine.dialect.name != 'sqlite':
+        pytest.skip('Query plan assertions are written against SQLite EXPLAIN QUERY PLAN')
+
+    _seed_recipes(db_session)
+    recipe_repo = RecipeRepository()
+
+    first_page = recipe_repo.get_recipes_paginated(per_page=24, with_total=False, sort=sort)
+    _assert_index_driven(_query_plan(
+        db_session, lambda: recipe_repo.get_recipes_paginated(per_page=24, with_total=False, sort=sort)
+    ))
+    _assert_index_driven(_query_plan(
+        db_session,
+        lambda: recipe_repo.get_recipes_paginated(per_page=24, with_total=False, sort=sort,
+                                                  cursor=first_page.next_cursor)
+    ))
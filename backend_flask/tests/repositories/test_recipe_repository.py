@@ -1,6 +1,13 @@
-from backend.models import Role, User, Recipe, Ingredient, Category
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from backend.exceptions import ValidationError
+from backend.models import Role, User, Recipe, Ingredient, Category, RecipeCategory, RecipeStep
+from backend.pagination.count_cache import count_cache
 from backend.repositories import RoleRepository, UserRepository, RecipeRepository, IngredientRepository, \
-    CategoryRepository
+    CategoryRepository, review_status_registry
 
 
 def test_create_recipe_with_role(db_session):
@@ -130,4 +137,474 @@ def test_update_recipe_relations(db_session):
     assert len(recipe.recipe_ingredients) == 1
     assert recipe.recipe_ingredients[0].ingredient_id == ing1.id
     assert len(recipe.recipe_categories) == 1
-    assert recipe.recipe_categories[0].category_id == cat1.id
\ No newline at end of file
+    assert recipe.recipe_categories[0].category_id == cat1.id
+
+def test_get_recipes_paginated_cursor(db_session):
+    role = RoleRepository().create(Role(name='User'))
+    user = UserRepository().create(User(
+        username='cursor_user',
+        password_hash='hashed_pw',
+        first_name='Cursor',
+        last_name='User',
+        role_id=role.id
+    ))
+    category = CategoryRepository().create(Category(name='Dessert', icon_url='https://dessert.jpg'))
+
+    recipe_repo = RecipeRepository()
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    for index in range(5):
+        recipe = Recipe(
+            title=f'Recipe {index}',
+            description='Desc',
+            duration=10,
+            servings_count=1,
+            author_id=user.id,
+            created_at=created_at if index < 3 else created_at + timedelta(minutes=index)
+        )
+        if index % 2 == 0:
+            recipe.recipe_categories.append(RecipeCategory(category_id=category.id))
+        recipe_repo.create(recipe)
+
+    first_page = recipe_repo.get_recipes_paginated(page=1, per_page=2, user_id=user.id)
+    expected_ids = [
+        recipe.id
+        for recipe in recipe_repo.get_recipes_paginated(page=1, per_page=10, user_id=user.id).items
+    ]
+
+    assert first_page.next_cursor is not None
+
+    seen_ids = [recipe.id for recipe in first_page.items]
+    cursor = first_page.next_cursor
+    while cursor:
+        paginated = recipe_repo.get_recipes_paginated(per_page=2, user_id=user.id, cursor=cursor)
+        assert paginated.page is None
+        seen_ids.extend(recipe.id for recipe in paginated.items)
+        cursor = paginated.next_cursor
+
+    assert seen_ids == expected_ids
+    assert len(set(seen_ids)) == 5
+
+    filtered = recipe_repo.get_recipes_paginated(per_page=1, category_ids=[category.id])
+    filtered_next = recipe_repo.get_recipes_paginated(
+        per_page=5, category_ids=[category.id], cursor=filtered.next_cursor
+    )
+
+    assert filtered.total == 3
+    assert len(filtered_next.items) == 2
+    assert filtered_next.has_next is False
+    assert filtered_next.to_dict()['nextCursor'] is None
+
+
+def test_get_recipes_paginated_invalid_cursor(db_session):
+    with pytest.raises(ValidationError):
+        RecipeRepository().get_recipes_paginated(cursor='not-a-cursor')
+
+
+def _create_recipes(count: int, username: str = 'page_user') -> User:
+    role = RoleRepository().create(Role(name='User'))
+    user = UserRepository().create(User(
+        username=username,
+        password_hash='hashed_pw',
+        first_name='Page',
+        last_name='User',
+        role_id=role.id
+    ))
+
+    recipe_repo = RecipeRepository()
+    for index in range(count):
+        recipe_repo.create(Recipe(
+            title=f'Recipe {index}',
+            description='Desc',
+            duration=10,
+            servings_count=1,
+            author_id=user.id
+        ))
+
+    return user
+
+
+def test_get_recipes_paginated_window_total(db_session):
+    _create_recipes(5)
+    recipe_repo = RecipeRepository()
+
+    paginated = recipe_repo.get_recipes_paginated(page=2, per_page=2)
+    assert paginated.total == 5
+    assert len(paginated.items) == 2
+    assert paginated.has_next is True
+
+    beyond_last = recipe_repo.get_recipes_paginated(page=4, per_page=2)
+    assert beyond_last.total == 5
+    assert beyond_last.items == []
+
+
+def test_get_recipes_paginated_cursor_window_total(db_session):
+    from sqlalchemy import event
+
+    user = _create_recipes(0)
+    recipe_repo = RecipeRepository()
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    for index in range(5):
+        recipe_repo.create(Recipe(
+            title=f'Recipe {index}',
+            description='Desc',
+            duration=10,
+            servings_count=1,
+            author_id=user.id,
+            created_at=created_at + timedelta(minutes=index)
+        ))
+
+    cursor = recipe_repo.get_recipes_paginated(page=1, per_page=2, with_total=False).next_cursor
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, 'before_cursor_execute', count_statement)
+    try:
+        second = recipe_repo.get_recipes_paginated(per_page=2, cursor=cursor, fieldset={'title'})
+    finally:
+        event.remove(connection, 'before_cursor_execute', count_statement)
+
+    assert len(statements) == 1
+    assert second.total == 5
+    assert [card.title for card in second.items] == ['Recipe 2', 'Recipe 1']
+    assert second.next_cursor is not None
+
+    last = recipe_repo.get_recipes_paginated(per_page=2, cursor=second.next_cursor)
+    assert last.total == 5
+    assert [card.title for card in last.items] == ['Recipe 0']
+    assert last.next_cursor is None
+
+
+def test_get_recipes_paginated_without_total(db_session):
+    _create_recipes(3)
+    recipe_repo = RecipeRepository()
+
+    first = recipe_repo.get_recipes_paginated(page=1, per_page=2, with_total=False)
+    last = recipe_repo.get_recipes_paginated(page=2, per_page=2, with_total=False)
+
+    assert first.total is None
+    assert first.to_dict()['totalPages'] is None
+    assert first.has_next is True
+    assert len(first.items) == 2
+    assert last.has_next is False
+    assert len(last.items) == 1
+
+
+def test_get_recipes_paginated_cached_total(app, db_session):
+    _create_recipes(2)
+    recipe_repo = RecipeRepository()
+    app.config['PAGINATION_COUNT_CACHE_TTL'] = 60
+    count_cache.clear()
+
+    try:
+        assert recipe_repo.get_recipes_paginated(page=1, per_page=10).total == 2
+
+        recipe_repo.create(Recipe(
+            title='Late recipe',
+            description='Desc',
+            duration=10,
+            servings_count=1,
+            author_id=recipe_repo.get_all()[0].author_id
+        ))
+
+        cached = recipe_repo.get_recipes_paginated(page=1, per_page=10)
+        assert cached.total == 2
+        assert len(cached.items) == 3
+
+        count_cache.invalidate('pending_reviews')
+        assert recipe_repo.get_recipes_paginated(page=1, per_page=10).total == 2
+        count_cache.invalidate('recipes')
+        assert recipe_repo.get_recipes_paginated(page=1, per_page=10).total == 3
+    finally:
+        app.config['PAGINATION_COUNT_CACHE_TTL'] = 0
+        count_cache.clear()
+
+
+def test_get_recipes_paginated_search_fallback(db_session):
+    user = _create_recipes(0, username='search_user')
+    recipe_repo = RecipeRepository()
+
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    soup = Recipe(title='Tomato Soup', description='Warm and red', duration=30, servings_count=2,
+                  author_id=user.id, created_at=created_at)
+    salad = Recipe(title='Green Salad', description='Fresh leaves', duration=10, servings_count=1,
+                   author_id=user.id, created_at=created_at)
+    stew = Recipe(title='Beef Stew', description='Slow cooked', duration=120, servings_count=4,
+                  author_id=user.id, created_at=created_at)
+    stew.steps.append(RecipeStep(step_number=1, description='Add TOMATO paste'))
+    for recipe in (soup, salad, stew):
+        recipe_repo.create(recipe)
+
+    found = recipe_repo.get_recipes_paginated(page=1, per_page=10, q='tomato')
+    found_ids = {recipe.id for recipe in found.items}
+
+    assert found.total == 2
+    assert found_ids == {soup.id, stew.id}
+    assert recipe_repo.get_recipes_paginated(page=1, per_page=10, q='100%').total == 0
+
+    first = recipe_repo.get_recipes_paginated(per_page=1, q='tomato', user_id=user.id)
+    second = recipe_repo.get_recipes_paginated(per_page=1, q='tomato', user_id=user.id, cursor=first.next_cursor)
+    assert {first.items[0].id, second.items[0].id} == found_ids
+    assert second.next_cursor is None
+
+
+def test_index_helpers(db_session):
+    user = _create_recipes(3, username='index_user')
+    recipe_repo = RecipeRepository()
+    ingredient = IngredientRepository().create(Ingredient(name='Garlic', icon_url='https://garlic.jpg'))
+
+    recipes = [recipe_repo.get_by_id(card.id)
+               for card in recipe_repo.get_recipes_paginated(per_page=10, user_id=user.id).items]
+    recipe_repo.update_ingredients(recipes[0], [ingredient.id])
+    recipe_repo.update(recipes[0])
+
+    assert recipe_repo.get_recipe_ingredient_pairs() == [(recipes[0].id, ingredient.id)]
+
+    ids = [recipes[2].id, recipes[0].id]
+    cards = recipe_repo.get_recipe_cards_by_ids(ids)
+    assert [card.id for card in cards] == ids
+    assert cards[0].review_count == 0
+    assert cards[1].ingredients == [{'id': ingredient.id, 'name': 'Garlic'}]
+
+    assert recipe_repo.filter_recipe_ids(ids, user_id=user.id, q='recipe') == set(ids)
+    assert recipe_repo.filter_recipe_ids(ids, category_ids=[ingredient.id]) == set()
+
+    paginated = recipe_repo.get_recipes_paginated(per_page=10, ingredient_ids=[ingredient.id], recipe_ids=ids)
+    assert paginated.total == 2
+
+
+@pytest.mark.parametrize('sort, key', [
+    ('top_rated', lambda card: (-card.average_rating, -card.review_count)),
+    ('most_reviewed', lambda card: -card.review_count),
+    ('quickest', lambda recipe: recipe.duration),
+])
+def test_get_recipes_paginated_sorted_cursor(db_session, sort, key):
+    user = _create_recipes(0, username=f'{sort}_user')
+    recipe_repo = RecipeRepository()
+
+    for index, (duration, review_count, rating_sum) in enumerate([(30, 2, 10), (10, 4, 12), (20, 1, 5), (10, 0, 0)]):
+        recipe = Recipe(title=f'Sorted {index}', description='Desc', duration=duration, servings_count=1,
+                        author_id=user.id)
+        recipe.stats.review_count = review_count
+        recipe.stats.rating_sum = rating_sum
+        recipe.stats.average_rating = rating_sum / review_count if review_count else 0.0
+        recipe_repo.create(recipe)
+
+    paginated = recipe_repo.get_recipes_paginated(per_page=3, user_id=user.id, sort=sort)
+    seen = list(paginated.items)
+    cursor = paginated.next_cursor
+    while cursor:
+        paginated = recipe_repo.get_recipes_paginated(per_page=1, user_id=user.id, sort=sort, cursor=cursor)
+        seen.extend(paginated.items)
+        cursor = paginated.next_cursor
+
+    assert len({card.id for card in seen}) == 4
+    assert [key(card) for card in seen] == sorted(key(card) for card in seen)
+
+
+def test_get_recipe_facets(db_session):
+    user = _create_recipes(0, username='facet_user')
+    recipe_repo = RecipeRepository()
+    soup, dessert = (CategoryRepository().create(Category(name=name, icon_url=f'https://{name}.jpg'))
+                     for name in ('Soup', 'Dessert'))
+    salt, sugar = (IngredientRepository().create(Ingredient(name=name, icon_url=f'https://{name}.jpg'))
+                   for name in ('Salt', 'Sugar'))
+
+    for title, category, ingredients in [('Broth', soup, [salt]), ('Borscht', soup, [salt, sugar]),
+                                         ('Cake', dessert, [sugar])]:
+        recipe = Recipe(title=title, description='Desc', duration=10, servings_count=1, author_id=user.id)
+        recipe.recipe_categories.append(RecipeCategory(category_id=category.id))
+        recipe_repo.create(recipe)
+        recipe_repo.update_ingredients(recipe, [ingredient.id for ingredient in ingredients])
+        recipe_repo.update(recipe)
+
+    facets = recipe_repo.get_recipe_facets(['categories', 'ingredients'], user_id=user.id)
+    assert facets['categories'] == [{'id': soup.id, 'count': 2}, {'id': dessert.id, 'count': 1}]
+    assert {item['id']: item['count'] for item in facets['ingredients']} == {salt.id: 2, sugar.id: 2}
+
+    filtered = recipe_repo.get_recipe_facets(['categories'], ingredient_ids=[salt.id, sugar.id], mode='and')
+    assert filtered == {'categories': [{'id': soup.id, 'count': 1}]}
+
+
+def test_iter_recipe_exports_batches(db_session):
+    user = _create_recipes(0, username='export_user')
+    recipe_repo = RecipeRepository()
+    soup = CategoryRepository().create(Category(name='Soup', icon_url='https://soup.jpg'))
+    salt = IngredientRepository().create(Ingredient(name='Salt', icon_url='https://salt.jpg'))
+    base_time = datetime(2025, 1, 1)
+
+    for index in range(5):
+        recipe = Recipe(title=f'Export {index}', description='Desc', duration=10, servings_count=1,
+                        author_id=user.id, created_at=base_time + timedelta(minutes=index))
+        recipe.steps.append(RecipeStep(step_number=2, description='Serve'))
+        recipe.steps.append(RecipeStep(step_number=1, description='Cook'))
+        recipe.recipe_categories.append(RecipeCategory(category_id=soup.id))
+        recipe_repo.create(recipe)
+        recipe_repo.update_ingredients(recipe, [salt.id])
+        recipe_repo.update(recipe)
+
+    soup_id, salt_id = soup.id, salt.id
+    db_session.expunge_all()
+    batches = list(recipe_repo.iter_recipe_exports(batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    records = [record for batch in batches for record in batch]
+    assert [record.title for record in records] == [f'Export {index}' for index in range(5)]
+    assert [step['description'] for step in records[0].steps] == ['Cook', 'Serve']
+    assert records[0].ingredients == [{'id': salt_id, 'name': 'Salt'}]
+    assert records[0].categories == [{'id': soup_id, 'name': 'Soup'}]
+    assert records[0].review_count == 0
+    assert len(db_session.identity_map) == 0
+
+
+def test_bulk_insert_recipes_isolates_rejected_rows(db_session):
+    user = _create_recipes(0, username='import_user')
+    recipe_repo = RecipeRepository()
+    salt = IngredientRepository().create(Ingredient(name='Salt', icon_url='https://salt.jpg'))
+
+    def record(title):
+        return {
+            'recipe': {'id': uuid4(), 'title': title, 'description': 'Desc', 'duration': 10,
+                       'servings_count': 1, 'author_id': user.id},
+            'steps': [{'step_number': 1, 'description': 'Cook'}],
+            'ingredient_ids': [salt.id, salt.id],
+            'category_ids': [],
+        }
+
+    records = [record('Imported 0'), record('Imported 1'), record('Imported 0')]
+    errors = recipe_repo.bulk_insert_recipes(records)
+
+    assert list(errors) == [2]
+    imported = recipe_repo.get_recipe_cards_by_ids([records[0]['recipe']['id'], records[1]['recipe']['id']])
+    assert [card.title for card in imported] == ['Imported 0', 'Imported 1']
+    assert imported[0].ingredients == [{'id': salt.id, 'name': 'Salt'}]
+    assert recipe_repo.get_by_id(records[2]['recipe']['id']) is None
+    assert len(recipe_repo.get_by_id(records[1]['recipe']['id']).steps) == 1
+
+
+def test_bulk_insert_recipes_isolates_data_errors(db_session):
+    from unittest.mock import patch
+    from sqlalchemy.exc import DataError
+
+    user = _create_recipes(0, username='import_user')
+    recipe_repo = RecipeRepository()
+    insert_records = recipe_repo._insert_records
+
+    def record(title, duration):
+        return {
+            'recipe': {'id': uuid4(), 'title': title, 'description': 'Desc', 'duration': duration,
+                       'servings_count': 1, 'author_id': user.id},
+            'steps': [], 'ingredient_ids': [], 'category_ids': [],
+        }
+
+    def reject_out_of_range(records):
+        # SQLite stores any integer, so emulate the out-of-range error PostgreSQL raises
+        if any(item['recipe']['duration'] > 2 ** 31 - 1 for item in records):
+            raise DataError('INSERT INTO recipes', {}, Exception('integer out of range'))
+        insert_records(records)
+
+    records = [record('Fits', 10), record('Too long', 2 ** 31)]
+    with patch.object(recipe_repo, '_insert_records', side_effect=reject_out_of_range):
+        errors = recipe_repo.bulk_insert_recipes(records)
+
+    assert errors == {1: 'integer out of range'}
+    assert recipe_repo.get_by_id(records[0]['recipe']['id']).title == 'Fits'
+    assert recipe_repo.get_by_id(records[1]['recipe']['id']) is None
+
+
+def test_find_missing_references(db_session):
+    salt = IngredientRepository().create(Ingredient(name='Salt', icon_url='https://salt.jpg'))
+    unknown_ingredient, unknown_category = uuid4(), uuid4()
+
+    assert RecipeRepository().find_missing_references([salt.id, unknown_ingredient], [unknown_category]) == (
+        {unknown_ingredient}, {unknown_category}
+    )
+
+
+def test_get_recipe_detail_loads_graph_in_two_statements(db_session):
+    from sqlalchemy import event
+    from backend.models import Reviews, ReviewStatus
+    from backend.schemas import recipe_detail_serializer
+
+    user = _create_recipes(0, username='detail_user')
+    viewer = UserRepository().create(User(username='detail_viewer', password_hash='pw', first_name='V',
+                                          last_name='V', role_id=user.role_id))
+    recipe_repo = RecipeRepository()
+    soup = CategoryRepository().create(Category(name='Soup', icon_url='https://soup.jpg'))
+    salt, leek = (IngredientRepository().create(Ingredient(name=name, icon_url=f'https://{name}.jpg'))
+                  for name in ('Salt', 'Leek'))
+
+    recipe = Recipe(title='Detail', description='Desc', duration=10, servings_count=1, author_id=user.id)
+    recipe.steps.extend([RecipeStep(step_number=1, description='Chop'), RecipeStep(step_number=2, description='Boil')])
+    recipe.recipe_categories.append(RecipeCategory(category_id=soup.id))
+    recipe_repo.create(recipe)
+    recipe_repo.update_ingredients(recipe, [salt.id, leek.id])
+    recipe_repo.update(recipe)
+
+    approved = ReviewStatus(name='approved')
+    db_session.add(approved)
+    db_session.flush()
+    db_session.add(Reviews(user_id=viewer.id, recipe_id=recipe.id, status_id=approved.id, rating=5, comment='Yum'))
+    db_session.commit()
+    recipe_id, viewer_id = recipe.id, viewer.id
+    db_session.expunge_all()
+    # Status ids are read once per process, not per request
+    review_status_registry.get_id(db_session, 'approved')
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, 'before_cursor_execute', count_statement)
+    try:
+        loaded, is_reviewed, is_approved_review = recipe_repo.get_recipe_detail(recipe_id, viewer_id)
+        dumped = recipe_detail_serializer.dump(loaded)
+    finally:
+        event.remove(connection, 'before_cursor_execute', count_statement)
+
+    assert 0 < len(statements) <= 2
+    assert (is_reviewed, is_approved_review) == (True, True)
+    assert dumped['author']['username'] == 'detail_user'
+    assert sorted(step['description'] for step in dumped['steps']) == ['Boil', 'Chop']
+    assert sorted(item['name'] for item in dumped['ingredients']) == ['Leek', 'Salt']
+    assert [item['name'] for item in dumped['categories']] == ['Soup']
+
+    assert recipe_repo.get_recipe_detail(recipe_id)[1:] == (False, False)
+    assert recipe_repo.get_recipe_detail(uuid4()) is None
+
+
+def test_sparse_fieldset_skips_unrequested_joins(db_session):
+    from sqlalchemy import event
+
+    _create_recipes(2, username='sparse_user')
+    recipe_repo = RecipeRepository()
+    recipe_id = recipe_repo.get_recipes_paginated(per_page=1).items[0].id
+    db_session.expunge_all()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, 'before_cursor_execute', count_statement)
+    try:
+        paginated = recipe_repo.get_recipes_paginated(per_page=2, with_total=False,
+                                                      fieldset=frozenset({'id', 'title'}))
+        cards = recipe_repo.get_recipe_cards_by_ids([recipe_id], frozenset({'title', 'categories'}))
+        recipe, is_reviewed, _ = recipe_repo.get_recipe_detail(recipe_id, uuid4(), frozenset({'title'}))
+    finally:
+        event.remove(connection, 'before_cursor_execute', count_statement)
+
+    assert {card.title for card in paginated.items} == {'Recipe 0', 'Recipe 1'}
+    assert paginated.items[0].description is None
+    assert cards[0].title and cards[0].categories == []
+    assert (recipe.title, is_reviewed) == (cards[0].title, False)
+
+    assert len(statements) == 4
+    assert not any('recipe_stats' in statement or 'recipe_ingredients' in statement for statement in statements)
+    assert not any('users' in statement or 'reviews' in statement for statement in statements)
@@ -0,0 +1,37 @@
+from backend.indexes import MinHasher
+from backend.models import Ingredient, Recipe, Role, User
+from backend.repositories import (IngredientRepository, RecipeRepository, RecipeSignatureRepository,
+                                  RoleRepository, UserRepository)
+
+
+def _create_recipe(title: str, author: User, ingredient_ids: list) -> Recipe:
+    recipe_repo = RecipeRepository()
+    recipe = recipe_repo.create(Recipe(title=title, description='Desc', duration=10, servings_count=1,
+                                       author_id=author.id))
+    recipe_repo.update_ingredients(recipe, ingredient_ids)
+    return recipe_repo.update(recipe)
+
+
+def test_save_and_replace_signatures(db_session):
+    role = RoleRepository().create(Role(name='User'))
+    author = UserRepository().create(User(username='signature_user', password_hash='pw', first_name='S',
+                                          last_name='S', role_id=role.id))
+    salt, leek = (IngredientRepository().create(Ingredient(name=name, icon_url=f'https://{name}.jpg'))
+                  for name in ('Salt', 'Leek'))
+    soup = _create_recipe('Soup', author, [salt.id, leek.id])
+    brine = _create_recipe('Brine', author, [salt.id])
+    repo = RecipeSignatureRepository()
+
+    repo.save({soup.id: b'first', brine.id: b'brine'})
+    repo.save({soup.id: b'second'})
+    assert dict(repo.get_all_packed()) == {soup.id: b'second', brine.id: b'brine'}
+
+    repo.save({brine.id: None})
+    assert dict(repo.get_all_packed()) == {soup.id: b'second'}
+
+    stored = repo.replace_all(
+        (recipe_id, MinHasher.pack(MinHasher.signature([ingredient_id])))
+        for recipe_id, ingredient_id in [(brine.id, salt.id)]
+    )
+    assert stored == 1
+    assert [recipe_id for recipe_id, _ in repo.get_all_packed()] == [brine.id]
@@ -0,0 +1,100 @@
+from backend.models import Role, User, Recipe, Reviews, ReviewStatus, RecipeStats
+from backend.repositories import RecipeStatsRepository, RecipeRepository, RoleRepository, UserRepository
+
+
+def _create_recipe_with_reviewers(db_session):
+    role = RoleRepository().create(Role(name='User'))
+    user_repo = UserRepository()
+    author = user_repo.create(User(username='author', password_hash='pw', first_name='A', last_name='A', role_id=role.id))
+    reviewers = [
+        user_repo.create(User(username=f'reviewer_{index}', password_hash='pw',
+                              first_name='R', last_name='R', role_id=role.id))
+        for index in range(3)
+    ]
+
+    recipe = RecipeRepository().create(
+        Recipe(title='Stats Recipe', description='Desc', duration=10, servings_count=1, author_id=author.id)
+    )
+
+    pending = ReviewStatus(name='pending')
+    approved = ReviewStatus(name='approved')
+    db_session.add_all([pending, approved])
+    db_session.commit()
+
+    return recipe, reviewers, pending, approved
+
+
+def test_recipe_stats_row_created_with_recipe(db_session):
+    recipe, _, _, _ = _create_recipe_with_reviewers(db_session)
+
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert stats.review_count == 0
+    assert stats.average_rating == 0
+
+
+def test_apply_review_delta_and_rebuild(db_session):
+    recipe, reviewers, pending, approved = _create_recipe_with_reviewers(db_session)
+    db_session.add_all([
+        Reviews(user_id=reviewers[0].id, recipe_id=recipe.id, status_id=approved.id, rating=5, comment='Great'),
+        Reviews(user_id=reviewers[1].id, recipe_id=recipe.id, status_id=approved.id, rating=2, comment='Meh'),
+        Reviews(user_id=reviewers[2].id, recipe_id=recipe.id, status_id=pending.id, rating=1, comment='Bad'),
+    ])
+    db_session.commit()
+
+    repo = RecipeStatsRepository()
+    repo.apply_review_delta(recipe.id, 1, 5)
+    db_session.commit()
+    db_session.expire_all()
+
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert stats.review_count == 1
+    assert stats.rating_sum == 5
+    assert stats.average_rating == 5.0
+
+    assert repo.rebuild() == 1
+    db_session.expire_all()
+
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert stats.review_count == 2
+    assert stats.rating_sum == 7
+    assert stats.average_rating == 3.5
+
+    paginated = RecipeRepository().get_recipes_paginated(page=1, per_page=10)
+    assert paginated.items[0].review_count == 2
+    assert paginated.items[0].average_rating == 3.5
+
+
+def test_apply_review_delta_recomputes_missing_row(db_session):
+    recipe, reviewers, _, approved = _create_recipe_with_reviewers(db_session)
+    db_session.add(Reviews(user_id=reviewers[0].id, recipe_id=recipe.id, status_id=approved.id, rating=4, comment='Ok'))
+    db_session.delete(recipe.stats)
+    db_session.commit()
+
+    RecipeStatsRepository().apply_review_delta(recipe.id, 1, 4)
+    db_session.commit()
+    db_session.expire_all()
+
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert stats.review_count == 1
+    assert stats.average_rating == 4.0
+
+
+def test_rebuild_without_approved_status_counts_nothing(db_session):
+    role = RoleRepository().create(Role(name='User'))
+    user_repo = UserRepository()
+    author = user_repo.create(User(username='author', password_hash='pw', first_name='A', last_name='A', role_id=role.id))
+    recipe = RecipeRepository().create(
+        Recipe(title='Stats Recipe', description='Desc', duration=10, servings_count=1, author_id=author.id)
+    )
+    pending = ReviewStatus(name='pending')
+    db_session.add(pending)
+    db_session.flush()
+    db_session.add(Reviews(user_id=author.id, recipe_id=recipe.id, status_id=pending.id, rating=5, comment='Mine'))
+    db_session.commit()
+
+    assert RecipeStatsRepository().rebuild() == 1
+    db_session.expire_all()
+
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert stats.review_count == 0
+    assert stats.average_rating == 0
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+
+from backend.helpers import TrendingScore
+from backend.models import Role, User, Recipe, Reviews, ReviewStatus
+from backend.repositories import RecipeTrendingRepository, RecipeRepository, RoleRepository, UserRepository
+
+
+def _create_recipes(db_session, count):
+    role = RoleRepository().create(Role(name='User'))
+    author = UserRepository().create(
+        User(username='author', password_hash='pw', first_name='A', last_name='A', role_id=role.id)
+    )
+    recipes = [
+        RecipeRepository().create(
+            Recipe(title=f'Trending {index}', description='Desc', duration=10, servings_count=1, author_id=author.id)
+        )
+        for index in range(count)
+    ]
+
+    return author, recipes
+
+
+def test_add_accumulates_and_pages_by_score(db_session):
+    _, recipes = _create_recipes(db_session, 3)
+    repo = RecipeTrendingRepository()
+
+    repo.add(recipes[0].id, 1.0)
+    repo.add(recipes[1].id, 3.0)
+    repo.add(recipes[2].id, 2.0)
+    repo.add(recipes[0].id, 1.5)
+    db_session.commit()
+
+    assert repo.get_score(recipes[0].id) == 2.5
+    first_page = repo.get_page(2)
+    assert [recipe_id for recipe_id, _ in first_page] == [recipes[1].id, recipes[0].id]
+
+    second_page = repo.get_page(2, tuple(reversed(first_page[-1])))
+    assert second_page == [(recipes[2].id, 2.0)]
+
+    repo.add_many({recipes[0].id: -0.5, recipes[2].id: 1.0})
+    db_session.commit()
+    assert repo.get_scores([recipes[0].id, recipes[2].id]) == {recipes[0].id: 2.0, recipes[2].id: 3.0}
+
+
+def test_rebuild_from_approved_reviews(db_session):
+    author, recipes = _create_recipes(db_session, 2)
+    pending, approved = ReviewStatus(name='pending'), ReviewStatus(name='approved')
+    db_session.add_all([pending, approved])
+    db_session.commit()
+
+    reviewed_at = datetime(2026, 3, 1)
+    db_session.add_all([
+        Reviews(user_id=author.id, recipe_id=recipes[0].id, status_id=approved.id, rating=5, comment='Great',
+                created_at=reviewed_at),
+        Reviews(user_id=author.id, recipe_id=recipes[1].id, status_id=pending.id, rating=4, comment='Good',
+                created_at=reviewed_at),
+    ])
+    db_session.commit()
+
+    repo = RecipeTrendingRepository()
+    repo.add(recipes[1].id, 7.0)
+    db_session.commit()
+
+    assert repo.rebuild(half_life_hours=84) == 1
+    assert repo.get_score(recipes[0].id) == pytest.approx(TrendingScore.contribution(5, reviewed_at, 84))
+    assert repo.get_score(recipes[1].id) == 0.0
+    assert repo.get_all_scores() == [(recipes[0].id, repo.get_score(recipes[0].id))]
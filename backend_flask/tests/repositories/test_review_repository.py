@@ -23,7 +23,11 @@ def test_review_repository_methods(db_session):
 
     review = Reviews(user_id=user.id, recipe_id=recipe.id, status_id=pending_status.id, rating=5, comment='Nice')
     review = repo.create(review)
+    other_recipe = Recipe(title='Other Recipe', description='Desc', duration=30, author_id=user.id, servings_count=2)
+    db_session.add(other_recipe)
+    db_session.commit()
 
+    assert repo.get_review_flags(user.id, [recipe.id, other_recipe.id]) == {recipe.id: False}
     assert repo.is_user_already_rated(user.id, recipe.id) is True
     assert repo.has_any_review(user.id, recipe.id) is True
     assert repo.has_approved_review(user.id, recipe.id) is False
@@ -31,6 +35,7 @@ def test_review_repository_methods(db_session):
     review.status_id = approved_status.id
     repo.update(review)
     assert repo.has_approved_review(user.id, recipe.id) is True
+    assert repo.get_review_flags(user.id, [recipe.id]) == {recipe.id: True}
 
     paginated = repo.get_reviews_by_recipe(recipe.id, page=1, per_page=10)
     assert paginated.total == 1
@@ -39,9 +44,164 @@ def test_review_repository_methods(db_session):
     paginated_pending = repo.get_pending_reviews(page=1, per_page=10)
     assert paginated_pending.total == 0
 
+    without_total = repo.get_reviews_by_recipe(recipe.id, page=1, per_page=10, with_total=False)
+    assert without_total.total is None
+    assert without_total.has_next is False
+    assert without_total.items[0].id == review.id
+
     assert repo.get_pending_status_id() == pending_status.id
     assert repo.get_approve_status_id() == approved_status.id
 
 
     repo.delete(review)
-    assert repo.has_any_review(user.id, recipe.id) is False
\ No newline at end of file
+    assert repo.has_any_review(user.id, recipe.id) is False
+
+def test_review_status_registry_loads_once_and_refreshes_on_miss(db_session):
+    from sqlalchemy import event
+    from backend.repositories import review_status_registry
+
+    approved_status = ReviewStatus(name='Approved')
+    db_session.add(approved_status)
+    db_session.commit()
+
+    repo = ReviewRepository()
+    assert repo.get_approve_status_id() == approved_status.id
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, 'before_cursor_execute', count_statement)
+    try:
+        assert repo.get_approve_status_id() == approved_status.id
+    finally:
+        event.remove(connection, 'before_cursor_execute', count_statement)
+    assert statements == []
+
+    pending_status = ReviewStatus(name='pending')
+    db_session.add(pending_status)
+    db_session.commit()
+    assert repo.get_pending_status_id() == pending_status.id
+
+    review_status_registry.clear()
+    assert review_status_registry.get_id(db_session, 'PENDING') == pending_status.id
+
+
+def test_review_feeds_keyset_pagination(db_session):
+    from datetime import datetime
+
+    role = RoleRepository().create(RoleRepository()._model(name='FeedRole'))
+    recipe_author = UserRepository().create(User(username='feed_author', first_name='Feed', last_name='User',
+                                                 password_hash='hashed_pw', role_id=role.id))
+    recipe = Recipe(title='Feed Recipe', description='Desc', duration=30, author_id=recipe_author.id, servings_count=2)
+    pending_status = ReviewStatus(name='pending')
+    db_session.add_all([recipe, pending_status])
+    db_session.commit()
+
+    created_at = datetime(2026, 1, 1)
+    for index in range(5):
+        user = User(username=f'feed_user_{index}', first_name='Feed', last_name='User',
+                    password_hash='hashed_pw', role_id=role.id)
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(Reviews(user_id=user.id, recipe_id=recipe.id, status_id=pending_status.id, rating=4,
+                               comment='Fine', created_at=created_at))
+    db_session.commit()
+
+    repo = ReviewRepository()
+    first = repo.get_pending_reviews(page=1, per_page=2)
+    assert first.total == 5
+    assert first.next_cursor is not None
+
+    seen = [review.id for review in first.items]
+    cursor = first.next_cursor
+    while cursor:
+        page = repo.get_pending_reviews(per_page=2, with_total=False, cursor=cursor)
+        assert page.page is None
+        seen.extend(review.id for review in page.items)
+        cursor = page.next_cursor
+
+    assert seen == sorted(seen, reverse=True)
+    assert len(set(seen)) == 5
+    assert repo.get_reviews_by_recipe(recipe.id, cursor=first.next_cursor).items == []
+
+
+def test_moderate_updates_and_deletes_in_bulk(db_session):
+    from backend.models import RecipeStats
+    from backend.repositories import RecipeStatsRepository
+
+    role = RoleRepository().create(RoleRepository()._model(name='ModRole'))
+    users = []
+    for index in range(3):
+        user = User(username=f'mod_user_{index}', first_name='Mod', last_name='User',
+                    password_hash='hashed_pw', role_id=role.id)
+        db_session.add(user)
+        users.append(user)
+    db_session.flush()
+
+    recipe = Recipe(title='Moderated', description='Desc', duration=30, author_id=users[0].id, servings_count=2)
+    pending_status, approved_status = ReviewStatus(name='pending'), ReviewStatus(name='approved')
+    db_session.add_all([recipe, pending_status, approved_status])
+    db_session.flush()
+
+    keep, spam, old = (
+        Reviews(user_id=user.id, recipe_id=recipe.id, status_id=status_id, rating=rating, comment='Text')
+        for user, status_id, rating in ((users[0], pending_status.id, 4), (users[1], pending_status.id, 1),
+                                        (users[2], approved_status.id, 2))
+    )
+    db_session.add_all([keep, spam, old])
+    db_session.commit()
+
+    repo = ReviewRepository()
+    locked = repo.get_for_moderation([keep.id, spam.id, old.id])
+    assert {review.id for review in locked} == {keep.id, spam.id, old.id}
+    assert locked[0].recipe.recipe_categories == []
+
+    repo.moderate([keep.id], [spam.id, old.id], approved_status.id)
+    RecipeStatsRepository().recompute([recipe.id])
+    repo.commit()
+
+    assert repo.get_pending_reviews().total == 0
+    assert [review.id for review in repo.get_reviews_by_recipe(recipe.id).items] == [keep.id]
+    stats = db_session.get(RecipeStats, recipe.id)
+    assert (stats.review_count, stats.rating_sum, stats.average_rating) == (1, 4, 4.0)
+
+
+def test_review_feeds_are_index_driven(db_session):
+    from datetime import datetime, timedelta
+    from uuid import uuid4
+
+    from sqlalchemy import insert
+
+    from tests.repositories.test_recipe_query_plans import _assert_index_driven, _query_plan
+
+    role_id, author_id, recipe_id = uuid4(), uuid4(), uuid4()
+    user_ids = [uuid4() for _ in range(200)]
+    approved, pending = ReviewStatus(name='approved'), ReviewStatus(name='pending')
+    db_session.add_all([approved, pending])
+    db_session.execute(insert(RoleRepository()._model), [{'id': role_id, 'name': 'PlanRole'}])
+    db_session.execute(insert(User), [{'id': user_id, 'username': f'plan_user_{index}', 'password_hash': 'x',
+                                       'first_name': 'Plan', 'last_name': 'User', 'role_id': role_id}
+                                      for index, user_id in enumerate([author_id, *user_ids])])
+    db_session.execute(insert(Recipe), [{'id': recipe_id, 'title': 'Plan', 'description': 'Desc', 'duration': 1,
+                                         'servings_count': 1, 'author_id': author_id}])
+    db_session.flush()
+    db_session.execute(insert(Reviews), [
+        {'id': uuid4(), 'user_id': user_id, 'recipe_id': recipe_id, 'rating': 4, 'comment': 'Fine',
+         'status_id': (approved.id, pending.id)[index % 2], 'created_at': datetime(2026, 1, 1) + timedelta(minutes=index)}
+        for index, user_id in enumerate(user_ids)
+    ])
+    db_session.flush()
+
+    repo = ReviewRepository()
+    cursor = repo.get_pending_reviews(per_page=2).next_cursor
+    feeds = {
+        'ix_reviews_recipe_feed': lambda: repo.get_reviews_by_recipe(recipe_id, with_total=False, cursor=cursor),
+        'ix_reviews_status_feed': lambda: repo.get_pending_reviews(with_total=False, cursor=cursor),
+    }
+    for index_name, call in feeds.items():
+        plan = _query_plan(db_session, call)
+        _assert_index_driven(plan)
+        assert any(index_name in step for step in plan), plan
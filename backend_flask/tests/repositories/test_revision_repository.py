@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from backend.repositories import RevisionRepository, RevisionScope
+
+
+def test_unknown_scopes_start_at_zero(db_session):
+    repo = RevisionRepository()
+
+    assert repo.get_revisions([RevisionScope.CATEGORIES, RevisionScope.USERS]) == {
+        RevisionScope.CATEGORIES: 0,
+        RevisionScope.USERS: 0,
+    }
+
+
+def test_bump_increments_each_scope_once(db_session):
+    repo = RevisionRepository()
+    recipe_scope = RevisionScope.recipe(uuid4())
+
+    assert repo.bump(RevisionScope.CATEGORIES, recipe_scope, recipe_scope) == {
+        RevisionScope.CATEGORIES: 1,
+        recipe_scope: 1,
+    }
+    assert repo.bump(RevisionScope.CATEGORIES) == {RevisionScope.CATEGORIES: 2}
+    db_session.commit()
+
+    assert repo.get_revisions([RevisionScope.CATEGORIES, recipe_scope, RevisionScope.INGREDIENTS]) == {
+        RevisionScope.CATEGORIES: 2,
+        recipe_scope: 1,
+        RevisionScope.INGREDIENTS: 0,
+    }
+
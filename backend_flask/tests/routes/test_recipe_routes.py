@@ -0,0 +1,33 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from backend.service import RecipeService
+
+
+def test_list_parses_repeated_ingredient_ids(app):
+    first, second = uuid4(), uuid4()
+
+    with patch.object(RecipeService, 'get_recipes', return_value={'items': []}) as get_recipes:
+        response = app.test_client().get(f'/api/recipes/?ingredientIds={first}&ingredientIds={second}&mode=and')
+
+    assert response.status_code == 200
+    filters = get_recipes.call_args.args[0]
+    assert filters['ingredient_ids'] == [first, second]
+    assert filters['mode'] == 'and'
+
+
+def test_list_coverage_mode_with_ingredient_ids(app):
+    ingredient_id = uuid4()
+
+    with patch.object(RecipeService, 'get_recipes', return_value={'items': []}) as get_recipes:
+        response = app.test_client().get(f'/api/recipes/?ingredientIds={ingredient_id}&mode=coverage'
+                                         f'&facets=categories')
+
+    assert response.status_code == 200
+    filters = get_recipes.call_args.args[0]
+    assert (filters['ingredient_ids'], filters['mode'], filters['facets']) == ([ingredient_id], 'coverage',
+                                                                             ['categories'])
+
+    with patch.object(RecipeService, 'get_recipes') as get_recipes:
+        assert app.test_client().get('/api/recipes/?mode=coverage').status_code == 422
+    get_recipes.assert_not_called()
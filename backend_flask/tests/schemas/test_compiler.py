@@ -0,0 +1,114 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from marshmallow import Schema, fields, post_dump
+
+from backend.models import Category, Ingredient, Recipe, RecipeStep, Reviews, User
+from backend.schemas import (recipe_list_serializer, recipe_detail_serializer, review_serializer,
+                             review_list_serializer, category_serializer, categories_serializer,
+                             ingredient_serializer, ingredients_serializer)
+from backend.schemas.compiler import compile_schema
+from backend.schemas.recipes.recipe_card import RecipeCard
+
+
+def _user():
+    return User(id=uuid4(), username='chef', first_name='Chef', last_name='User', description=None,
+                avatar_url='https://avatar.png', created_at=datetime(2025, 1, 2, 3, 4, 5))
+
+
+def _recipe():
+    recipe = Recipe(id=uuid4(), title='Soup', description='Hot', duration=30, servings_count=2,
+                    image_url=None, created_at=datetime(2025, 5, 6, 7, 8, 9, 123456), author=_user())
+    recipe.steps = [RecipeStep(id=uuid4(), step_number=number, description=f'Step {number}') for number in (1, 2)]
+    return recipe
+
+
+def _card(**overrides):
+    values = dict(id=uuid4(), title='Soup', description='Hot', servings_count=2, duration=30,
+                  created_at=datetime(2025, 1, 1), review_count=3, average_rating=4.5,
+                  ingredients=[{'id': uuid4(), 'name': 'Salt'}], categories=[{'id': uuid4(), 'name': 'Soups'}])
+    return RecipeCard(**(values | overrides))
+
+
+def _review(user=True):
+    return Reviews(id=uuid4(), rating=4, comment='Nice', created_at=datetime(2025, 2, 3),
+                   recipe_id=uuid4(), user=_user() if user else None)
+
+
+GOLDEN_CASES = [
+    (recipe_list_serializer, lambda: [_card(), _card(title='Salad', ingredients=[], average_rating=0.0)]),
+    (recipe_detail_serializer, _recipe),
+    (recipe_detail_serializer, lambda: Recipe(id=uuid4(), title='Bare', description='No author', duration=1,
+                                              servings_count=1)),
+    (review_serializer, _review),
+    (review_list_serializer, lambda: [_review(), _review(user=False)]),
+    (category_serializer, lambda: Category(id=uuid4(), name='Soups', icon_url='https://soup.png')),
+    (categories_serializer, lambda: [Category(id=uuid4(), name='Soups', icon_url=None)]),
+    (ingredient_serializer, lambda: Ingredient(id=uuid4(), name='Salt', icon_url='https://salt.png')),
+    (ingredients_serializer, lambda: [Ingredient(id=uuid4(), name='Salt', icon_url=None)]),
+]
+
+
+@pytest.mark.parametrize('serializer, make_obj', GOLDEN_CASES)
+def test_compiled_output_matches_marshmallow(serializer, make_obj):
+    obj = make_obj()
+
+    expected = serializer.schema.dump(obj)
+    actual = serializer.dump(obj)
+
+    assert serializer.compiled is True
+    assert actual == expected
+    first_expected = expected[0] if isinstance(expected, list) else expected
+    first_actual = actual[0] if isinstance(actual, list) else actual
+    assert list(first_actual) == list(first_expected)
+
+
+def test_mapping_input_uses_marshmallow_lookup():
+    data = {'id': uuid4(), 'name': 'Soups', 'iconUrl': 'ignored', 'icon_url': 'https://soup.png'}
+
+    assert category_serializer.dump(data) == category_serializer.schema.dump(data)
+
+
+def test_unsupported_field_and_hooks_fall_back():
+    class MethodSchema(Schema):
+        id = fields.UUID()
+        label = fields.Method('get_label')
+
+        def get_label(self, obj):
+            return obj.title.upper()
+
+    class HookSchema(Schema):
+        title = fields.String()
+
+        @post_dump
+        def wrap(self, data, **kwargs):
+            return {'wrapped': data}
+
+    card = _card()
+    method_serializer = compile_schema(MethodSchema())
+    hook_serializer = compile_schema(HookSchema())
+
+    assert method_serializer.compiled is True
+    assert method_serializer.dump(card) == {'id': str(card.id), 'label': 'SOUP'}
+    assert hook_serializer.compiled is False
+    assert hook_serializer.dump(card) == {'wrapped': {'title': 'Soup'}}
+
+
+
+
+@pytest.mark.parametrize('value', [True, False, None, 1, 0, 'yes', 'f', []])
+def test_boolean_fields_match_marshmallow(value):
+    from types import SimpleNamespace
+
+    class FlagSchema(Schema):
+        flag = fields.Boolean()
+        flags = fields.List(fields.Boolean())
+
+    schema = FlagSchema()
+    obj = SimpleNamespace(flag=value, flags=[value])
+    serializer = compile_schema(schema)
+
+    assert serializer.compiled is True
+    assert serializer.dump(obj) == schema.dump(obj)
+    assert type(serializer.dump(obj)['flag']) is type(schema.dump(obj)['flag'])
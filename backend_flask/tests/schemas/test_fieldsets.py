@@ -0,0 +1,34 @@
+import pytest
+from marshmallow import ValidationError
+
+from backend.schemas import recipe_filter_schema, recipe_list_serializer, review_list_query_schema
+from backend.schemas.fieldsets import sparse_serializer
+from backend.schemas.recipes.recipe_card import RecipeCard
+
+
+def test_fieldset_maps_response_keys_to_attributes():
+    filters = recipe_filter_schema.load({'fields': 'id, title,reviewCount'})
+    assert filters['fieldset'] == frozenset({'id', 'title', 'review_count'})
+
+    assert recipe_filter_schema.load({})['fieldset'] is None
+    assert recipe_filter_schema.load({'fields': ' , '})['fieldset'] is None
+
+
+def test_fieldset_rejects_unknown_and_load_only_keys():
+    with pytest.raises(ValidationError) as error:
+        recipe_filter_schema.load({'fields': 'title,secret'})
+    assert error.value.messages == {'fields': ['Unknown fields: secret']}
+
+    with pytest.raises(ValidationError):
+        review_list_query_schema.load({'fields': 'recipeId'})
+
+
+def test_sparse_serializer_dumps_only_requested_keys():
+    card = RecipeCard(id=None, title='Soup', description='Hot', servings_count=2, duration=30,
+                      created_at=None, review_count=3, average_rating=4.5)
+
+    assert sparse_serializer(recipe_list_serializer, None) is recipe_list_serializer
+
+    sparse = sparse_serializer(recipe_list_serializer, frozenset({'title', 'review_count'}))
+    assert sparse.dump([card]) == [{'title': 'Soup', 'reviewCount': 3}]
+    assert sparse_serializer(recipe_list_serializer, frozenset({'review_count', 'title'})) is sparse
@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -73,6 +74,7 @@ def test_update_category_success(category_service, mock_repo, mock_uploader):
     category = Category(name='old', icon_url='old.jpg')
     category.id = uuid4()
     mock_repo.get_by_id.return_value = category
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
     mock_repo.is_name_exists.return_value = False
     mock_uploader.upload_file.return_value = 'new_icon.jpg'
     mock_repo.update.return_value = category
@@ -109,6 +111,7 @@ def test_delete_category_success(category_service, mock_repo, mock_uploader):
     category = Category(name='del', icon_url='icon.jpg')
     category.id = uuid4()
     mock_repo.get_by_id.return_value = category
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
 
     result = category_service.delete(category.id)
     assert result is True
@@ -116,6 +119,51 @@ def test_delete_category_success(category_service, mock_repo, mock_uploader):
     mock_repo.delete.assert_called_once_with(category)
 
 
+def test_update_category_invalidates_lists_showing_its_recipes(category_service, mock_repo, mock_list_cache):
+    category = Category(name='old', icon_url='old.jpg')
+    category.id = uuid4()
+    author_id, other_category_id, other_ingredient_id = uuid4(), uuid4(), uuid4()
+    mock_repo.get_by_id.return_value = category
+    mock_repo.is_name_exists.return_value = False
+    mock_repo.update.return_value = category
+    mock_repo.get_recipe_references.return_value = ({author_id}, {other_category_id}, {other_ingredient_id})
+
+    category_service.update(category.id, {'name': 'renamed'})
+
+    mock_repo.get_recipe_references.assert_called_once_with(category.id)
+    mock_list_cache.invalidate.assert_called_once_with({
+        'all', f'author:{author_id}', f'category:{other_category_id}', f'ingredient:{other_ingredient_id}',
+        f'category:{category.id}',
+    })
+
+
+def test_update_category_icon_only_keeps_recipe_lists(category_service, mock_repo, mock_uploader, mock_list_cache):
+    category = Category(name='same', icon_url='old.jpg')
+    category.id = uuid4()
+    mock_repo.get_by_id.return_value = category
+    mock_repo.is_name_exists.return_value = False
+    mock_repo.update.return_value = category
+    mock_uploader.upload_file.return_value = 'new_icon.jpg'
+
+    category_service.update(category.id, {'name': 'same'}, icon_file=FileStorage(filename='icon.jpg'))
+
+    mock_repo.get_recipe_references.assert_not_called()
+    mock_list_cache.invalidate.assert_not_called()
+
+
+def test_delete_category_invalidates_lists_and_totals(category_service, mock_repo, mock_list_cache):
+    category = Category(name='del', icon_url='icon.jpg')
+    category.id = uuid4()
+    mock_repo.get_by_id.return_value = category
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
+
+    with patch('backend.service.category_service.count_cache') as count_cache:
+        category_service.delete(category.id)
+
+    count_cache.invalidate.assert_called_once_with('recipes')
+    mock_list_cache.invalidate.assert_called_once_with({'all', f'category:{category.id}'})
+
+
 def test_delete_category_not_found(category_service, mock_repo):
     mock_repo.get_by_id.return_value = None
     cat_id = uuid4()
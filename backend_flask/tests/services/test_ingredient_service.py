@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -41,7 +42,7 @@ def test_get_by_id_not_found(ingredients_service, mock_repo):
         ingredients_service.get_by_id(ing_id)
 
 
-def test_create_ingredient_success(ingredients_service, mock_repo, mock_uploader):
+def test_create_ingredient_success(ingredients_service, mock_repo, mock_uploader, mock_autocomplete_index):
     data = {'name': 'new_ing'}
     file = FileStorage(filename='icon.jpg')
     mock_repo.is_name_exists.return_value = False
@@ -56,6 +57,7 @@ def test_create_ingredient_success(ingredients_service, mock_repo, mock_uploader
     mock_repo.is_name_exists.assert_called_once_with('new_ing')
     mock_repo.create.assert_called_once()
     mock_uploader.upload_file.assert_called_once_with(file, folder='ingredients')
+    mock_autocomplete_index.set_entry.assert_called_once_with('ingredient', created_ing.id, 'new_ing')
 
 
 def test_create_ingredient_already_exists(ingredients_service, mock_repo):
@@ -76,6 +78,7 @@ def test_update_ingredient_success(ingredients_service, mock_repo, mock_uploader
     ing = Ingredient(name='old', icon_url='old.jpg')
     ing.id = uuid4()
     mock_repo.get_by_id.return_value = ing
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
     mock_repo.is_name_exists.return_value = False
     mock_uploader.upload_file.return_value = 'new_icon.jpg'
     mock_repo.update.return_value = ing
@@ -112,6 +115,7 @@ def test_delete_ingredient_success(ingredients_service, mock_repo, mock_uploader
     ing = Ingredient(name='del', icon_url='icon.jpg')
     ing.id = uuid4()
     mock_repo.get_by_id.return_value = ing
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
 
     result = ingredients_service.delete(ing.id)
     assert result is True
@@ -119,6 +123,51 @@ def test_delete_ingredient_success(ingredients_service, mock_repo, mock_uploader
     mock_repo.delete.assert_called_once_with(ing)
 
 
+def test_update_ingredient_invalidates_lists_showing_its_recipes(ingredients_service, mock_repo, mock_list_cache):
+    ing = Ingredient(name='old', icon_url='old.jpg')
+    ing.id = uuid4()
+    author_id, other_category_id, other_ingredient_id = uuid4(), uuid4(), uuid4()
+    mock_repo.get_by_id.return_value = ing
+    mock_repo.is_name_exists.return_value = False
+    mock_repo.update.return_value = ing
+    mock_repo.get_recipe_references.return_value = ({author_id}, {other_category_id}, {other_ingredient_id})
+
+    ingredients_service.update(ing.id, {'name': 'renamed'})
+
+    mock_repo.get_recipe_references.assert_called_once_with(ing.id)
+    mock_list_cache.invalidate.assert_called_once_with({
+        'all', f'author:{author_id}', f'category:{other_category_id}', f'ingredient:{other_ingredient_id}',
+        f'ingredient:{ing.id}',
+    })
+
+
+def test_update_ingredient_icon_only_keeps_recipe_lists(ingredients_service, mock_repo, mock_uploader, mock_list_cache):
+    ing = Ingredient(name='same', icon_url='old.jpg')
+    ing.id = uuid4()
+    mock_repo.get_by_id.return_value = ing
+    mock_repo.is_name_exists.return_value = False
+    mock_repo.update.return_value = ing
+    mock_uploader.upload_file.return_value = 'new_icon.jpg'
+
+    ingredients_service.update(ing.id, {'name': 'same'}, icon_file=FileStorage(filename='icon.jpg'))
+
+    mock_repo.get_recipe_references.assert_not_called()
+    mock_list_cache.invalidate.assert_not_called()
+
+
+def test_delete_ingredient_invalidates_lists_and_totals(ingredients_service, mock_repo, mock_list_cache):
+    ing = Ingredient(name='del', icon_url='icon.jpg')
+    ing.id = uuid4()
+    mock_repo.get_by_id.return_value = ing
+    mock_repo.get_recipe_references.return_value = (set(), set(), set())
+
+    with patch('backend.service.ingredient_service.count_cache') as count_cache:
+        ingredients_service.delete(ing.id)
+
+    count_cache.invalidate.assert_called_once_with('recipes')
+    mock_list_cache.invalidate.assert_called_once_with({'all', f'ingredient:{ing.id}'})
+
+
 def test_delete_ingredient_not_found(ingredients_service, mock_repo):
     mock_repo.get_by_id.return_value = None
     ing_id = uuid4()
@@ -1,16 +1,15 @@
-from uuid import uuid4
+from datetime import datetime
+from uuid import UUID, uuid4
 from unittest.mock import patch
 import pytest
 from werkzeug.datastructures import FileStorage
 from backend.models import Recipe, RecipeStep, RecipeIngredient, RecipeCategory
 
 
-def test_get_recipe_by_id_found(recipe_service, mock_repo, mock_review_repo):
+def test_get_recipe_by_id_found(recipe_service, mock_repo):
     recipe = Recipe(title='Test', description='Desc', duration=10, servings_count=2, author_id=uuid4())
     recipe.id = uuid4()
-    mock_repo.get_by_id.return_value = recipe
-    mock_review_repo.has_any_review.return_value = True
-    mock_review_repo.has_approved_review.return_value = False
+    mock_repo.get_recipe_detail.return_value = (recipe, True, False)
 
     with patch('backend.service.recipe_service.get_jwt_identity', return_value=str(recipe.author_id)):
         result = recipe_service.get_recipe_by_id(recipe.id)
@@ -18,11 +17,11 @@ def test_get_recipe_by_id_found(recipe_service, mock_repo, mock_review_repo):
     assert result['title'] == 'Test'
     assert result['isReviewed'] is True
     assert result['isApprovedReview'] is False
-    mock_repo.get_by_id.assert_called_once_with(recipe.id)
+    mock_repo.get_recipe_detail.assert_called_once_with(recipe.id, recipe.author_id, None)
 
 
 def test_get_recipe_by_id_not_found(recipe_service, mock_repo):
-    mock_repo.get_by_id.return_value = None
+    mock_repo.get_recipe_detail.return_value = None
     recipe_id = uuid4()
 
     with pytest.raises(Exception):
@@ -69,7 +68,7 @@ def test_create_recipe_success(recipe_service, mock_repo, mock_uploader):
     mock_repo.create.assert_called_once()
 
 
-def test_update_recipe_success(recipe_service, mock_repo, mock_uploader):
+def test_update_recipe_success(recipe_service, mock_repo, mock_uploader, mock_signature_repo, mock_similar_index):
     user_id = uuid4()
     recipe = Recipe(title='Old', description='Desc', duration=10, servings_count=1, author_id=user_id)
     recipe.id = uuid4()
@@ -86,6 +85,8 @@ def test_update_recipe_success(recipe_service, mock_repo, mock_uploader):
     assert result['title'] == 'Updated'
     mock_uploader.upload_file.assert_called_once()
     mock_repo.update.assert_called_once()
+    mock_signature_repo.save.assert_called_once_with({recipe.id: None})
+    mock_similar_index.set_recipe.assert_called_once_with(recipe.id, None)
 
 
 def test_delete_recipe_success(recipe_service, mock_repo, mock_uploader):
@@ -102,3 +103,274 @@ def test_delete_recipe_success(recipe_service, mock_repo, mock_uploader):
     assert result is True
     mock_uploader.delete_file.assert_called_once_with('image.jpg')
     mock_repo.delete.assert_called_once_with(recipe)
+
+
+def test_get_recipes_coverage_uses_index(app, mock_repo, mock_review_repo, mock_uploader, mock_list_cache,
+                                         mock_revision_repo, mock_similar_index, mock_signature_repo,
+                                         mock_trending_repo, mock_trending_cache, mock_autocomplete_index):
+    from backend.indexes import IngredientIndex
+    from backend.schemas.recipes.recipe_card import RecipeCard
+    from backend.service import RecipeService
+
+    egg, milk, flour = uuid4(), uuid4(), uuid4()
+    omelette = RecipeCard(id=uuid4(), title='Omelette', description='Desc', servings_count=1, duration=5,
+                          created_at=datetime(2025, 1, 1), review_count=0, average_rating=0.0)
+    pancakes = RecipeCard(id=uuid4(), title='Pancakes', description='Desc', servings_count=2, duration=20,
+                          created_at=datetime(2025, 1, 2), review_count=0, average_rating=0.0)
+
+    mock_repo.get_recipe_ingredient_pairs.return_value = [
+        (pancakes.id, egg), (pancakes.id, milk), (pancakes.id, flour),
+        (omelette.id, egg), (omelette.id, milk),
+    ]
+    mock_repo.get_recipe_cards_by_ids.return_value = [omelette]
+    service = RecipeService(repository=mock_repo, review_repo=mock_review_repo, cloud_uploader=mock_uploader,
+                            ingredient_index=IngredientIndex(), list_cache=mock_list_cache, revisions=mock_revision_repo,
+                            similar_index=mock_similar_index, signatures=mock_signature_repo,
+                            trending=mock_trending_repo, trending_cache=mock_trending_cache,
+                            autocomplete=mock_autocomplete_index)
+
+    with app.app_context():
+        result = service.get_recipes({'page': 1, 'per_page': 1, 'ingredient_ids': [egg, milk], 'mode': 'coverage'})
+
+    mock_repo.get_recipe_cards_by_ids.assert_called_once_with([omelette.id], None)
+    mock_repo.get_recipes_paginated.assert_not_called()
+    assert result['total'] == 2
+    assert result['hasNext'] is True
+    assert result['nextCursor'] is None
+    assert result['items'][0] == {
+        'id': str(omelette.id), 'title': 'Omelette', 'description': 'Desc', 'servingsCount': 1, 'duration': 5,
+        'ingredients': [], 'categories': [], 'reviewCount': 0, 'averageRating': 0.0, 'coverage': 1.0,
+    }
+
+
+def test_delete_recipe_updates_index(recipe_service, mock_repo, mock_ingredient_index, mock_revision_repo):
+    user_id = uuid4()
+    recipe = Recipe(title='Old', description='Desc', duration=10, servings_count=1, author_id=user_id)
+    recipe.id = uuid4()
+    mock_repo.get_by_id.return_value = recipe
+    mock_revision_repo.bump.return_value = {'recipes': 8, f'recipe:{recipe.id}': 2}
+
+    with patch('backend.service.recipe_service.get_jwt_identity', return_value=user_id), \
+            patch('backend.service.recipe_service.get_jwt', return_value={'role': 'User'}), \
+            patch('backend.service.recipe_service.count_cache') as count_cache:
+        assert recipe_service.delete(recipe.id) is True
+
+    mock_revision_repo.bump.assert_called_once_with('recipes', f'recipe:{recipe.id}')
+    mock_ingredient_index.remove_recipe.assert_called_once_with(recipe.id, 8)
+    count_cache.invalidate.assert_called_once_with('recipes')
+
+
+def test_build_ingredient_index(recipe_service, mock_repo, mock_ingredient_index, mock_revision_repo):
+    pairs = [(uuid4(), uuid4())]
+    mock_repo.get_recipe_ingredient_pairs.return_value = pairs
+    mock_revision_repo.get_revision.return_value = 5
+
+    recipe_service.build_ingredient_index()
+
+    mock_revision_repo.get_revision.assert_called_once_with('recipes')
+    mock_ingredient_index.build.assert_called_once_with(pairs, 5)
+
+
+def test_get_recipes_served_from_cache(recipe_service, mock_repo, mock_list_cache):
+    cached = {'items': [], 'total': 0}
+    mock_list_cache.get.return_value = cached
+
+    assert recipe_service.get_recipes({'page': 1}) is cached
+    mock_repo.get_recipes_paginated.assert_not_called()
+    mock_list_cache.set.assert_not_called()
+
+
+def test_get_recipes_with_facets(recipe_service, mock_repo, mock_list_cache):
+    from backend.pagination.paginated_result import PaginatedResult
+
+    category_id = uuid4()
+    facets = {'categories': [{'id': category_id, 'count': 3}]}
+    mock_repo.get_recipes_paginated.return_value = PaginatedResult(items=[], total=0, page=1, per_page=24)
+    mock_repo.get_recipe_facets.return_value = facets
+
+    result = recipe_service.get_recipes({'page': 1, 'category_ids': [category_id], 'facets': ['categories']})
+
+    assert result['facets'] == facets
+    mock_repo.get_recipe_facets.assert_called_once_with(
+        ['categories'], None, [category_id], [], 'or', None, recipe_ids=None
+    )
+    mock_list_cache.set.assert_called_once_with(
+        {'page': 1, 'category_ids': [category_id], 'facets': ['categories']}, result
+    )
+
+
+def test_export_recipes_streams_ndjson(app, recipe_service, mock_repo):
+    import json
+    from backend.schemas.recipes.recipe_export import RecipeExportRecord
+
+    def record(title):
+        return RecipeExportRecord(id=uuid4(), title=title, description='Desc', servings_count=1, duration=5,
+                                  image_url=None, author_id=uuid4(), created_at=datetime(2025, 1, 1),
+                                  review_count=0, rating_sum=0, average_rating=0.0)
+
+    mock_repo.iter_recipe_exports.return_value = iter([[record('Soup'), record('Cake')], [record('Tea')]])
+
+    with app.app_context():
+        chunks = list(recipe_service.export_recipes())
+
+    assert len(chunks) == 2
+    lines = b''.join(chunks).decode('utf-8').splitlines()
+    assert [json.loads(line)['title'] for line in lines] == ['Soup', 'Cake', 'Tea']
+
+
+@patch('backend.service.recipe_service.get_jwt_identity')
+def test_import_recipes_reports_errors_per_line(mock_get_jwt_identity, recipe_service, mock_repo,
+                                                mock_ingredient_index, mock_list_cache, mock_revision_repo):
+    import json
+
+    author_id, salt_id, unknown_id = uuid4(), uuid4(), uuid4()
+    mock_get_jwt_identity.return_value = str(author_id)
+    mock_repo.find_missing_references.return_value = ({unknown_id}, set())
+    mock_repo.bulk_insert_recipes.return_value = {1: 'duplicate title'}
+    mock_revision_repo.bump.return_value = {'recipes': 3}
+
+    def line(title, ingredient_ids):
+        return json.dumps({'title': title, 'description': 'Desc', 'duration': 10, 'servingsCount': 1,
+                           'steps': [{'stepNumber': 1, 'description': 'Cook'}], 'categoryIds': [],
+                           'ingredientsIds': [str(value) for value in ingredient_ids]}).encode()
+
+    lines = [line('Soup', [salt_id]), b'{oops', b'\n', line('Stew', [unknown_id]),
+             line('Soup', []), json.dumps({'title': 'Tea'}).encode()]
+    report = recipe_service.import_recipes(lines)
+
+    assert report['imported'] == 1
+    assert report['failed'] == 4
+    assert [error['line'] for error in report['errors']] == [2, 4, 5, 6]
+    assert report['errors'][2]['errors'] == {'_schema': ['duplicate title']}
+
+    records = mock_repo.bulk_insert_recipes.call_args.args[0]
+    assert [record['recipe']['title'] for record in records] == ['Soup', 'Soup']
+    assert records[0]['recipe']['author_id'] == author_id
+    mock_ingredient_index.set_recipe.assert_called_once_with(records[0]['recipe']['id'], [salt_id], 3)
+    mock_list_cache.invalidate.assert_called_once_with({'all', f'author:{author_id}', f'ingredient:{salt_id}'})
+
+
+@patch('backend.service.recipe_service.get_jwt_identity')
+def test_import_recipes_rejects_values_outside_column_limits(mock_get_jwt_identity, recipe_service, mock_repo):
+    import json
+
+    mock_get_jwt_identity.return_value = str(uuid4())
+    mock_repo.find_missing_references.return_value = (set(), set())
+    mock_repo.bulk_insert_recipes.return_value = {}
+
+    def line(title, duration):
+        return json.dumps({'title': title, 'description': 'Desc', 'duration': duration, 'servingsCount': 1,
+                           'steps': [{'stepNumber': 1, 'description': 'Cook'}], 'categoryIds': [],
+                           'ingredientsIds': []}).encode()
+
+    report = recipe_service.import_recipes([line('Soup', 2 ** 31), line('Stew' + ' ' * 100, 10), line('Tea', 10)])
+
+    assert report['imported'] == 1
+    assert [error['line'] for error in report['errors']] == [1, 2]
+    assert list(report['errors'][0]['errors']) == ['duration']
+    assert list(report['errors'][1]['errors']) == ['title']
+    records = mock_repo.bulk_insert_recipes.call_args.args[0]
+    assert [record['recipe']['title'] for record in records] == ['Tea']
+
+
+def test_get_viewer_context(recipe_service, mock_review_repo):
+    viewer_id, reviewed_id, approved_id, other_id = uuid4(), uuid4(), uuid4(), uuid4()
+    mock_review_repo.get_review_flags.return_value = {reviewed_id: False, approved_id: True}
+
+    with patch('backend.service.recipe_service.get_jwt_identity', return_value=str(viewer_id)):
+        result = recipe_service.get_viewer_context([approved_id, other_id, reviewed_id, other_id])
+
+    mock_review_repo.get_review_flags.assert_called_once_with(viewer_id, [approved_id, other_id, reviewed_id])
+    assert result['items'] == [
+        {'recipeId': str(approved_id), 'isReviewed': True, 'isApprovedReview': True},
+        {'recipeId': str(other_id), 'isReviewed': False, 'isApprovedReview': False},
+        {'recipeId': str(reviewed_id), 'isReviewed': True, 'isApprovedReview': False},
+    ]
+
+
+def test_get_recipes_batch_keeps_order_and_reports_missing(recipe_service, mock_repo):
+    from backend.schemas.recipes.recipe_card import RecipeCard
+
+    stew_id, soup_id, missing_id = uuid4(), uuid4(), uuid4()
+    cards = [
+        RecipeCard(id=recipe_id, title=title, description='Desc', servings_count=1, duration=10,
+                   created_at=datetime(2025, 1, 1), review_count=0, average_rating=0.0)
+        for recipe_id, title in ((soup_id, 'Soup'), (stew_id, 'Stew'))
+    ]
+    mock_repo.get_recipe_cards_by_ids.return_value = cards
+
+    result = recipe_service.get_recipes_batch([soup_id, missing_id, stew_id, soup_id])
+
+    mock_repo.get_recipe_cards_by_ids.assert_called_once_with([soup_id, missing_id, stew_id], None)
+    assert [item['title'] for item in result['items']] == ['Soup', 'Stew']
+    assert result['missing'] == [str(missing_id)]
+
+
+def test_get_similar_recipes(app, recipe_service, mock_repo, mock_similar_index):
+    from backend.schemas.recipes.recipe_card import RecipeCard
+
+    recipe_id = uuid4()
+    stew = RecipeCard(id=uuid4(), title='Stew', description='Desc', servings_count=2, duration=40,
+                      created_at=datetime(2025, 1, 1), review_count=0, average_rating=0.0)
+    mock_similar_index.contains.return_value = True
+    mock_similar_index.most_similar.return_value = [(stew.id, 0.8125)]
+    mock_repo.get_recipe_cards_by_ids.return_value = [stew]
+
+    with app.app_context():
+        result = recipe_service.get_similar_recipes(recipe_id, 3)
+
+    mock_similar_index.most_similar.assert_called_once_with(recipe_id, 3)
+    mock_repo.get_by_id.assert_not_called()
+    assert [(item['title'], item['similarity']) for item in result['items']] == [('Stew', 0.812)]
+
+
+def test_get_similar_recipes_unknown_recipe(app, recipe_service, mock_repo, mock_similar_index):
+    from backend.exceptions import NotFound
+
+    mock_similar_index.contains.return_value = False
+    mock_repo.get_by_id.return_value = None
+
+    with app.app_context(), pytest.raises(NotFound):
+        recipe_service.get_similar_recipes(uuid4())
+
+
+def test_get_trending_recipes_falls_back_to_table(app, recipe_service, mock_repo, mock_trending_repo,
+                                                  mock_trending_cache):
+    from backend.helpers import TrendingScore
+    from backend.pagination.cursor import CursorCodec
+    from backend.schemas.recipes.recipe_card import RecipeCard
+
+    first, second, third = uuid4(), uuid4(), uuid4()
+    score = TrendingScore.contribution(5, datetime.utcnow(), app.config['TRENDING_HALF_LIFE_HOURS'])
+    card = RecipeCard(id=first, title='Soup', description='Desc', servings_count=1, duration=10,
+                      created_at=datetime(2026, 1, 1), review_count=1, average_rating=5.0)
+    mock_trending_cache.get_page.return_value = None
+    mock_trending_repo.get_page.return_value = [(first, score), (second, score / 2), (third, score / 4)]
+    mock_repo.get_recipe_cards_by_ids.return_value = [card]
+
+    with app.app_context():
+        result = recipe_service.get_trending_recipes(per_page=2)
+
+    mock_trending_repo.get_page.assert_called_once_with(3, None)
+    mock_trending_cache.warm.assert_called_once_with(mock_trending_repo.get_all_scores)
+    mock_repo.get_recipe_cards_by_ids.assert_called_once_with([first, second])
+    assert CursorCodec.decode(result['nextCursor'], float, UUID) == (score / 2, second)
+    assert result['items'][0]['trendingScore'] == pytest.approx(1.0, abs=0.01)
+
+
+def test_get_trending_recipes_from_cache_after_cursor(app, recipe_service, mock_repo, mock_trending_repo,
+                                                      mock_trending_cache):
+    from backend.pagination.cursor import CursorCodec
+
+    recipe_id = uuid4()
+    mock_trending_cache.get_page.return_value = [(recipe_id, 1.5)]
+    mock_repo.get_recipe_cards_by_ids.return_value = []
+    cursor = CursorCodec.encode(4.0, recipe_id)
+
+    with app.app_context():
+        result = recipe_service.get_trending_recipes(per_page=2, cursor=cursor)
+
+    mock_trending_cache.get_page.assert_called_once_with(3, (4.0, recipe_id))
+    mock_trending_repo.get_page.assert_not_called()
+    assert result['nextCursor'] is None
+    assert result['hasNext'] is False
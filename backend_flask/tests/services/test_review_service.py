@@ -1,10 +1,11 @@
+from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
 from backend.exceptions import AlreadyExists
-from backend.models import Reviews
+from backend.models import Recipe, Reviews
 
 
 @patch('backend.service.review_service.get_jwt_identity')
@@ -45,4 +46,110 @@ def test_create_review_success(mock_get_jwt_identity, review_service, mock_repo)
 
     result = review_service.create_review({'recipe_id': uuid4(), 'rating': 5, 'comment': 'Nice'})
     assert result is not None
-    mock_repo.create.assert_called_once()
\ No newline at end of file
+    mock_repo.create.assert_called_once()
+
+def test_approve_review_updates_stats(app, review_service, mock_repo, mock_stats_repo, mock_list_cache,
+                                      mock_revision_repo, mock_trending_repo, mock_trending_cache):
+    pending_status_id, approved_status_id = uuid4(), uuid4()
+    recipe = Recipe(title='Soup', description='Desc', duration=10, servings_count=1, author_id=uuid4())
+    review = Reviews(recipe=recipe, recipe_id=uuid4(), rating=4, status_id=pending_status_id,
+                     created_at=datetime(2026, 1, 1))
+    review.id = uuid4()
+    mock_repo.get_by_id.return_value = review
+    mock_repo.get_approve_status_id.return_value = approved_status_id
+    mock_trending_repo.get_score.return_value = 0.8
+
+    with app.app_context():
+        review_service.approve_review(review.id)
+
+    assert review.status_id == approved_status_id
+    mock_stats_repo.apply_review_delta.assert_called_once_with(review.recipe_id, 1, 4)
+    mock_repo.update.assert_called_once_with(review)
+    mock_list_cache.invalidate.assert_called_once_with({'all', f'author:{recipe.author_id}'})
+    mock_revision_repo.bump.assert_called_once_with(f'recipe-reviews:{review.recipe_id}')
+    mock_trending_repo.add.assert_called_once_with(review.recipe_id, 0.8)
+    mock_trending_cache.set_score.assert_called_once_with(review.recipe_id, 0.8)
+
+
+def test_approve_already_approved_review_is_noop(review_service, mock_repo, mock_stats_repo):
+    approved_status_id = uuid4()
+    review = Reviews(recipe_id=uuid4(), rating=4, status_id=approved_status_id)
+    mock_repo.get_by_id.return_value = review
+    mock_repo.get_approve_status_id.return_value = approved_status_id
+
+    review_service.approve_review(uuid4())
+
+    mock_stats_repo.apply_review_delta.assert_not_called()
+    mock_repo.update.assert_not_called()
+
+
+@patch('backend.service.review_service.get_jwt_identity')
+@patch('backend.service.review_service.get_jwt')
+def test_delete_approved_review_updates_stats(mock_get_jwt, mock_get_jwt_identity, app, review_service,
+                                              mock_repo, mock_stats_repo, mock_trending_repo, mock_trending_cache):
+    approved_status_id = uuid4()
+    review = Reviews(user_id=uuid4(), recipe_id=uuid4(), rating=3, status_id=approved_status_id,
+                     created_at=datetime(2026, 1, 1))
+    mock_repo.get_by_id.return_value = review
+    mock_repo.get_approve_status_id.return_value = approved_status_id
+    mock_get_jwt_identity.return_value = review.user_id
+    mock_get_jwt.return_value = {'role': 'User'}
+
+    with app.app_context():
+        review_service.delete_review(uuid4())
+
+    mock_stats_repo.apply_review_delta.assert_called_once_with(review.recipe_id, -1, -3)
+    mock_repo.delete.assert_called_once_with(review)
+    mock_trending_repo.add.assert_called_once_with(review.recipe_id, -0.6)
+    mock_trending_cache.set_score.assert_called_once_with(review.recipe_id, 0.0)
+
+
+@patch('backend.service.review_service.get_jwt_identity')
+def test_update_approved_review_rating_updates_stats(mock_get_jwt_identity, app, review_service,
+                                                     mock_repo, mock_stats_repo):
+    approved_status_id = uuid4()
+    review = Reviews(user_id=uuid4(), recipe_id=uuid4(), rating=2, comment='Ok', status_id=approved_status_id,
+                     created_at=datetime(2026, 1, 1))
+    mock_repo.get_by_id.return_value = review
+    mock_repo.get_approve_status_id.return_value = approved_status_id
+    mock_get_jwt_identity.return_value = review.user_id
+
+    with app.app_context():
+        review_service.update_review(uuid4(), {'rating': 5})
+
+    mock_stats_repo.apply_review_delta.assert_called_once_with(review.recipe_id, 0, 3)
+
+
+def test_moderate_reviews_applies_decisions_in_one_pass(app, review_service, mock_repo, mock_stats_repo,
+                                                        mock_list_cache, mock_revision_repo, mock_trending_repo,
+                                                        mock_trending_cache):
+    pending_status_id, approved_status_id = uuid4(), uuid4()
+    recipe = Recipe(title='Soup', description='Desc', duration=10, servings_count=1, author_id=uuid4())
+    recipe_id = uuid4()
+    pending, spam, approved = (
+        Reviews(id=uuid4(), recipe=recipe, recipe_id=recipe_id, rating=rating, status_id=status_id,
+                created_at=datetime(2026, 1, 1))
+        for rating, status_id in ((4, pending_status_id), (1, pending_status_id), (5, approved_status_id))
+    )
+    missing_id = uuid4()
+    mock_repo.get_approve_status_id.return_value = approved_status_id
+    mock_repo.get_for_moderation.return_value = [pending, spam, approved]
+    mock_trending_repo.get_scores.return_value = {recipe_id: 0.8}
+
+    decisions = [
+        {'id': pending.id, 'action': 'approve'},
+        {'id': spam.id, 'action': 'reject'},
+        {'id': approved.id, 'action': 'approve'},
+        {'id': missing_id, 'action': 'reject'},
+    ]
+    with app.app_context():
+        result = review_service.moderate_reviews(decisions)
+
+    assert [item['outcome'] for item in result['items']] == ['approved', 'rejected', 'unchanged', 'not_found']
+    mock_repo.moderate.assert_called_once_with([pending.id], [spam.id], approved_status_id)
+    mock_stats_repo.recompute.assert_called_once_with({recipe_id})
+    mock_revision_repo.bump.assert_called_once_with(f'recipe-reviews:{recipe_id}')
+    assert mock_trending_repo.add_many.call_args.args[0] == {recipe_id: pytest.approx(0.8)}
+    mock_repo.commit.assert_called_once()
+    mock_list_cache.invalidate.assert_called_once_with({'all', f'author:{recipe.author_id}'})
+    mock_trending_cache.set_score.assert_called_once_with(recipe_id, 0.8)
@@ -4,4 +4,11 @@ from backend.config import Config
 class TestConfig(Config):
     SQLALCHEMY_DATABASE_URI = 'sqlite:///database.db'
     TESTING = True
-    DEBUG = False
\ No newline at end of file
+    DEBUG = False
+    PAGINATION_COUNT_CACHE_TTL = 0
+    INGREDIENT_INDEX_TTL = 0
+    INGREDIENT_INDEX_BUILD_ON_STARTUP = False
+    SIMILAR_RECIPE_INDEX_TTL = 0
+    AUTOCOMPLETE_INDEX_TTL = 0
+    RECIPE_LIST_CACHE_TTL = 0
+    TRENDING_CACHE_TTL = 0